@@ -2,6 +2,7 @@
 # combat/btn/_btn_draw.py
 # ============================================================
 import pygame
+from systems import surface_pool
 
 def draw_icon_button(screen: pygame.Surface, icon: pygame.Surface | None, rect: pygame.Rect, *, hover_alpha: int = 70):
     """Icon-only button with a subtle hover glow, no border."""
@@ -12,6 +13,4 @@ def draw_icon_button(screen: pygame.Surface, icon: pygame.Surface | None, rect:
 
     mx, my = pygame.mouse.get_pos()
     if rect.collidepoint(mx, my):
-        glow = pygame.Surface(rect.size, pygame.SRCALPHA)
-        glow.fill((255, 255, 255, hover_alpha))
-        screen.blit(glow, rect.topleft)
\ No newline at end of file
+        surface_pool.dim(screen, hover_alpha, (255, 255, 255), rect)
\ No newline at end of file
@@ -8,6 +8,7 @@ import pygame
 from ._btn_layout import rect_at, load_scaled
 from ._btn_draw import draw_icon_button
 from systems import audio as audio_sys
+from systems import surface_pool
 import re
 
 # ---------------- Use callback ----------------
@@ -442,7 +443,7 @@ def _draw_inventory_on_popup(screen: pygame.Surface, popup_rect: pygame.Rect, fa
     _LAST_ITEMS = items[:]  # keep aligned with rects we build below
     _ITEM_RECTS = []
 
-    layer = pygame.Surface((vw, vh), pygame.SRCALPHA)
+    layer = surface_pool.scratch((vw, vh), tag="bag.rows")
     name_font = _font(30, bold=False)
     qty_font  = _font(30, bold=False)
     ink       = (232, 220, 180)
@@ -482,9 +483,7 @@ def _draw_inventory_on_popup(screen: pygame.Surface, popup_rect: pygame.Rect, fa
 
             # hover highlight
             if row_rect.collidepoint(local_mouse):
-                hover = pygame.Surface((row_rect.w, row_rect.h), pygame.SRCALPHA)
-                hover.fill((255, 255, 255, 22))
-                layer.blit(hover, row_rect.topleft)
+                surface_pool.dim(layer, 22, (255, 255, 255), row_rect)
 
             # tiny icon frame
             frame = pygame.Rect(row_rect.x, row_rect.y + (_ROW_H - _ICON_SZ)//2, _ICON_SZ, _ICON_SZ)
@@ -535,9 +534,7 @@ def draw_popup(screen: pygame.Surface, gs):
     a = 1.0 if _FADE_T0 <= 0 else min(1.0, max(0.0, (_LAST_DRAW_TICKS - _FADE_T0) / max(1, int(_FADE_DUR * 1000))))
 
     # dim layer
-    dim = pygame.Surface((sw, sh), pygame.SRCALPHA)
-    dim.fill((0, 0, 0, int(180 * a)))
-    screen.blit(dim, (0, 0))
+    surface_pool.dim(screen, int(180 * a))
 
     popup = _scaled_bag(sw, sh)
     if popup is None:
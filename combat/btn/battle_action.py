@@ -10,6 +10,7 @@ import pygame
 from ._btn_layout import rect_at, load_scaled
 from ._btn_draw import draw_icon_button
 from systems import audio as audio_sys
+from systems import surface_pool
 from combat import moves
 
 # ------------- Button assets -------------
@@ -284,9 +285,7 @@ def _draw_row(surface: pygame.Surface, rect: pygame.Rect, *, title: str,
               name_font, sub_font):
     # highlight strip
     if highlight or selected:
-        hi = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
-        hi.fill((0, 0, 0, 56 if selected else 28))
-        surface.blit(hi, rect.topleft)
+        surface_pool.dim(surface, 56 if selected else 28, rect=rect)
 
     # arrow pointer
     left_offset = 12
@@ -12,6 +12,7 @@ import settings as S
 from ._btn_layout import rect_at, load_scaled
 from ._btn_draw import draw_icon_button
 from systems import audio as audio_sys   # ✅ use audio system
+from systems import fonts, surface_pool
 
 # ---------- Button (bottom-left of the 2x2 grid) ----------
 _ICON = None
@@ -299,12 +300,8 @@ def draw_popup(screen: pygame.Surface, gs):
     sw, sh = screen.get_width(), screen.get_height()
 
     # === draw everything to a transparent LAYER so we can fade it in ===
-    layer = pygame.Surface((sw, sh), pygame.SRCALPHA)
-
-    # Dim background slightly (to layer)
-    dim = pygame.Surface((sw, sh), pygame.SRCALPHA)
-    dim.fill((0, 0, 0, 140))
-    layer.blit(dim, (0, 0))
+    # (starts dimmed: the background dim is the layer's clear colour)
+    layer = surface_pool.scratch((sw, sh), tag="party_action.layer", fill=(0, 0, 0, 140))
 
     # Parchment
     sr = _scroll_rect(sw, sh)
@@ -327,8 +324,8 @@ def draw_popup(screen: pygame.Surface, gs):
     x_shift = int(inner.w * 0.12)
 
     # Fonts & colors
-    name_f  = pygame.font.SysFont("georgia", max(18, int(sr.h * 0.035)), bold=True)
-    small_f = pygame.font.SysFont("georgia", max(14, int(sr.h * 0.028)))
+    name_f  = fonts.get("georgia", max(18, int(sr.h * 0.035)), bold=True)
+    small_f = fonts.get("georgia", max(14, int(sr.h * 0.028)))
     ink        = (48, 34, 22)
     ink_soft   = (92, 72, 52)
     hp_back    = (62, 28, 24)
@@ -360,7 +357,7 @@ def draw_popup(screen: pygame.Surface, gs):
 
             text_x = icon_rect.right + int(sr.w * 0.02)
             label      = f"{clean}   Lv {lvl}"
-            label_surf = name_f.render(label, True, ink)
+            label_surf = fonts.render(name_f, label, ink)
             name_y     = r.y + int(ROW_H * 0.10)
 
             # HP
@@ -394,7 +391,7 @@ def draw_popup(screen: pygame.Surface, gs):
                 pygame.draw.rect(layer, hp_fill, fill, border_radius=6)
 
             # HP text to the right of the bar
-            hp_s = small_f.render(f"HP {hp}/{maxhp}", True, ink)
+            hp_s = fonts.render(small_f, f"HP {hp}/{maxhp}", ink)
             layer.blit(hp_s, (bar_r.right + 10, bar_r.y - 2))
 
             # register invisible click target + which slot it is (alive only)
@@ -406,23 +403,21 @@ def draw_popup(screen: pygame.Surface, gs):
             if dead:
                 dim = _get_hover_glow((r.w, r.h), 80)
                 layer.blit(dim, r.topleft)
-                faint = small_f.render("Fainted", True, (110, 90, 90))
+                faint = fonts.render(small_f, "Fainted", (110, 90, 90))
                 layer.blit(faint, (bar_r.right + 10, bar_r.y - 2))
 
         # next row
         y += ROW_H + ROW_GAP
 
     # Footer (subtle)
-    foot = small_f.render("Press Esc to cancel", True, ink_soft)
+    foot = fonts.render(small_f, "Press Esc to cancel", ink_soft)
     layer.blit(foot, foot.get_rect(midbottom=(sr.centerx, sr.bottom - int(sr.h*0.07))))
 
     # ===== Confirmation modal (on top of parchment) =====
     _CONFIRM_RECTS = {"panel": None, "yes": None, "no": None}
     if _CONFIRM:
         # Slight extra dim over the parchment
-        dim2 = pygame.Surface((sw, sh), pygame.SRCALPHA)
-        dim2.fill((0, 0, 0, 90))
-        layer.blit(dim2, (0, 0))
+        surface_pool.dim(layer, 90)
 
         # Panel size anchored to scroll rect
         pw = int(sr.w * 0.62)
@@ -436,14 +431,14 @@ def draw_popup(screen: pygame.Surface, gs):
         pygame.draw.rect(layer, (90, 70, 40), panel, 3, border_radius=14)
 
         # Text
-        title_f = pygame.font.SysFont("georgia", max(20, int(ph * 0.18)), bold=True)
-        body_f = pygame.font.SysFont("georgia", max(18, int(ph * 0.15)))
+        title_f = fonts.get("georgia", max(20, int(ph * 0.18)), bold=True)
+        body_f = fonts.get("georgia", max(18, int(ph * 0.15)))
         ink = (48, 34, 22)
 
-        title = title_f.render("Confirm Swap", True, ink)
+        title = fonts.render(title_f, "Confirm Swap", ink)
         layer.blit(title, title.get_rect(midtop=(panel.centerx, panel.y + int(ph * 0.10))))
 
-        msg = body_f.render(f"Swap to “{_CONFIRM['name']}”?", True, ink)
+        msg = fonts.render(body_f, f"Swap to “{_CONFIRM['name']}”?", ink)
         layer.blit(msg, msg.get_rect(midtop=(panel.centerx, panel.y + int(ph * 0.34))))
 
         # YES / NO buttons
@@ -472,7 +467,7 @@ def draw_popup(screen: pygame.Surface, gs):
             if hover:
                 glow = _get_hover_glow((rect.w, rect.h), 48)
                 layer.blit(glow, rect.topleft)
-            lab = title_f.render(label, True, ink)
+            lab = fonts.render(title_f, label, ink)
             layer.blit(lab, lab.get_rect(center=rect.center))
 
         # Draw YES / NO with hover glow if under mouse
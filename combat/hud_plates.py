@@ -0,0 +1,149 @@
+# ============================================================
+# combat/hud_plates.py — retained HP / XP plates for battles
+#  - Chrome (frame, borders, name plate, trough, label) is drawn
+#    once per (label, align, size) into "empty" and "full" layers
+#  - The visible plate is recomposed only when the fill width
+#    changes: empty layer + a sub-rect of the full layer
+#  - HP fill eases toward the new ratio over _FILL_ANIM_MS
+#  - XP strip re-renders its label only when cur/need change
+# ============================================================
+from collections import OrderedDict
+import pygame
+from systems import fonts
+
+_MAX_PLATES   = 16
+_FILL_ANIM_MS = 350   # full-bar sweep time; smaller changes are proportionally faster
+
+_plates: "OrderedDict[tuple, object]" = OrderedDict()
+
+
+def _cached(key, make):
+    p = _plates.get(key)
+    if p is None:
+        p = _plates[key] = make()
+        while len(_plates) > _MAX_PLATES:
+            _plates.popitem(last=False)
+    else:
+        _plates.move_to_end(key)
+    return p
+
+
+# ---------- HP plate ----------
+class HpPlate:
+    FRAME, BORDER, GOLD, INNER = (70,45,30), (140,95,60), (185,150,60), (28,18,14)
+    BACK, FRONT, TICK, INK     = (60,24,24), (28,150,60), (30,18,12), (230,210,180)
+
+    def __init__(self, size, name: str, align: str):
+        w, h = size
+        self.size = (w, h)
+        rect = pygame.Rect(0, 0, w, h)
+        inner_rect = rect.inflate(-10, -10)
+        name_h = max(22, int(h*0.44))
+        plate = pygame.Rect(inner_rect.x+8, inner_rect.y+6, inner_rect.w-16, name_h)
+        notch_w = max(38, int(h*0.46))
+        notch = (pygame.Rect(plate.x, plate.y, notch_w, plate.h) if align == "right"
+                 else pygame.Rect(plate.right - notch_w, plate.y, notch_w, plate.h))
+        self.trough = pygame.Rect(inner_rect.x+12, plate.bottom+8, inner_rect.w-24, inner_rect.h-name_h-20)
+
+        base = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(base, self.FRAME, rect, border_radius=10)
+        pygame.draw.rect(base, self.BORDER, rect, 3, border_radius=10)
+        pygame.draw.rect(base, self.GOLD, inner_rect, 2, border_radius=8)
+        pygame.draw.rect(base, self.INNER, plate, border_radius=6)
+        pygame.draw.rect(base, self.GOLD, plate, 2, border_radius=6)
+        pygame.draw.rect(base, self.FRAME, notch, border_radius=6)
+        font = fonts.get("georgia", max(20, int(h*0.32)), bold=True)
+        label = fonts.render(font, name, self.INK)
+        if align == "left":
+            base.blit(label, label.get_rect(midleft=(plate.x+12, plate.centery)))
+        else:
+            base.blit(label, label.get_rect(midright=(plate.right-12, plate.centery)))
+
+        self.empty = base.copy()
+        pygame.draw.rect(self.empty, self.BACK, self.trough, border_radius=6)
+        self.full = base
+        pygame.draw.rect(self.full, self.FRONT, self.trough, border_radius=6)
+        for layer in (self.empty, self.full):
+            for i in range(1, 4):
+                tx = self.trough.x + (self.trough.w * i)//4
+                pygame.draw.line(layer, self.TICK, (tx, self.trough.y+3), (tx, self.trough.bottom-3), 2)
+
+        self.out = pygame.Surface((w, h), pygame.SRCALPHA)
+        self.shown = None      # eased ratio on screen
+        self.fill_w = -1       # fill width currently composed into `out`
+        self.last_ms = 0
+
+    def _ease(self, target: float) -> float:
+        now = pygame.time.get_ticks()
+        if self.shown is None:
+            self.shown = target
+        elif self.shown != target:
+            step = max(0, now - self.last_ms) / float(_FILL_ANIM_MS)
+            if abs(target - self.shown) <= step:
+                self.shown = target
+            else:
+                self.shown += step if target > self.shown else -step
+        self.last_ms = now
+        return self.shown
+
+    def draw(self, surface: pygame.Surface, pos, ratio: float):
+        fw = int(self.trough.w * self._ease(max(0.0, min(1.0, ratio))))
+        if fw != self.fill_w:
+            self.out.fill((0, 0, 0, 0))
+            self.out.blit(self.empty, (0, 0))
+            if fw > 0:
+                self.out.blit(self.full, self.trough.topleft, area=pygame.Rect(self.trough.x, self.trough.y, fw, self.trough.h))
+            self.fill_w = fw
+        surface.blit(self.out, pos)
+
+
+# ---------- XP strip ----------
+class XpStrip:
+    FRAME, BORDER, TROUGH, FILL, INK = (70,45,30), (140,95,60), (46,40,36), (40,180,90), (230,220,200)
+
+    def __init__(self, size):
+        w, h = size
+        rect = pygame.Rect(0, 0, w, h)
+        inner = rect.inflate(-8, -8)
+        self.inner = inner
+        self.font = fonts.get("georgia", max(14, int(h*0.60)))
+        bar_h = max(4, int(inner.h*0.36)); bar_w = max(90, int(inner.w*0.46))
+        self.bar = pygame.Rect(inner.right - bar_w - 6, inner.centery - bar_h//2, bar_w, bar_h)
+
+        self.empty = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(self.empty, self.FRAME, rect, border_radius=6)
+        pygame.draw.rect(self.empty, self.BORDER, rect, 2, border_radius=6)
+        self.full = self.empty.copy()
+        pygame.draw.rect(self.empty, self.TROUGH, self.bar, border_radius=3)
+        pygame.draw.rect(self.full, self.FILL, self.bar, border_radius=3)
+
+        self.out = pygame.Surface((w, h), pygame.SRCALPHA)
+        self.state = None      # (cur, need, fill width) composed into `out`
+
+    def draw(self, surface: pygame.Surface, pos, cur: int, need: int, ratio: float):
+        fw = int(self.bar.w * max(0.0, min(1.0, ratio)))
+        state = (cur, need, fw)
+        if state != self.state:
+            self.out.fill((0, 0, 0, 0))
+            self.out.blit(self.empty, (0, 0))
+            if fw > 0:
+                self.out.blit(self.full, self.bar.topleft, area=pygame.Rect(self.bar.x, self.bar.y, fw, self.bar.h))
+            label = fonts.render(self.font, f"XP: {cur} / {need}", self.INK)
+            self.out.blit(label, label.get_rect(midleft=(self.inner.x+6, self.inner.centery)))
+            self.state = state
+        surface.blit(self.out, pos)
+
+
+# ===================== Public API ===========================
+def draw_hp_plate(surface: pygame.Surface, rect: pygame.Rect, hp_ratio: float, name: str, align: str):
+    rect = pygame.Rect(rect)
+    plate = _cached(("hp", name, align, rect.size), lambda: HpPlate(rect.size, name, align))
+    plate.draw(surface, rect.topleft, hp_ratio)
+
+def draw_xp_strip(surface: pygame.Surface, rect: pygame.Rect, cur: int, need: int, ratio: float):
+    rect = pygame.Rect(rect)
+    strip = _cached(("xp", rect.size), lambda: XpStrip(rect.size))
+    strip.draw(surface, rect.topleft, cur, need, ratio)
+
+def clear():
+    _plates.clear()
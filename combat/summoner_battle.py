@@ -31,6 +31,7 @@ import settings as S
 
 from systems import audio as audio_sys
 from systems import xp as xp_sys
+from systems import asset_cache, asset_index, scale_cache, fonts, surface_pool
 from combat.btn import battle_action, bag_action, party_action
 from rolling import ui as roll_ui
 from rolling.roller import set_roll_callback
@@ -39,6 +40,7 @@ from systems.asset_links import token_to_vessel, find_image
 from combat.helpers import _enemy_party_has_living, _trigger_forced_switch_if_needed
 
 from combat import moves
+from combat import hud_plates
 from combat import turn_order
 from combat import enemy_ai
 
@@ -87,25 +89,10 @@ def _find_dh_font() -> str | None:
     return _DH_FONT_PATH
 
 def _dh_font(size: int):
-    try:
-        p = _find_dh_font()
-        if p:
-            return pygame.font.Font(p, size)
-    except Exception:
-        pass
-    return pygame.font.Font(None, size)
+    return fonts.get(_find_dh_font(), size)
 
 def _wrap_text(text: str, font: pygame.font.Font, max_w: int) -> list[str]:
-    words = text.split()
-    out, cur = [], ""
-    for w in words:
-        test = (cur + " " + w).strip()
-        if not cur or font.size(test)[0] <= max_w:
-            cur = test
-        else:
-            out.append(cur); cur = w
-    if cur: out.append(cur)
-    return out
+    return fonts.wrap(text, font, max_w)
 
 def _draw_gen1_box(surface: pygame.Surface, rect: pygame.Rect):
     pygame.draw.rect(surface, (245, 245, 245), rect)
@@ -133,7 +120,7 @@ def _draw_intro_textbox(screen: pygame.Surface, text: str, show_prompt: bool):
     lines = _wrap_text(text, font, text_rect.w)
     y = text_rect.y
     for ln in lines[:3]:
-        surf = font.render(ln, False, (16, 16, 16))  # no AA for crisper look
+        surf = fonts.render(font, ln, (16, 16, 16), antialias=False)  # no AA for crisper look
         screen.blit(surf, (text_rect.x, y))
         y += surf.get_height() + 6
     if show_prompt:
@@ -161,13 +148,19 @@ def _extract_summoner_display(raw: str | None) -> str:
     return f"Summoner {pretty}" if pretty else "Summoner"
 
 #---------- Loading scrolls ----------------
+_SCROLL_ICONS = None
+
 def _load_scroll_icon():
+    global _SCROLL_ICONS
     scroll_path = os.path.join("Assets", "Items", "Scroll_Of_Sealing.png")
-    scroll_icon = pygame.image.load(scroll_path).convert_alpha()
+    scroll_icon = asset_cache.load_image(scroll_path)
+    if _SCROLL_ICONS is not None and _SCROLL_ICONS[0] is scroll_icon:
+        return _SCROLL_ICONS
     grey_scroll_icon = pygame.Surface(scroll_icon.get_size(), pygame.SRCALPHA)
     grey_scroll_icon.fill((100, 100, 100, 128))  # Grey out the icon
     grey_scroll_icon.blit(scroll_icon, (0, 0))
-    return scroll_icon, grey_scroll_icon
+    _SCROLL_ICONS = (scroll_icon, grey_scroll_icon)   # built once; stable for scale_cache
+    return _SCROLL_ICONS
 
 # ---------- Exit helper ----------
 def _exit_to_overworld(gs):
@@ -231,11 +224,7 @@ def _parse_enemy_hp_fields(estats: dict) -> tuple[int, int]:
     return cur_hp, max_hp
 
 # ---------- Sprite helpers ----------
-def _try_load(path: str | None):
-    if path and os.path.exists(path):
-        try: return pygame.image.load(path).convert_alpha()
-        except Exception as e: print(f"⚠️ load fail {path}: {e}")
-    return None
+_try_load = asset_cache.load_image
 
 def _smooth_scale_to_height(surf: pygame.Surface | None, target_h: int) -> pygame.Surface | None:
     if surf is None or target_h <= 0: return surf
@@ -280,11 +269,7 @@ def _asset_path_for_vessel_png(vessel_png: str | None) -> str | None:
     """Find exact vessel file (keeps gender/index)."""
     if not vessel_png:
         return None
-    for d in ("Assets/VesselsFemale", "Assets/VesselsMale", "Assets/RareVessels"):
-        p = os.path.join(d, vessel_png)
-        if os.path.exists(p):
-            return p
-    return None
+    return asset_index.find(vessel_png, ("Assets/VesselsFemale", "Assets/VesselsMale", "Assets/RareVessels"))
 
 def _load_vessel_big(name_or_token: str | None, *, target_h: int) -> pygame.Surface | None:
     """
@@ -310,12 +295,8 @@ def _load_vessel_big(name_or_token: str | None, *, target_h: int) -> pygame.Surf
     if not path:
         print(f"⚠️ Vessel image not found: {vessel_png}")
         return None
-    try:
-        img = pygame.image.load(path).convert_alpha()
-        return _smooth_scale_to_height(img, target_h)
-    except Exception as e:
-        print(f"⚠️ load vessel fail {path}: {e}")
-        return None
+    img = _try_load(path)
+    return _smooth_scale_to_height(img, target_h) if img else None
     
 
 def _trigger_forced_enemy_switch_if_needed(gs, st):
@@ -423,16 +404,11 @@ def _summon_ally_sprite_from_active(gs, target_h: int) -> pygame.Surface | None:
         vessel_png = None
     if not vessel_png:
         return None
-    path = find_image(vessel_png)
-    if not path or not os.path.exists(path):
-        path = _asset_path_for_vessel_png(vessel_png)
-    if not path or not os.path.exists(path):
-        return None
-    try:
-        surf = pygame.image.load(path).convert_alpha()
-        return _smooth_scale_to_height(surf, target_h)
-    except Exception:
+    path = find_image(vessel_png) or _asset_path_for_vessel_png(vessel_png)
+    if not path:
         return None
+    surf = _try_load(path)
+    return _smooth_scale_to_height(surf, target_h) if surf else None
 
 # ---------- SFX / VFX loaders ----------
 def _load_swirl_frames():
@@ -444,9 +420,8 @@ def _load_swirl_frames():
             import re as _re
             m = _re.search(r"(\d+)(?!.*\d)", os.path.basename(p))
             return (int(m.group(1)) if m else -1, p.lower())
-        for p in sorted(set(paths), key=key):
-            try: frames.append(pygame.image.load(p).convert_alpha())
-            except Exception as e: print(f"⚠️ VFX load fail: {p} -> {e}")
+        ordered = sorted(set(paths), key=key)
+        frames.extend(img for img in asset_cache.load_many(ordered) if img)
 
     try:
         fx_candidates = []
@@ -492,61 +467,11 @@ def _xp_compute(stats: dict) -> tuple[int, int, int, float]:
     return lvl, cur, need, max(0.0, min(1.0, cur/need))
 
 def _draw_hp_bar(surface: pygame.Surface, rect: pygame.Rect, hp_ratio: float, name: str, align: str):
-    hp_ratio = max(0.0, min(1.0, hp_ratio))
-    x, y, w, h = rect
-    frame, border, gold, inner = (70,45,30), (140,95,60), (185,150,60), (28,18,14)
-    back, front = (60,24,24), (28,150,60)
-
-    pygame.draw.rect(surface, frame, rect, border_radius=10)
-    pygame.draw.rect(surface, border, rect, 3, border_radius=10)
-
-    inner_rect = rect.inflate(-10, -10)
-    pygame.draw.rect(surface, gold, inner_rect, 2, border_radius=8)
-
-    name_h = max(22, int(h*0.44))
-    plate = pygame.Rect(inner_rect.x+8, inner_rect.y+6, inner_rect.w-16, name_h)
-    notch_w = max(38, int(h*0.46))
-    notch = (pygame.Rect(plate.x, plate.y, notch_w, plate.h) if align=="right"
-             else pygame.Rect(plate.right - notch_w, plate.y, notch_w, plate.h))
-
-    pygame.draw.rect(surface, inner, plate, border_radius=6)
-    pygame.draw.rect(surface, gold, plate, 2, border_radius=6)
-    pygame.draw.rect(surface, frame, notch, border_radius=6)
-
-    trough = pygame.Rect(inner_rect.x+12, plate.bottom+8, inner_rect.w-24, inner_rect.h-name_h-20)
-    pygame.draw.rect(surface, back, trough, border_radius=6)
-
-    fw = int(trough.w * hp_ratio)
-    if fw > 0:
-        pygame.draw.rect(surface, front, (trough.x, trough.y, fw, trough.h), border_radius=6)
-
-    for i in range(1,4):
-        tx = trough.x + (trough.w * i)//4
-        pygame.draw.line(surface, (30,18,12), (tx, trough.y+3), (tx, trough.bottom-3), 2)
-
-    font = pygame.font.SysFont("georgia", max(20, int(h*0.32)), bold=True)
-    label = font.render(name, True, (230,210,180))
-    if align == "left":
-        surface.blit(label, label.get_rect(midleft=(plate.x+12, plate.centery)))
-    else:
-        surface.blit(label, label.get_rect(midright=(plate.right-12, plate.centery)))
-
+    hud_plates.draw_hp_plate(surface, rect, hp_ratio, name, align)
 
 def _draw_xp_strip(surface: pygame.Surface, rect: pygame.Rect, stats: dict):
     _, cur, need, r = _xp_compute(stats)
-    frame=(70,45,30); border=(140,95,60); trough=(46,40,36); fill=(40,180,90); text=(230,220,200)
-    pygame.draw.rect(surface, frame, rect, border_radius=6)
-    pygame.draw.rect(surface, border, rect, 2, border_radius=6)
-    inner = rect.inflate(-8,-8)
-    font = pygame.font.SysFont("georgia", max(14, int(rect.h*0.60)), bold=False)
-    label = font.render(f"XP: {cur} / {need}", True, text)
-    surface.blit(label, label.get_rect(midleft=(inner.x+6, inner.centery)))
-    bar_h = max(4, int(inner.h*0.36)); bar_w = max(90, int(inner.w*0.46))
-    bar_x = inner.right - bar_w - 6; bar_y = inner.centery - bar_h//2
-    pygame.draw.rect(surface, trough, (bar_x, bar_y, bar_w, bar_h), border_radius=3)
-    fw = int(bar_w * r)
-    if fw > 0:
-        pygame.draw.rect(surface, fill, (bar_x, bar_y, fw, bar_h), border_radius=3)
+    hud_plates.draw_xp_strip(surface, rect, cur, need, r)
 
 # ---------- Active party / swap helpers ----------
 def _first_filled_slot_index(gs) -> int:
@@ -606,6 +531,7 @@ def _show_result_screen(st: dict, title: str, subtitle: str, *,
         "auto_ready": False,
         "lock_input": bool(lock_input),
     }
+    st["result"]["card"] = _render_result_card(st["result"])
 
 def _dismiss_result(st: dict, *, allow_exit: bool = True):
     res = st.get("result")
@@ -624,6 +550,27 @@ def _auto_dismiss_result_if_ready(st: dict):
         if exit_on_close:
             st["pending_exit"] = True
 
+def _render_result_card(res: dict) -> pygame.Surface:
+    """Card, title, subtitle and hint at full opacity; draw only fades + blits it."""
+    card_w, card_h = RESULT_CARD_W, RESULT_CARD_H
+    card = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
+    pygame.draw.rect(card, (245, 245, 245, 245), card.get_rect(), border_radius=14)
+    pygame.draw.rect(card, (0, 0, 0, 255), card.get_rect(), 4, border_radius=14)
+    pygame.draw.rect(card, (60, 60, 60, 255), card.get_rect().inflate(-10, -10), 2, border_radius=10)
+
+    big = fonts.get("georgia", 40, bold=True)
+    mid = fonts.get("georgia", 24)
+    t_surf = fonts.render(big, res.get("title",""), (20, 20, 20))
+    s_surf = fonts.render(mid, res.get("subtitle",""), (45, 45, 45))
+    card.blit(t_surf, t_surf.get_rect(center=(card_w//2, card_h//2 - 22)))
+    card.blit(s_surf, s_surf.get_rect(center=(card_w//2, card_h//2 + 24)))
+
+    if res.get("auto_ms", 0) <= 0 and not res.get("lock_input", False):
+        hint = fonts.render(fonts.get("arial", 18), "Click to continue", (70, 70, 70))
+        card.blit(hint, hint.get_rect(midbottom=(card_w//2, card_h - 14)))
+
+    return card
+
 def _draw_result_screen(screen: pygame.Surface, st: dict, dt: float):
     res = st.get("result")
     if not res: return
@@ -642,28 +589,12 @@ def _draw_result_screen(screen: pygame.Surface, st: dict, dt: float):
         res["played"] = True
 
     sw, sh = screen.get_size()
-    dim = pygame.Surface((sw, sh), pygame.SRCALPHA); dim.fill((0, 0, 0, min(160, a)))
-    screen.blit(dim, (0, 0))
-
-    card_w, card_h = RESULT_CARD_W, RESULT_CARD_H
-    card = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
-    pygame.draw.rect(card, (245, 245, 245, min(245, a)), card.get_rect(), border_radius=14)
-    pygame.draw.rect(card, (0, 0, 0, min(255, a)), card.get_rect(), 4, border_radius=14)
-    pygame.draw.rect(card, (60, 60, 60, min(255, a)), card.get_rect().inflate(-10, -10), 2, border_radius=10)
-
-    big = pygame.font.SysFont("georgia", 40, bold=True)
-    mid = pygame.font.SysFont("georgia", 24, bold=False)
-    t_surf = big.render(res.get("title",""), True, (20, 20, 20))
-    s_surf = mid.render(res.get("subtitle",""), True, (45, 45, 45))
-    card.blit(t_surf, t_surf.get_rect(center=(card_w//2, card_h//2 - 22)))
-    card.blit(s_surf, s_surf.get_rect(center=(card_w//2, card_h//2 + 24)))
-
-    if res.get("auto_ms", 0) <= 0 and not res.get("lock_input", False):
-        hint = pygame.font.SysFont("arial", 18, bold=False).render(
-            "Click to continue", True, (70, 70, 70)
-        )
-        card.blit(hint, hint.get_rect(midbottom=(card_w//2, card_h - 14)))
+    surface_pool.dim(screen, min(160, a))
 
+    card = res.get("card")
+    if card is None:  # results posted directly (moves/helpers) skip _show_result_screen
+        card = res["card"] = _render_result_card(res)
+    card.set_alpha(a)
     screen.blit(card, card.get_rect(center=(sw//2, int(sh*0.52))))
 
     auto_ms = res.get("auto_ms", 0)
@@ -748,13 +679,10 @@ def enter(gs, **_):
     # Background
     bg_img = None
     for cand in ("Wild.png", "Trainer.png"):
-        p = os.path.join("Assets", "Map", cand)
-        if os.path.exists(p):
-            try:
-                bg_img = pygame.transform.smoothscale(pygame.image.load(p).convert(), (sw, sh))
-                break
-            except Exception as e:
-                print(f"⚠️ Summoner bg load failed: {e}")
+        src = asset_cache.load_image(os.path.join("Assets", "Map", cand), alpha=False)
+        if src:
+            bg_img = pygame.transform.smoothscale(src, (sw, sh))
+            break
 
     # Party & VFX assets
     party_stats = getattr(gs, "party_vessel_stats", None) or [None]*6
@@ -1180,7 +1108,7 @@ def draw(screen: pygame.Surface, gs, dt, **_):
             target = int(max(TARGET_ALLY_H, TARGET_ENEMY_H) * 1.15)
             sw_, sh_ = swirl_raw.get_width(), swirl_raw.get_height()
             s = target / max(1, max(sw_, sh_))
-            swirl = pygame.transform.smoothscale(swirl_raw, (max(1, int(sw_*s)), max(1, int(sh_*s))))
+            swirl = scale_cache.scaled(swirl_raw, (int(sw_*s), int(sh_*s)))
             ax1, ay1 = st["ally_anchor"]; ex1, ey1 = st["enemy_anchor"]
             ally_center  = (ax1 + (st.get("ally_img").get_width()//2  if st.get("ally_img")  else 160),
                             ay1 + (st.get("ally_img").get_height()//2 if st.get("ally_img") else 120))
@@ -1328,8 +1256,8 @@ def draw(screen: pygame.Surface, gs, dt, **_):
     scroll_icon, grey_scroll_icon = _load_scroll_icon()
 
     # Scale the icons to ensure they fit consistently within the UI
-    scaled_scroll_icon = pygame.transform.smoothscale(scroll_icon, (50, 50))  # Resize to 50x50
-    scaled_grey_scroll_icon = pygame.transform.smoothscale(grey_scroll_icon, (50, 50))  # Resize to 50x50
+    scaled_scroll_icon = scale_cache.scaled(scroll_icon, (50, 50))  # Resize to 50x50
+    scaled_grey_scroll_icon = scale_cache.scaled(grey_scroll_icon, (50, 50))  # Resize to 50x50
 
     # Check if the enemy HP bar is visible and we are not in the intro or VFX phase
     phase = st.get("phase", "intro")
@@ -1378,15 +1306,17 @@ def draw(screen: pygame.Surface, gs, dt, **_):
                 try:
                     vessel_png = token_to_vessel(os.path.splitext(os.path.basename(ally_token_name))[0])
                     path = find_image(vessel_png)
-                    if path and os.path.exists(path):
-                        st["ally_img"] = _smooth_scale_to_height(pygame.image.load(path).convert_alpha(), TARGET_ALLY_H)
+                    img = _try_load(path)
+                    if img:
+                        st["ally_img"] = _smooth_scale_to_height(img, TARGET_ALLY_H)
                 except Exception: pass
         elif st["ally_from_slot"] != active_i and ally_token_name and not st.get("swap_playing", False):
             try:
                 vessel_png = token_to_vessel(os.path.splitext(os.path.basename(ally_token_name))[0])
                 path = find_image(vessel_png)
-                if path and os.path.exists(path):
-                    st["ally_img_next"] = _smooth_scale_to_height(pygame.image.load(path).convert_alpha(), TARGET_ALLY_H)
+                img = _try_load(path)
+                if img:
+                    st["ally_img_next"] = _smooth_scale_to_height(img, TARGET_ALLY_H)
                     st["ally_swap_target_slot"] = active_i
                     st["swap_playing"] = True
                     st["swap_t"] = 0.0
@@ -1422,7 +1352,7 @@ def draw(screen: pygame.Surface, gs, dt, **_):
                 target = int(max(aw, ah) * 1.15)
                 sw_, sh_ = swirl_raw.get_width(), swirl_raw.get_height()
                 s = target / max(1, max(sw_, sh_))
-                swirl = pygame.transform.smoothscale(swirl_raw, (max(1, int(sw_ * s)), max(1, int(sh_ * s))))
+                swirl = scale_cache.scaled(swirl_raw, (int(sw_ * s), int(sh_ * s)))
                 cx = ax + aw // 2; cy = ay + ah // 2
                 screen.blit(swirl, swirl.get_rect(center=(cx, cy)))
                 if st["swap_total"] >= SWIRL_DURATION:
@@ -1457,7 +1387,7 @@ def draw(screen: pygame.Surface, gs, dt, **_):
 
     # Turn indicator overlay (debug)
     if st.get("phase") == "battle":
-        font = pygame.font.SysFont("georgia", 22, bold=True)
+        font = fonts.get("georgia", 22, bold=True)
         text = f"Phase: {st.get('turn_phase','?')}  Ready:{getattr(gs,'_turn_ready',True)}  ForceSwitch:{st.get('force_switch', False)}"
         surf = font.render(text, True, (240, 230, 200))
         screen.blit(surf, (12, 12))
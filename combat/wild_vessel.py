@@ -22,6 +22,7 @@ import pygame
 import settings as S
 from systems import audio as audio_sys
 from systems import xp as xp_sys  # ✅ XP system
+from systems import asset_cache, asset_index, scale_cache, fonts, surface_pool
 
 from combat.vessel_stats import generate_vessel_stats_from_asset
 from rolling.roller import set_roll_callback, Roller as StatRoller
@@ -32,6 +33,7 @@ from combat.btn import bag_action, battle_action, party_action
 from combat.capturing import CaptureContext, attempt_capture
 from systems.asset_links import vessel_to_token
 from combat import moves
+from combat import hud_plates
 from combat import turn_order
 from combat import enemy_ai
 
@@ -159,11 +161,7 @@ def _load_sfx(path: str):
         return None
 
 # ---------------- Asset helpers ----------------
-def _try_load(path: str | None):
-    if path and os.path.exists(path):
-        try: return pygame.image.load(path).convert_alpha()
-        except Exception as e: print(f"⚠️ load fail {path}: {e}")
-    return None
+_try_load = asset_cache.load_image
 
 def _smooth_scale(surf: pygame.Surface | None, scale: float) -> pygame.Surface | None:
     if surf is None or abs(scale - 1.0) < 1e-6: return surf
@@ -178,37 +176,39 @@ def _pretty_name_from_token(fname: str | None) -> str:
             base = base[len(p):]; break
     return re.sub(r"\d+$", "", base) or "Ally"
 
+def _asset(sub: str, fname: str) -> str | None:
+    """Indexed path of Assets/<sub>/<fname> (no filesystem probing)."""
+    return asset_index.find(fname, (os.path.join("Assets", sub),))
+
 def _ally_sprite_from_token_name(fname: str | None):
     if not fname: return None
     if fname.startswith("StarterToken"):
-        return _try_load(os.path.join("Assets", "Starters", fname.replace("Token", "")))
+        return _try_load(_asset("Starters", fname.replace("Token", "")))
     if fname.startswith(("FToken", "MToken")):
         gender = "VesselsFemale" if fname[0] == "F" else "VesselsMale"
-        return _try_load(os.path.join("Assets", gender, fname.replace("Token", "Vessel")))
+        return _try_load(_asset(gender, fname.replace("Token", "Vessel")))
     if fname.startswith("RToken"):
         body = os.path.splitext(fname)[0].removeprefix("RToken")
         for p in (
-            os.path.join("Assets", "RareVessels", f"RVessel{body}.png"),
-            os.path.join("Assets", "RareVessels",
-                         f"RVessel{re.match(r'([A-Za-z]+)', body).group(1)}.png")
+            _asset("RareVessels", f"RVessel{body}.png"),
+            _asset("RareVessels", f"RVessel{re.match(r'([A-Za-z]+)', body).group(1)}.png")
             if re.match(r'([A-Za-z]+)', body) else None
         ):
             img = _try_load(p)
             if img: return img
-    for d in ("Starters", "VesselsMale", "VesselsFemale", "RareVessels", "PlayableCharacters"):
-        img = _try_load(os.path.join("Assets", d, fname))
-        if img: return img
-    return None
+    path = asset_index.find(fname, tuple(os.path.join("Assets", d) for d in
+        ("Starters", "VesselsMale", "VesselsFemale", "RareVessels", "PlayableCharacters")))
+    return _try_load(path)
 
 def _enemy_sprite_from_name(name: str | None):
     if not name: return None
-    for d in ("VesselsMale", "VesselsFemale", "RareVessels"):
-        img = _try_load(os.path.join("Assets", d, f"{name}.png"))
-        if img: return img
+    img = _try_load(asset_index.find(f"{name}.png", tuple(os.path.join("Assets", d) for d in
+        ("VesselsMale", "VesselsFemale", "RareVessels"))))
+    if img: return img
     if name and name.startswith("RVessel"):
         m = re.match(r"(RVessel[A-Za-z]+)", name)
         if m:
-            img = _try_load(os.path.join("Assets", "RareVessels", f"{m.group(1)}.png"))
+            img = _try_load(_asset("RareVessels", f"{m.group(1)}.png"))
             if img: return img
     return None
 
@@ -219,9 +219,8 @@ def _load_swirl_frames():
         def key(p):
             m = re.search(r"(\d+)(?!.*\d)", os.path.basename(p))
             return (int(m.group(1)) if m else -1, p.lower())
-        for p in sorted(set(paths), key=key):
-            try: frames.append(pygame.image.load(p).convert_alpha())
-            except Exception as e: print(f"⚠️ VFX load fail: {p} -> {e}")
+        ordered = sorted(set(paths), key=key)
+        frames.extend(img for img in asset_cache.load_many(ordered) if img)
     try:
         fx_candidates = []
         for pat in ("fx_4_ver1_*.png","FX_4_VER1_*.png","Fx_4_VEr1_*.png","fx_4_ver1_*.PNG","FX_4_VER1_*.PNG"):
@@ -310,37 +309,8 @@ def _on_use_item(gs, item) -> bool:
 
 # ---------------- UI helpers ----------------
 def _draw_hp_bar(surface: pygame.Surface, rect: pygame.Rect, hp_ratio: float, name: str, align: str):
-    hp_ratio = max(0.0, min(1.0, hp_ratio))
-    x, y, w, h = rect
-    frame, border, gold, inner = (70,45,30), (140,95,60), (185,150,60), (28,18,14)
-    back, front = (60,24,24), (28,150,60)
-    pygame.draw.rect(surface, frame, rect, border_radius=10)
-    pygame.draw.rect(surface, border, rect, 3, border_radius=10)
-    inner_rect = rect.inflate(-10, -10)
-    pygame.draw.rect(surface, gold, inner_rect, 2, border_radius=8)
-    name_h = max(22, int(h*0.44))
-    plate = pygame.Rect(inner_rect.x+8, inner_rect.y+6, inner_rect.w-16, name_h)
-    notch_w = max(38, int(h*0.46))
-    notch = pygame.Rect(plate.x, plate.y, notch_w, plate.h) if align=="right" \
-            else pygame.Rect(plate.right - notch_w, plate.y, notch_w, plate.h)
-    pygame.draw.rect(surface, inner, plate, border_radius=6)
-    pygame.draw.rect(surface, gold, plate, 2, border_radius=6)
-    pygame.draw.rect(surface, frame, notch, border_radius=6)
-    trough = pygame.Rect(inner_rect.x+12, plate.bottom+8, inner_rect.w-24, inner_rect.h-name_h-20)
-    pygame.draw.rect(surface, back, trough, border_radius=6)
-    fw = int(trough.w * hp_ratio)
-    if fw > 0:
-        pygame.draw.rect(surface, front, (trough.x, trough.y, fw, trough.h), border_radius=6)
-    for i in range(1,4):
-        tx = trough.x + (trough.w * i)//4
-        pygame.draw.line(surface, (30,18,12), (tx, trough.y+3), (tx, trough.bottom-3), 2)
-    font = pygame.font.SysFont("georgia", max(20, int(h*0.32)), bold=True)
-    label = font.render(name, True, (230,210,180))
-    if align=="left":
-        surface.blit(label, label.get_rect(midleft=(plate.x+12, plate.centery)))
-    else:
-        surface.blit(label, label.get_rect(midright=(plate.right-12, plate.centery)))
-        
+    hud_plates.draw_hp_plate(surface, rect, hp_ratio, name, align)
+
 # ---------- XP strip (matches ledger style, compact) ----------
 def _xp_compute(stats: dict) -> tuple[int, int, int, float]:
     """Return (level, cur, need, ratio 0..1) from party stat dict."""
@@ -361,34 +331,7 @@ def _xp_compute(stats: dict) -> tuple[int, int, int, float]:
 def _draw_xp_strip(surface: pygame.Surface, rect: pygame.Rect, stats: dict):
     """Compact 'XP cur/need' with a thin progress bar (ledger-like)."""
     _, cur, need, r = _xp_compute(stats)
-
-    frame   = (70, 45, 30)
-    border  = (140, 95, 60)
-    trough  = (46, 40, 36)
-    fill    = (40, 180, 90)
-    text    = (230, 220, 200)
-
-    # container
-    pygame.draw.rect(surface, frame, rect, border_radius=6)
-    pygame.draw.rect(surface, border, rect, 2, border_radius=6)
-    inner = rect.inflate(-8, -8)
-
-    # label
-    font = pygame.font.SysFont("georgia", max(14, int(rect.h * 0.60)), bold=False)
-    label = font.render(f"XP: {cur} / {need}", True, text)
-    surface.blit(label, label.get_rect(midleft=(inner.x + 6, inner.centery)))
-
-    # progress bar (right side)
-    bar_h = max(4, int(inner.h * 0.36))
-    bar_w = max(90, int(inner.w * 0.46))
-    bar_x = inner.right - bar_w - 6
-    bar_y = inner.centery - bar_h // 2
-    bar = pygame.Rect(bar_x, bar_y, bar_w, bar_h)
-
-    pygame.draw.rect(surface, trough, bar, border_radius=3)
-    fw = int(bar_w * r)
-    if fw > 0:
-        pygame.draw.rect(surface, fill, (bar_x, bar_y, fw, bar_h), border_radius=3)
+    hud_plates.draw_xp_strip(surface, rect, cur, need, r)
 
 
 # ---------------- Active party helpers ----------------
@@ -466,9 +409,9 @@ def enter(gs, audio_bank=None, **_):
 
     bg_img = None
     try:
-        p = os.path.join("Assets", "Map", "Wild.png")
-        if os.path.exists(p):
-            bg_img = pygame.transform.smoothscale(pygame.image.load(p).convert(), (sw, sh))
+        src = asset_cache.load_image(os.path.join("Assets", "Map", "Wild.png"), alpha=False)
+        if src:
+            bg_img = pygame.transform.smoothscale(src, (sw, sh))
     except Exception as e:
         print(f"⚠️ Wild bg load failed: {e}")
 
@@ -603,6 +546,30 @@ def _show_result_screen(st: dict, title: str, subtitle: str, *,
         "auto_ready": False,
         "lock_input": bool(lock_input),
     }
+    st["result"]["card"] = _render_result_card(st["result"])
+
+def _render_result_card(res: dict) -> pygame.Surface:
+    """Card, title, subtitle and hint at full opacity; draw only fades + blits it."""
+    card_w, card_h = RESULT_CARD_W, RESULT_CARD_H
+    card = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
+    pygame.draw.rect(card, (245, 245, 245, 245), card.get_rect(), border_radius=14)
+    pygame.draw.rect(card, (0, 0, 0, 255), card.get_rect(), 4, border_radius=14)
+    pygame.draw.rect(card, (60, 60, 60, 255), card.get_rect().inflate(-10, -10), 2, border_radius=10)
+
+    big = fonts.get("georgia", 40, bold=True)
+    mid = fonts.get("georgia", 24)
+
+    t_surf = fonts.render(big, res.get("title",""), (20, 20, 20))
+    s_surf = fonts.render(mid, res.get("subtitle",""), (45, 45, 45))
+
+    card.blit(t_surf, t_surf.get_rect(center=(card_w//2, card_h//2 - 22)))
+    card.blit(s_surf, s_surf.get_rect(center=(card_w//2, card_h//2 + 24)))
+
+    if res.get("auto_ms", 0) <= 0 and not res.get("lock_input", False):
+        hint = fonts.render(fonts.get("arial", 18), "Click to continue", (70, 70, 70))
+        card.blit(hint, hint.get_rect(midbottom=(card_w//2, card_h - 14)))
+
+    return card
 
 def _draw_result_screen(screen: pygame.Surface, st: dict, dt: float):
     res = st.get("result")
@@ -622,30 +589,12 @@ def _draw_result_screen(screen: pygame.Surface, st: dict, dt: float):
         res["played"] = True
 
     sw, sh = screen.get_size()
-    dim = pygame.Surface((sw, sh), pygame.SRCALPHA); dim.fill((0, 0, 0, min(160, a)))
-    screen.blit(dim, (0, 0))
-
-    card_w, card_h = RESULT_CARD_W, RESULT_CARD_H
-    card = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
-    pygame.draw.rect(card, (245, 245, 245, min(245, a)), card.get_rect(), border_radius=14)
-    pygame.draw.rect(card, (0, 0, 0, min(255, a)), card.get_rect(), 4, border_radius=14)
-    pygame.draw.rect(card, (60, 60, 60, min(255, a)), card.get_rect().inflate(-10, -10), 2, border_radius=10)
-
-    big = pygame.font.SysFont("georgia", 40, bold=True)
-    mid = pygame.font.SysFont("georgia", 24, bold=False)
-
-    t_surf = big.render(res.get("title",""), True, (20, 20, 20))
-    s_surf = mid.render(res.get("subtitle",""), True, (45, 45, 45))
-
-    card.blit(t_surf, t_surf.get_rect(center=(card_w//2, card_h//2 - 22)))
-    card.blit(s_surf, s_surf.get_rect(center=(card_w//2, card_h//2 + 24)))
-
-    if res.get("auto_ms", 0) <= 0 and not res.get("lock_input", False):
-        hint = pygame.font.SysFont("arial", 18, bold=False).render(
-            "Click to continue", True, (70, 70, 70)
-        )
-        card.blit(hint, hint.get_rect(midbottom=(card_w//2, card_h - 14)))
+    surface_pool.dim(screen, min(160, a))
 
+    card = res.get("card")
+    if card is None:  # results posted directly (moves/helpers) skip _show_result_screen
+        card = res["card"] = _render_result_card(res)
+    card.set_alpha(a)
     screen.blit(card, card.get_rect(center=(sw//2, int(sh*0.52))))
 
     auto_ms = res.get("auto_ms", 0)
@@ -1043,17 +992,18 @@ def draw(screen, gs, dt, **_):
                 from systems.asset_links import token_to_vessel, find_image
                 vessel_png = token_to_vessel(active_name)
                 path = find_image(vessel_png)
-                if path and os.path.exists(path):
-                    st["ally_img"] = pygame.image.load(path).convert_alpha()
-                    st["ally_img"] = _smooth_scale(st["ally_img"], ALLY_SCALE)
+                img = _try_load(path)
+                if img:
+                    st["ally_img"] = _smooth_scale(img, ALLY_SCALE)
             except Exception: pass
     elif st["ally_from_slot"] != active_i and active_name and not st.get("swap_playing", False):
         try:
             from systems.asset_links import token_to_vessel, find_image
             vessel_png = token_to_vessel(active_name)
             path = find_image(vessel_png)
-            if path and os.path.exists(path):
-                st["ally_img_next"] = _smooth_scale(pygame.image.load(path).convert_alpha(), ALLY_SCALE)
+            img = _try_load(path)
+            if img:
+                st["ally_img_next"] = _smooth_scale(img, ALLY_SCALE)
                 st["ally_swap_target_slot"] = active_i
                 st["swap_playing"] = True
                 st["swap_t"] = 0.0
@@ -1227,7 +1177,7 @@ def draw(screen, gs, dt, **_):
             target = int(max(aw, ah) * 1.15)
             sw_, sh_ = swirl_raw.get_width(), swirl_raw.get_height()
             s = target / max(1, max(sw_, sh_))
-            swirl = pygame.transform.smoothscale(swirl_raw, (max(1, int(sw_ * s)), max(1, int(sh_ * s))))
+            swirl = scale_cache.scaled(swirl_raw, (int(sw_ * s), int(sh_ * s)))
             cx = ax + aw // 2; cy = ay + ah // 2
             screen.blit(swirl, swirl.get_rect(center=(cx, cy)))
             if st["swap_total"] >= SWIRL_DURATION:
@@ -1240,7 +1190,7 @@ def draw(screen, gs, dt, **_):
 
     # --- Turn indicator overlay (debug)
     if "phase" in st:
-        font = pygame.font.SysFont("georgia", 22, bold=True)
+        font = fonts.get("georgia", 22, bold=True)
         text = f"Phase: {st.get('phase','?')}  Ready:{getattr(gs,'_turn_ready',True)}  ForceSwitch:{st.get('force_switch', False)}"
         surf = font.render(text, True, (240, 230, 200))
         screen.blit(surf, (12, 12))
@@ -1272,7 +1222,7 @@ def draw(screen, gs, dt, **_):
             target = int(max(ew, eh) * 1.2)
             sw_, sh_ = swirl_raw.get_width(), swirl_raw.get_height()
             s = target / max(1, max(sw_, sh_))
-            swirl = pygame.transform.smoothscale(swirl_raw, (max(1, int(sw_ * s)), max(1, int(sh_ * s))))
+            swirl = scale_cache.scaled(swirl_raw, (int(sw_ * s), int(sh_ * s)))
             cx = ex + ew // 2; cy = ey + eh // 2
             screen.blit(swirl, swirl.get_rect(center=(cx, cy)))
             if st["cap_vfx_total"] >= SWIRL_DURATION:
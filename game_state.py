@@ -1,6 +1,7 @@
 # ===================== GameState =============================
 from dataclasses import dataclass, field
 from pygame.math import Vector2
+from world.spawn_index import SpawnIndex
 
 @dataclass
 class GameState:
@@ -17,6 +18,7 @@ class GameState:
     # progress
     distance_travelled: float = 0.0
     next_event_at: float = 120.0
+    event_schedule: object | None = None   # world/event_schedule.EventScheduler
 
     # encounter popup
     in_encounter: bool = False
@@ -25,9 +27,9 @@ class GameState:
     encounter_sprite: object = None  # pygame.Surface or None
     encounter_stats: dict | None = None  # full stat block for active encounter
 
-    # world spawns
-    rivals_on_map: list = field(default_factory=list)
-    vessels_on_map: list = field(default_factory=list)
+    # world spawns (y-sorted, see world/spawn_index.py)
+    rivals_on_map: SpawnIndex = field(default_factory=SpawnIndex)
+    vessels_on_map: SpawnIndex = field(default_factory=SpawnIndex)
 
     # audio state
     is_walking: bool = False
@@ -15,8 +15,9 @@ from game_state import GameState
 
 
 # systems & world
-from world import assets, actors, world, procgen
-from systems import save_system as saves, theme, ui, audio, party_ui
+from world import assets, actors, world, procgen, event_schedule
+from systems import save_system as saves, theme, ui, audio, party_ui, asset_index, startup_trace
+from systems import frame_profiler, fonts, dirty_rects, image_decode
 from bootstrap.default_party import add_default_on_new_game   # ← add this
 from bootstrap.default_inventory import add_default_inventory  # ← NEW
 
@@ -38,16 +39,7 @@ from screens import (
     black_screen, intro_video, settings_screen, pause_screen
 )
 
-def _try_load(path: str | None):
-    if not path:
-        return None
-    if os.path.exists(path):
-        try:
-            return pygame.image.load(path).convert_alpha()
-        except Exception as e:
-            print(f"⚠️ load fail {path}: {e}")
-    return None
-
+from systems.asset_cache import load_image as _try_load
 from systems.asset_links import token_to_vessel, find_image
 
 def _full_vessel_from_token_name(token_name: str | None) -> pygame.Surface | None:
@@ -57,11 +49,7 @@ def _full_vessel_from_token_name(token_name: str | None) -> pygame.Surface | Non
     path = find_image(vessel_basename)
     if not path:
         return None
-    try:
-        img = pygame.image.load(path).convert_alpha()
-        return img
-    except Exception:
-        return None
+    return _try_load(path)
 
 
     base = os.path.splitext(os.path.basename(token_name))[0]  # strip .png if present
@@ -252,17 +240,26 @@ def apply_player_variant(gs, variant_key, variants_dict):
     gs.walk_anim = Animator(walk_frames, fps=8, loop=True)
 
 
+def event_schedule_for(gs) -> event_schedule.EventScheduler:
+    """This run's scheduler; built from run_seed (resuming at next_event_at for older saves)."""
+    sched = getattr(gs, "event_schedule", None)
+    seed = getattr(gs, "run_seed", 0)
+    if sched is None or sched.seed != seed:
+        sched = gs.event_schedule = event_schedule.EventScheduler(seed, start_at=gs.next_event_at)
+    return sched
+
+
 def try_trigger_encounter(gs, summoners):
     if gs.in_encounter:
         return
-    if gs.distance_travelled >= gs.next_event_at:
-        if random.random() < S.ENCOUNTER_WEIGHT_VESSEL:
-            actors.spawn_vessel_shadow_ahead(gs, gs.start_x)
-        elif summoners:
+    sched = event_schedule_for(gs)
+    for kind in sched.due(gs.distance_travelled):
+        if kind == "rival" and summoners:
             actors.spawn_rival_ahead(gs, gs.start_x, summoners)
         else:
+            # boss / shop have no overworld handler yet; they stand in as vessels
             actors.spawn_vessel_shadow_ahead(gs, gs.start_x)
-        gs.next_event_at += random.randint(S.EVENT_MIN, S.EVENT_MAX)
+    gs.next_event_at = sched.next_at
 
 
 # ===================== Encounter Popup =======================
@@ -277,10 +274,12 @@ def update_encounter_popup(screen, dt, gs, mist_frame, width, height, pg_instanc
     gs.encounter_timer -= dt
     cam = world.get_camera_offset(gs.player_pos, width, height, gs.player_half)
 
-    world.draw_repeating_road(screen, cam.x, cam.y)
     if pg_instance:
+        pg_instance.reseed(getattr(gs, "run_seed", pg_instance.seed))
         pg_instance.update_needed(cam.y, height)
-        pg_instance.draw_props(screen, cam.x, cam.y, width, height)
+        pg_instance.draw_world(screen, cam.x, cam.y, width, height)
+    else:
+        world.draw_repeating_road(screen, cam.x, cam.y)
 
     # Draw any active vessels/rivals in the world behind the popup
     actors.draw_vessels(screen, cam, gs, mist_frame, S.DEBUG_OVERWORLD)
@@ -298,9 +297,9 @@ def update_encounter_popup(screen, dt, gs, mist_frame, width, height, pg_instanc
     px, py = (width - 440) // 2, 40
     screen.blit(panel, (px, py))
 
-    font = pygame.font.SysFont(None, 28)
+    font = fonts.get(None, 28)
     title = f"Encounter: {gs.encounter_name}"
-    screen.blit(font.render(title, True, (230, 230, 230)), (px + 16, py + 12))
+    screen.blit(fonts.render(font, title, (230, 230, 230)), (px + 16, py + 12))
 
     if gs.encounter_sprite:
         screen.blit(gs.encounter_sprite, (px + 16, py + 48))
@@ -323,6 +322,7 @@ def reset_run_state(gs):
     gs.vessels_on_map.clear()
     gs.distance_travelled = 0.0
     gs.next_event_at = S.FIRST_EVENT_AT
+    gs.event_schedule = None   # rebuilt from the run's seed on the first overworld frame
 
 
 def start_new_game(gs):
@@ -374,14 +374,47 @@ def enter_mode(mode, gs, deps):
         pass
 
 
+OVERWORLD_DIRTY = dirty_rects.DirtyRenderer()
+
+def present(screen):
+    """Profiler overlay (if on) + flip; every mode ends its frame here."""
+    OVERWORLD_DIRTY.invalidate()
+    frame_profiler.draw_overlay(screen)
+    with frame_profiler.span("display.flip"):
+        pygame.display.flip()
+
+def present_overworld(screen):
+    """Like present(), but only pushes the regions the overworld repainted."""
+    frame_profiler.draw_overlay(screen)
+    with frame_profiler.span("display.flip"):
+        OVERWORLD_DIRTY.present()
+
+
+def track_overworld(dirty, gs, cam, mist_frame):
+    """Register the overworld's moving/animated drawables with the dirty-rect renderer."""
+    actors.track_dirty(dirty, cam, gs, mist_frame)
+    dirty.track("player",
+                gs.player_image.get_rect(topleft=(int(gs.player_pos.x - cam.x - gs.player_half.x),
+                                                  int(gs.player_pos.y - cam.y - gs.player_half.y))),
+                id(gs.player_image))
+    hud = party_ui.hud_rect()
+    if hud is not None:
+        dirty.track("hud", hud, party_ui.hud_signature(gs))
+
+
 # ===================== Main / Entrypoint =====================
+# Setup AND the game loop stay under this guard: the spawn()ed decode
+# workers (systems/image_decode.py) import this file as __mp_main__.
 if __name__ == "__main__":
     # -------- Init ----------
     set_cwd()
+    startup_trace.begin()
     pygame.init()
 
-    audio.init_audio()
-    AUDIO = audio.load_all()
+    with startup_trace.phase("audio.init_audio"):
+        audio.init_audio()
+    with startup_trace.phase("audio.load_all"):
+        AUDIO = audio.load_all()
 
     # 👇 make the bank globally visible to rolling/ui.py for dice SFX
     S.AUDIO_BANK = AUDIO
@@ -391,15 +424,21 @@ if __name__ == "__main__":
 
     info = pygame.display.Info()
     S.WIDTH, S.HEIGHT = info.current_w, info.current_h
-    screen = pygame.display.set_mode((S.WIDTH, S.HEIGHT), pygame.FULLSCREEN | pygame.SCALED)
+    with startup_trace.phase("display.set_mode"):
+        screen = pygame.display.set_mode((S.WIDTH, S.HEIGHT), pygame.FULLSCREEN | pygame.SCALED)
     pygame.display.set_caption(S.APP_NAME)
     clock = pygame.time.Clock()
 
     # -------- Theme & Assets ----------
-    fonts = theme.load_fonts()
-    menu_bg = theme.load_menu_bg()
-
-    loaded = assets.load_everything()
+    with startup_trace.phase("asset_index.build"):
+        asset_index.build()   # one walk of Assets/ (or the cached manifest) before any lookups
+    with startup_trace.phase("theme.load_fonts"):
+        fonts = theme.load_fonts()
+    with startup_trace.phase("theme.load_menu_bg"):
+        menu_bg = theme.load_menu_bg()
+
+    with startup_trace.phase("assets.load_everything"), image_decode.startup_pool():
+        loaded = assets.load_everything()
     RIVAL_SUMMONERS = loaded["summoners"]
     VESSELS         = loaded["vessels"]
     RARE_VESSELS    = loaded["rare_vessels"]
@@ -411,9 +450,12 @@ if __name__ == "__main__":
     # Create a global animator for the hovering mist (looping)
     MIST_ANIM = Animator(MIST_FRAMES, fps=8, loop=True) if MIST_FRAMES else None
 
-    PLAYER_VARIANTS = assets.load_player_variants()
-    world.load_road()
-    pg = procgen.ProcGen(rng_seed=42)
+    with startup_trace.phase("assets.load_player_variants"):
+        PLAYER_VARIANTS = assets.load_player_variants()
+    with startup_trace.phase("world.load_road"):
+        world.load_road()
+    with startup_trace.phase("ProcGen.__init__"):
+        pg = procgen.ProcGen(rng_seed=42)
 
     # -------- GameState ----------
     gs = GameState(
@@ -438,332 +480,368 @@ if __name__ == "__main__":
     if not getattr(gs, "party_vessel_stats", None):
         gs.party_vessel_stats = [None] * 6
 
-    # -------- Loop State ----------
-mode = S.MODE_MENU
-prev_mode = None
-running = True
-settings_return_to = S.MODE_MENU  # used inside settings screen; kept for parity
-
-# Safety: make sure a display surface exists before we enter the loop
-assert pygame.display.get_surface() is not None, "Display not created before main loop"
-
-# ===================== Main Loop ==========================
-while running:
-    dt = clock.tick(60) / 1000.0
-    events = pygame.event.get()
-
-    # ========== Mode transitions: high-level music =========
-    if mode != prev_mode:
-        # per-mode music
-        if mode == S.MODE_MENU:
-            audio.play_music(AUDIO, "MainMenu")
-        elif mode == MODE_CHAR_SELECT:
-            audio.play_music(AUDIO, "CharacterSelect")
-        elif mode == S.MODE_GAME:
-            audio.stop_music()
-            gs.overworld_music_started = False
+    startup_trace.report()
 
-        # ensure chosen gender actually updates the player before Name Entry uses it
-        if mode == MODE_NAME_ENTRY and getattr(gs, "chosen_gender", None):
-            apply_player_variant(gs, gs.chosen_gender, PLAYER_VARIANTS)
-            # keep HUD portrait in sync too
-            gs.player_token = party_ui.load_player_token(gs.player_gender)
+    # -------- Loop State ----------
+    mode = S.MODE_MENU
+    prev_mode = None
+    running = True
+    settings_return_to = S.MODE_MENU  # used inside settings screen; kept for parity
+
+    # Safety: make sure a display surface exists before we enter the loop
+    assert pygame.display.get_surface() is not None, "Display not created before main loop"
+
+    # ===================== Main Loop ==========================
+    while running:
+        dt = clock.tick(60) / 1000.0
+        frame_profiler.begin_frame()
+        events = pygame.event.get()
+
+        # ========== Mode transitions: high-level music =========
+        if mode != prev_mode:
+            # per-mode music
+            if mode == S.MODE_MENU:
+                audio.play_music(AUDIO, "MainMenu")
+            elif mode == MODE_CHAR_SELECT:
+                audio.play_music(AUDIO, "CharacterSelect")
+            elif mode == S.MODE_GAME:
+                audio.stop_music()
+                gs.overworld_music_started = False
+
+            # ensure chosen gender actually updates the player before Name Entry uses it
+            if mode == MODE_NAME_ENTRY and getattr(gs, "chosen_gender", None):
+                apply_player_variant(gs, gs.chosen_gender, PLAYER_VARIANTS)
+                # keep HUD portrait in sync too
+                gs.player_token = party_ui.load_player_token(gs.player_gender)
+
+            # call the screen's enter() hook (no 'screen' in deps)
+            deps = dict(
+                fonts=fonts,
+                menu_bg=menu_bg,
+                audio_bank=AUDIO,
+                player_variants=PLAYER_VARIANTS,  # pass variants to screens
+            )
+            enter_mode(mode, gs, deps)
+            prev_mode = mode
 
-        # call the screen's enter() hook (no 'screen' in deps)
+        # Build a shared deps dict each frame (for screens that need these)
         deps = dict(
             fonts=fonts,
             menu_bg=menu_bg,
             audio_bank=AUDIO,
-            player_variants=PLAYER_VARIANTS,  # pass variants to screens
+            player_variants=PLAYER_VARIANTS,
         )
-        enter_mode(mode, gs, deps)
-        prev_mode = mode
-
-    # Build a shared deps dict each frame (for screens that need these)
-    deps = dict(
-        fonts=fonts,
-        menu_bg=menu_bg,
-        audio_bank=AUDIO,
-        player_variants=PLAYER_VARIANTS,
-    )
-
-    # ========== Universal window close ==========
-    for e in events:
-        if e.type == pygame.QUIT:
-            saves.save_game(gs)
-            running = False
 
-    # ===================== MENU ============================
-    if mode == S.MODE_MENU:
-        next_mode = menu_screen.handle(events, gs, **deps, can_continue=saves.has_save())
-        menu_screen.draw(screen, gs, **deps, can_continue=saves.has_save())
-        pygame.display.flip()
-        if next_mode:
-            mode = next_mode
-
-    # ===================== CHARACTER SELECT ================
-    elif mode == MODE_CHAR_SELECT:
-        next_mode = char_select.handle(events, gs, **deps)
-        char_select.draw(screen, gs, **deps)
-        pygame.display.flip()
-        if next_mode:
-            mode = next_mode
-
-    # ===================== NAME ENTRY ======================
-    elif mode == MODE_NAME_ENTRY:
-        next_mode = name_entry.handle(events, gs, dt, **deps)
-        name_entry.draw(screen, gs, dt, **deps)
-        pygame.display.flip()
-        if next_mode:
-            if next_mode == MODE_BLACK_SCREEN:
-                start_new_game(gs)
-                from systems import save_system as saves
-                saves.delete_save()  # ensure truly fresh run
-
-                from bootstrap.default_party import add_default_on_new_game
-                add_default_on_new_game(gs)
+        # ========== Universal window close ==========
+        for e in events:
+            if e.type == pygame.QUIT:
+                saves.save_game(gs)
+                running = False
+            frame_profiler.handle_event(e)   # F3 overlay / F4 CSV dump
 
-                from bootstrap.default_inventory import add_default_inventory
-                add_default_inventory(gs)
+        # ===================== MENU ============================
+        if mode == S.MODE_MENU:
+            next_mode = menu_screen.handle(events, gs, **deps, can_continue=saves.has_save())
+            menu_screen.draw(screen, gs, **deps, can_continue=saves.has_save())
+            present(screen)
+            if next_mode:
+                mode = next_mode
 
+        # ===================== CHARACTER SELECT ================
+        elif mode == MODE_CHAR_SELECT:
+            next_mode = char_select.handle(events, gs, **deps)
+            char_select.draw(screen, gs, **deps)
+            present(screen)
+            if next_mode:
+                mode = next_mode
+
+        # ===================== NAME ENTRY ======================
+        elif mode == MODE_NAME_ENTRY:
+            next_mode = name_entry.handle(events, gs, dt, **deps)
+            name_entry.draw(screen, gs, dt, **deps)
+            present(screen)
+            if next_mode:
+                if next_mode == MODE_BLACK_SCREEN:
+                    start_new_game(gs)
+                    from systems import save_system as saves
+                    saves.delete_save()  # ensure truly fresh run
+
+                    from bootstrap.default_party import add_default_on_new_game
+                    add_default_on_new_game(gs)
+
+                    from bootstrap.default_inventory import add_default_inventory
+                    add_default_inventory(gs)
+
+                    try:
+                        pygame.mixer.music.fadeout(120)
+                    except Exception:
+                        pass
+                # ✅ THIS LINE WAS MISSING
+                mode = next_mode
+
+
+
+        # ===================== BLACK SCREEN ====================
+        elif mode == MODE_BLACK_SCREEN:
+            next_mode = black_screen.handle(events, gs, **deps, saves=saves)
+            black_screen.draw(screen, gs, **deps)
+            present(screen)
+            if next_mode:
                 try:
-                    pygame.mixer.music.fadeout(120)
+                    pygame.mixer.music.stop()
                 except Exception:
                     pass
-            # ✅ THIS LINE WAS MISSING
-            mode = next_mode
-
-
-
-    # ===================== BLACK SCREEN ====================
-    elif mode == MODE_BLACK_SCREEN:
-        next_mode = black_screen.handle(events, gs, **deps, saves=saves)
-        black_screen.draw(screen, gs, **deps)
-        pygame.display.flip()
-        if next_mode:
-            try:
-                pygame.mixer.music.stop()
-            except Exception:
-                pass
-            mode = next_mode
-
-    # ===================== INTRO VIDEO =====================
-    elif mode == MODE_INTRO_VIDEO:
-        next_mode = intro_video.handle(events, gs, dt, **deps)
-        intro_video.draw(screen, gs, dt, **deps)
-        pygame.display.flip()
-        if next_mode:
-            if next_mode == S.MODE_GAME:
-                start_fade_in(gs, 0.8)
-            mode = next_mode
-
-    # ===================== SETTINGS ========================
-    elif mode == MODE_SETTINGS:
-        next_mode = settings_screen.handle(events, gs, **deps)
-        settings_screen.draw(screen, gs, **deps)
-        pygame.display.flip()
-        if next_mode:
-            mode = next_mode
-
-    # ===================== PAUSE ===========================
-    elif mode == MODE_PAUSE:
-        next_mode = pause_screen.handle(events, gs, **deps)
-        pause_screen.draw(screen, gs, **deps)
-        pygame.display.flip()
-        if next_mode:
-            mode = next_mode
+                mode = next_mode
+
+        # ===================== INTRO VIDEO =====================
+        elif mode == MODE_INTRO_VIDEO:
+            next_mode = intro_video.handle(events, gs, dt, **deps)
+            intro_video.draw(screen, gs, dt, **deps)
+            present(screen)
+            if next_mode:
+                if next_mode == S.MODE_GAME:
+                    start_fade_in(gs, 0.8)
+                mode = next_mode
+
+        # ===================== SETTINGS ========================
+        elif mode == MODE_SETTINGS:
+            next_mode = settings_screen.handle(events, gs, **deps)
+            settings_screen.draw(screen, gs, **deps)
+            present(screen)
+            if next_mode:
+                mode = next_mode
+
+        # ===================== PAUSE ===========================
+        elif mode == MODE_PAUSE:
+            next_mode = pause_screen.handle(events, gs, **deps)
+            pause_screen.draw(screen, gs, **deps)
+            present(screen)
+            if next_mode:
+                mode = next_mode
     
-    # ===================== SUMMONER BATTLE =====================
-    elif mode == MODE_SUMMONER_BATTLE:
-        next_mode = summoner_battle.handle(events, gs)
-        summoner_battle.draw(screen, gs, dt, **deps)
-        pygame.display.flip()
-        if next_mode:
-            mode = next_mode
-
-
-    # ===================== WILD VESSEL =====================
-    elif mode == MODE_WILD_VESSEL:
-        next_mode = wild_vessel.handle(events, gs, **deps)
-        wild_vessel.draw(screen, gs, dt, **deps)
-        pygame.display.flip()
-        if next_mode:
-            mode = next_mode  # ESC returns to overworld
+        # ===================== SUMMONER BATTLE =====================
+        elif mode == MODE_SUMMONER_BATTLE:
+            next_mode = summoner_battle.handle(events, gs)
+            summoner_battle.draw(screen, gs, dt, **deps)
+            present(screen)
+            if next_mode:
+                mode = next_mode
+
+
+        # ===================== WILD VESSEL =====================
+        elif mode == MODE_WILD_VESSEL:
+            next_mode = wild_vessel.handle(events, gs, **deps)
+            wild_vessel.draw(screen, gs, dt, **deps)
+            present(screen)
+            if next_mode:
+                mode = next_mode  # ESC returns to overworld
+
+        # ===================== GAMEPLAY ========================
+        elif mode == S.MODE_GAME:
+            # --- Snapshots for this frame (used to suppress ESC->Pause) ---
+            bag_open_at_frame_start = bag_ui.is_open()
+            modal_open_at_frame_start = (
+                bag_ui.is_open() or party_manager.is_open() or ledger.is_open()
+            )
 
-    # ===================== GAMEPLAY ========================
-    elif mode == S.MODE_GAME:
-        # --- Snapshots for this frame (used to suppress ESC->Pause) ---
-        bag_open_at_frame_start = bag_ui.is_open()
-        modal_open_at_frame_start = (
-            bag_ui.is_open() or party_manager.is_open() or ledger.is_open()
-        )
+            just_toggled_pm = False
+            just_toggled_bag = False
+            just_opened_ledger = False  # suppress first click that opened it
 
-        just_toggled_pm = False
-        just_toggled_bag = False
-        just_opened_ledger = False  # suppress first click that opened it
+            t_events = frame_profiler.start()
 
-        # --- Global hotkeys ---
-        for e in events:
-            # Bag toggle (I)
-            if e.type == pygame.KEYDOWN and e.key == pygame.K_i:
-                bag_ui.toggle_popup()
-                just_toggled_bag = True
-
-            # Party Manager toggle (Tab) — only if no other modal is open
-            if e.type == pygame.KEYDOWN and e.key == pygame.K_TAB:
-                if not bag_ui.is_open() and not ledger.is_open():
-                    party_manager.toggle()
-                    just_toggled_pm = True
-
-        # --- Let HUD handle clicks ONLY when no modal is open (this can open the Ledger) ---
-        if not bag_ui.is_open() and not party_manager.is_open() and not ledger.is_open():
-            was_ledger_open = ledger.is_open()  # should be False, safety check
+            # --- Global hotkeys ---
             for e in events:
-                party_ui.handle_event(e, gs)
-            if not was_ledger_open and ledger.is_open():
-                just_opened_ledger = True
-
-        # --- Route events to modals (priority: Bag → Party Manager → Ledger) ---
-        for e in events:
-            # Ignore the exact key that toggled a modal this frame to avoid double-handling
-            if bag_ui.is_open():
-                if not (just_toggled_bag and e.type == pygame.KEYDOWN and e.key == pygame.K_i):
-                    if bag_ui.handle_event(e, gs):
+                # Bag toggle (I)
+                if e.type == pygame.KEYDOWN and e.key == pygame.K_i:
+                    bag_ui.toggle_popup()
+                    just_toggled_bag = True
+
+                # Party Manager toggle (Tab) — only if no other modal is open
+                if e.type == pygame.KEYDOWN and e.key == pygame.K_TAB:
+                    if not bag_ui.is_open() and not ledger.is_open():
+                        party_manager.toggle()
+                        just_toggled_pm = True
+
+            # --- Let HUD handle clicks ONLY when no modal is open (this can open the Ledger) ---
+            if not bag_ui.is_open() and not party_manager.is_open() and not ledger.is_open():
+                was_ledger_open = ledger.is_open()  # should be False, safety check
+                for e in events:
+                    party_ui.handle_event(e, gs)
+                if not was_ledger_open and ledger.is_open():
+                    just_opened_ledger = True
+
+            # --- Route events to modals (priority: Bag → Party Manager → Ledger) ---
+            for e in events:
+                # Ignore the exact key that toggled a modal this frame to avoid double-handling
+                if bag_ui.is_open():
+                    if not (just_toggled_bag and e.type == pygame.KEYDOWN and e.key == pygame.K_i):
+                        if bag_ui.handle_event(e, gs):
+                            continue
+
+                if party_manager.is_open():
+                    if not (just_toggled_pm and e.type == pygame.KEYDOWN and e.key == pygame.K_TAB):
+                        if party_manager.handle_event(e, gs):
+                            continue
+
+                if ledger.is_open():
+                    # Suppress the opening mouse event so it doesn't immediately close the ledger
+                    if just_opened_ledger and e.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
                         continue
-
-            if party_manager.is_open():
-                if not (just_toggled_pm and e.type == pygame.KEYDOWN and e.key == pygame.K_TAB):
-                    if party_manager.handle_event(e, gs):
+                    if ledger.handle_event(e, gs):
                         continue
 
-            if ledger.is_open():
-                # Suppress the opening mouse event so it doesn't immediately close the ledger
-                if just_opened_ledger and e.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
-                    continue
-                if ledger.handle_event(e, gs):
-                    continue
-
-        # --- Pause / music events ---
-        for event in events:
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                # If any modal was open at frame start OR is open now, don't enter Pause
-                if (
-                    modal_open_at_frame_start
-                    or bag_ui.is_open()
-                    or party_manager.is_open()
-                    or ledger.is_open()
-                ):
-                    continue
-                audio.play_click(AUDIO)
-                mode = MODE_PAUSE
-            elif event.type == MUSIC_ENDEVENT:
+            # --- Pause / music events ---
+            for event in events:
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    # If any modal was open at frame start OR is open now, don't enter Pause
+                    if (
+                        modal_open_at_frame_start
+                        or bag_ui.is_open()
+                        or party_manager.is_open()
+                        or ledger.is_open()
+                    ):
+                        continue
+                    audio.play_click(AUDIO)
+                    mode = MODE_PAUSE
+                elif event.type == MUSIC_ENDEVENT:
+                    nxt = audio.pick_next_track(AUDIO, getattr(gs, "last_overworld_track", None), prefix="music")
+                    if nxt:
+                        audio.play_music(AUDIO, nxt, loop=False)
+                        gs.last_overworld_track = nxt
+
+            if not gs.overworld_music_started:
                 nxt = audio.pick_next_track(AUDIO, getattr(gs, "last_overworld_track", None), prefix="music")
                 if nxt:
                     audio.play_music(AUDIO, nxt, loop=False)
                     gs.last_overworld_track = nxt
+                gs.overworld_music_started = True
 
-        if not gs.overworld_music_started:
-            nxt = audio.pick_next_track(AUDIO, getattr(gs, "last_overworld_track", None), prefix="music")
-            if nxt:
-                audio.play_music(AUDIO, nxt, loop=False)
-                gs.last_overworld_track = nxt
-            gs.overworld_music_started = True
-
-        # --- Mist animation ---
-        mist_frame = None
-        if MIST_ANIM:
-            MIST_ANIM.update(dt)
-            mist_frame = MIST_ANIM.current()
-
-        # --- Movement & walking SFX (blocked by any modal) ---
-        any_modal_open = bag_ui.is_open() or party_manager.is_open() or ledger.is_open()
-        keys = pygame.key.get_pressed()
-        walking_forward = keys[pygame.K_w] and not any_modal_open
-
-        if not hasattr(gs, "is_walking"):
-            gs.is_walking = False
-            gs.walking_channel = None
-        if walking_forward and not gs.is_walking:
-            sfx = AUDIO.sfx.get("Walking") or AUDIO.sfx.get("walking")
-            if sfx:
-                gs.walking_channel = sfx.play(loops=-1, fade_ms=80)
-            gs.is_walking = True
-        elif not walking_forward and gs.is_walking:
-            if gs.walking_channel:
-                gs.walking_channel.stop()
-            gs.is_walking = False
-            gs.walking_channel = None
-
-        if walking_forward:
-            gs.walk_anim.update(dt)
-            frame = gs.walk_anim.current()
-            if frame is not None:
-                gs.player_image = frame
-        else:
-            gs.walk_anim.reset()
-            gs.player_image = gs.player_idle
+            frame_profiler.stop("events", t_events)
 
-        # --- Encounters / world update ---
-        if gs.in_encounter:
-            if gs.encounter_stats and not getattr(gs, "_went_to_wild", False):
-                try:
-                    pygame.mixer.music.fadeout(200)
-                except Exception:
-                    pass
-                ch = getattr(gs, "walking_channel", None)
-                if ch:
-                    try: ch.stop()
-                    except Exception: pass
+            # --- Mist animation ---
+            mist_frame = None
+            if MIST_ANIM:
+                MIST_ANIM.update(dt)
+                mist_frame = MIST_ANIM.current()
+
+            # --- Movement & walking SFX (blocked by any modal) ---
+            any_modal_open = bag_ui.is_open() or party_manager.is_open() or ledger.is_open()
+            keys = pygame.key.get_pressed()
+            walking_forward = keys[pygame.K_w] and not any_modal_open
+
+            if not hasattr(gs, "is_walking"):
                 gs.is_walking = False
                 gs.walking_channel = None
-                gs._went_to_wild = True
-                mode = MODE_WILD_VESSEL
-
-            # NEW: summoner (trainer) encounter – no stats attached
-            elif gs.encounter_sprite is not None and not getattr(gs, "_went_to_summoner", False):
-                try:
-                    pygame.mixer.music.fadeout(200)
-                except Exception:
-                    pass
-                ch = getattr(gs, "walking_channel", None)
-                if ch:
-                    try: ch.stop()
-                    except Exception: pass
+            if walking_forward and not gs.is_walking:
+                sfx = AUDIO.sfx.get("Walking") or AUDIO.sfx.get("walking")
+                if sfx:
+                    gs.walking_channel = sfx.play(loops=-1, fade_ms=80)
+                gs.is_walking = True
+            elif not walking_forward and gs.is_walking:
+                if gs.walking_channel:
+                    gs.walking_channel.stop()
                 gs.is_walking = False
                 gs.walking_channel = None
-                gs._went_to_summoner = True
-                mode = MODE_SUMMONER_BATTLE
 
+            if walking_forward:
+                gs.walk_anim.update(dt)
+                frame = gs.walk_anim.current()
+                if frame is not None:
+                    gs.player_image = frame
             else:
-                update_encounter_popup(screen, dt, gs, mist_frame, S.WIDTH, S.HEIGHT, pg)
-        else:
-            if not any_modal_open:
-                world.update_player(gs, dt, gs.player_half)
-            actors.update_rivals(gs, dt, gs.player_half)
-            actors.update_vessels(gs, dt, gs.player_half, VESSELS, RARE_VESSELS)
-            try_trigger_encounter(gs, RIVAL_SUMMONERS)
-
-            cam = world.get_camera_offset(gs.player_pos, S.WIDTH, S.HEIGHT, gs.player_half)
-            world.draw_repeating_road(screen, cam.x, cam.y)
-            pg.update_needed(cam.y, S.HEIGHT)
-            pg.draw_props(screen, cam.x, cam.y, S.WIDTH, S.HEIGHT)
-            actors.draw_vessels(screen, cam, gs, mist_frame, S.DEBUG_OVERWORLD)
-            actors.draw_rivals(screen, cam, gs)
-
-            screen.blit(
-                gs.player_image,
-                (gs.player_pos.x - cam.x - gs.player_half.x,
-                gs.player_pos.y - cam.y - gs.player_half.y)
-            )
-
-        # --- Draw HUD then modals (z-order: Bag < Party Manager < Ledger) ---
-        party_ui.draw_party_hud(screen, gs)
-        if bag_ui.is_open():
-            bag_ui.draw_popup(screen, gs)
-        if party_manager.is_open():
-            party_manager.draw(screen, gs)
-        if ledger.is_open():
-            ledger.draw(screen, gs)
+                gs.walk_anim.reset()
+                gs.player_image = gs.player_idle
+
+            # --- Encounters / world update ---
+            if gs.in_encounter:
+                if gs.encounter_stats and not getattr(gs, "_went_to_wild", False):
+                    try:
+                        pygame.mixer.music.fadeout(200)
+                    except Exception:
+                        pass
+                    ch = getattr(gs, "walking_channel", None)
+                    if ch:
+                        try: ch.stop()
+                        except Exception: pass
+                    gs.is_walking = False
+                    gs.walking_channel = None
+                    gs._went_to_wild = True
+                    mode = MODE_WILD_VESSEL
+
+                # NEW: summoner (trainer) encounter – no stats attached
+                elif gs.encounter_sprite is not None and not getattr(gs, "_went_to_summoner", False):
+                    try:
+                        pygame.mixer.music.fadeout(200)
+                    except Exception:
+                        pass
+                    ch = getattr(gs, "walking_channel", None)
+                    if ch:
+                        try: ch.stop()
+                        except Exception: pass
+                    gs.is_walking = False
+                    gs.walking_channel = None
+                    gs._went_to_summoner = True
+                    mode = MODE_SUMMONER_BATTLE
+
+                else:
+                    update_encounter_popup(screen, dt, gs, mist_frame, S.WIDTH, S.HEIGHT, pg)
+            else:
+                if not any_modal_open:
+                    with frame_profiler.span("world.update_player"):
+                        world.update_player(gs, dt, gs.player_half)
+                with frame_profiler.span("actors.update"):
+                    actors.update_rivals(gs, dt, gs.player_half)
+                    actors.update_vessels(gs, dt, gs.player_half, VESSELS, RARE_VESSELS)
+                    try_trigger_encounter(gs, RIVAL_SUMMONERS)
+
+                cam = world.get_camera_offset(gs.player_pos, S.WIDTH, S.HEIGHT, gs.player_half)
+                with frame_profiler.span("procgen.update"):
+                    pg.reseed(getattr(gs, "run_seed", pg.seed))
+                    pg.update_needed(cam.y, S.HEIGHT)
+
+                # Standing still with no modal/fade: repaint only what changed
+                full = OVERWORLD_DIRTY.begin(
+                    cam,
+                    force_full=(any_modal_open or getattr(gs, "fade_alpha", 0) > 0
+                                or frame_profiler.enabled),
+                )
+                track_overworld(OVERWORLD_DIRTY, gs, cam, mist_frame)
+                for clip in ([None] if full else OVERWORLD_DIRTY.regions()):
+                    screen.set_clip(clip)
+                    with frame_profiler.span("procgen.draw_world"):
+                        pg.draw_world(screen, cam.x, cam.y, S.WIDTH, S.HEIGHT)
+                    with frame_profiler.span("actors.draw"):
+                        actors.draw_vessels(screen, cam, gs, mist_frame, S.DEBUG_OVERWORLD)
+                        actors.draw_rivals(screen, cam, gs)
+
+                    screen.blit(
+                        gs.player_image,
+                        (gs.player_pos.x - cam.x - gs.player_half.x,
+                        gs.player_pos.y - cam.y - gs.player_half.y)
+                    )
+                    with frame_profiler.span("party_ui.hud"):
+                        party_ui.draw_party_hud(screen, gs)
+                screen.set_clip(None)
+
+            if gs.in_encounter:
+                with frame_profiler.span("party_ui.hud"):
+                    party_ui.draw_party_hud(screen, gs)
+
+            # --- Modals over the HUD (z-order: Bag < Party Manager < Ledger) ---
+            # (an open modal or fade forces a full overworld frame, see begin())
+            with frame_profiler.span("modals"):
+                if bag_ui.is_open():
+                    bag_ui.draw_popup(screen, gs)
+                if party_manager.is_open():
+                    party_manager.draw(screen, gs)
+                if ledger.is_open():
+                    ledger.draw(screen, gs)
+
+            update_and_draw_fade(screen, dt, gs)
+            if gs.in_encounter:
+                present(screen)
+            else:
+                present_overworld(screen)
 
-        update_and_draw_fade(screen, dt, gs)
-        pygame.display.flip()
+        frame_profiler.end_frame()
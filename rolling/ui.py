@@ -5,6 +5,7 @@ import os
 import pygame, re
 import settings as S
 from systems import audio as audio_sys
+from systems import fonts
 
 _active = None           # {"text": str}
 _blink_t = 0.0           # blink timer for the prompt
@@ -30,18 +31,11 @@ def _resolve_dh_font() -> str | None:
     return None
 
 def _get_font(size, bold=False):
-    """Prefer DH font from Assets/Fonts; fall back to a system font."""
-    try:
-        path = _resolve_dh_font()
-        if path:
-            return pygame.font.Font(path, size)
-    except Exception as e:
-        print(f"⚠️ Failed to load DH font: {e}")
-    # fallback
-    try:
-        return pygame.font.SysFont("arial", size, bold=bold)
-    except Exception:
-        return pygame.font.Font(None, size)
+    """Prefer DH font from Assets/Fonts; fall back to a system font (both cached in systems.fonts)."""
+    path = _resolve_dh_font()
+    if path:
+        return fonts.get(path, size)
+    return fonts.get("arial", size, bold)
 
 # ---------- public: hook for roller.set_roll_callback ----------
 def _on_roll(kind, result):
@@ -108,7 +102,7 @@ def draw_roll_popup(screen, dt):
 
     y = text_rect.y
     for line in lines:
-        surf = font.render(line, False, (16, 16, 16))  # crisp, no antialias
+        surf = fonts.render(font, line, (16, 16, 16), antialias=False)  # crisp, no antialias
         screen.blit(surf, (text_rect.x, y))
         y += surf.get_height() + 6
 
@@ -116,28 +110,17 @@ def draw_roll_popup(screen, dt):
     if blink_on:
         prompt = "Press Enter to continue"
         pfont  = _get_font(20)
-        psurf  = pfont.render(prompt, False, (40, 40, 40))
+        psurf  = fonts.render(pfont, prompt, (40, 40, 40), antialias=False)
         px = rect.right - 14 - psurf.get_width()
         py = rect.bottom - 12 - psurf.get_height()
         # light highlight for readability
-        shadow = pfont.render(prompt, False, (235, 235, 235))
+        shadow = fonts.render(pfont, prompt, (235, 235, 235), antialias=False)
         screen.blit(shadow, (px - 1, py - 1))
         screen.blit(psurf, (px, py))
 
 # ---------- helpers ----------
 def _wrap(text, font, max_w):
-    words = text.split()
-    lines, cur = [], ""
-    for w in words:
-        test = (cur + " " + w).strip()
-        if not cur or font.size(test)[0] <= max_w:
-            cur = test
-        else:
-            lines.append(cur)
-            cur = w
-    if cur:
-        lines.append(cur)
-    return lines
+    return fonts.wrap(text, font, max_w)
 
 def _clean_roll_text(s: str) -> str:
     """Remove leading 'Check:', 'Save:', 'Attack:', 'Damage:' and normalize arrow."""
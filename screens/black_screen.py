@@ -6,6 +6,7 @@ import settings as S
 from systems import ui
 from systems import party_ui
 from systems import audio as audio_sys
+from systems import asset_cache, asset_index
 
 
 def enter(gs, **_):
@@ -14,14 +15,10 @@ def enter(gs, **_):
         return
 
     def safe_load(path):
-        try:
-            if os.path.exists(path):
-                return pygame.image.load(path).convert_alpha()
-            else:
-                print(f"ℹ️ Missing image: {path}")
-        except Exception as e:
-            print(f"⚠️ Failed to load '{path}': {e}")
-        return None
+        img = asset_cache.load_image(path)
+        if img is None and not asset_index.exists(path):
+            print(f"ℹ️ Missing image: {path}")
+        return img
 
     barb  = safe_load(os.path.join("Assets", "Map", "BarbarianL.png"))
     dru   = safe_load(os.path.join("Assets", "Map", "DruidL.png"))
@@ -68,7 +65,7 @@ def enter(gs, **_):
                 print(f"ℹ️ No starters found for {prefix}")
                 return None, None
             choice = random.choice(paths)
-            surf = pygame.image.load(choice).convert_alpha()
+            surf = asset_cache.load_image(choice)
             base = os.path.splitext(os.path.basename(choice))[0]  # e.g., StarterBarbarian2
             return surf, base
         except Exception as e:
@@ -197,8 +194,8 @@ def handle(events, gs, saves=None, audio_bank=None, **_):
                     if starter_name:
                         token_basename = starter_name.replace("Starter", "StarterToken") + ".png"
                         token_path = os.path.join("Assets", "Starters", token_basename)
-                        if os.path.exists(token_path):
-                            token_surf = pygame.image.load(token_path).convert_alpha()
+                        token_surf = asset_cache.load_image(token_path)
+                        if token_surf is not None:
 
                             if not getattr(gs, "party_slots", None):
                                 gs.party_slots = [None] * 6
@@ -1,10 +1,99 @@
 # =============================================================
 # screens/intro_video.py (audio now respects SFX master volume)
+#  - Frames are decoded, converted and scaled on a background
+#    thread into a bounded queue; draw() only blits
+#  - Playback follows dt: late frames are dropped, not slowed
+#  - First full playback is recorded to a raw frame cache
+#    (systems/video_cache.py); later runs mmap it, no decoder
 # =============================================================
 
-import os, pygame
+import os, queue, threading, pygame
 import settings as S
 from systems import audio as audio_sys  # <-- NEW
+from systems import video_cache
+
+_END = object()  # decoder -> renderer: no more frames
+
+# ---------- Background decoder ----------
+class _FrameDecoder(threading.Thread):
+    """
+    Pulls frames (H x W x 3 uint8) from `frames`, converts + scales them to
+    fit `target` and queues (index, Surface). The bounded queue keeps the
+    decoder only a few frames ahead; draw() never decodes or scales.
+    """
+    def __init__(self, frames, target, depth, recorder=None):
+        super().__init__(name="intro-decoder", daemon=True)
+        self.frames = frames
+        self.target = target
+        self.recorder = recorder
+        self.q = queue.Queue(maxsize=max(1, int(depth)))
+        self.stop_evt = threading.Event()
+
+    def _convert(self, frame):
+        import numpy as np
+        surf = pygame.surfarray.make_surface(np.swapaxes(frame, 0, 1))
+        fw, fh = surf.get_size()
+        sw, sh = self.target
+        scale = min(sw / fw, sh / fh)
+        tw, th = max(1, int(fw * scale)), max(1, int(fh * scale))
+        return surf if (tw, th) == (fw, fh) else pygame.transform.smoothscale(surf, (tw, th))
+
+    def _put(self, item) -> bool:
+        while not self.stop_evt.is_set():
+            try:
+                self.q.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _record(self, surf):
+        if self.recorder is None:
+            return
+        try:
+            self.recorder.write(surf)
+        except Exception as e:
+            print(f"⚠️ Intro cache disabled for this run: {e}")
+            self.recorder.abort()
+            self.recorder = None
+
+    def run(self):
+        idx = 0
+        try:
+            for frame in self.frames:
+                if self.stop_evt.is_set():
+                    break
+                surf = self._convert(frame)
+                self._record(surf)
+                if not self._put((idx, surf)):
+                    break
+                idx += 1
+            else:
+                # only a clip decoded to the end is worth keeping
+                if self.recorder is not None:
+                    self.recorder.finish()
+                    self.recorder = None
+        except Exception as e:
+            print(f"[video] frame error: {e}")
+        if self.recorder is not None:
+            self.recorder.abort()
+            self.recorder = None
+        self._put(_END)
+
+    def stop(self):
+        self.stop_evt.set()
+        self.join(timeout=1.0)
+
+def _start_decoder(v: dict, frames, vid_path: str):
+    recorder = None
+    if getattr(S, "INTRO_CACHE_ENABLED", True):
+        try:
+            recorder = video_cache.Recorder(vid_path, (S.WIDTH, S.HEIGHT), v["fps"])
+        except Exception as e:
+            print(f"⚠️ Intro cache unavailable: {e}")
+    dec = _FrameDecoder(frames, (S.WIDTH, S.HEIGHT), getattr(S, "INTRO_QUEUE_FRAMES", 8), recorder)
+    v.update(decoder=dec, t=0.0, pending=None, frame_surf=None)
+    dec.start()
 
 def _video_paths_for_class(cls_key: str):
     base = os.path.join("Assets", "Map")
@@ -19,6 +108,18 @@ def _video_paths_for_class(cls_key: str):
     audio_path = aud_mp3 if os.path.exists(aud_mp3) else (aud_wav if os.path.exists(aud_wav) else None)
     return vid, audio_path
 
+def _play_audio(aud_path):
+    """Start the intro soundtrack (honors SFX master volume); returns the Sound or None."""
+    if not aud_path:
+        return None
+    try:
+        snd = pygame.mixer.Sound(aud_path)
+        audio_sys.play_sound(snd)
+        return snd
+    except Exception as e:
+        print(f"⚠️ Could not play audio '{aud_path}': {e}")
+        return None
+
 def enter(gs, **_):
     # initialize video object once
     if hasattr(gs, "_video"): return
@@ -28,6 +129,18 @@ def enter(gs, **_):
         gs._video = {"backend": None, "done": True}
         return
 
+    # pre-transcoded frames (no decoder needed)
+    if getattr(S, "INTRO_CACHE_ENABLED", True):
+        raw = video_cache.open_clip(vid_path, (S.WIDTH, S.HEIGHT))
+        if raw is not None:
+            snd = _play_audio(aud_path)
+            gs._video = {
+                "backend":"raw","clip":raw,"fps":raw.fps,"done":False,
+                "t":0.0,"frame_surf":None,"snd":snd
+            }
+            print(f"▶️ Intro ready (cached): {os.path.basename(vid_path)} ({'with audio' if snd else 'silent'}) @ {raw.fps:g} fps")
+            return
+
     # try moviepy
     try:
         import moviepy.editor as mpy
@@ -35,20 +148,14 @@ def enter(gs, **_):
         fps = max(1, int(round(clip.fps or 24)))
 
         # --- AUDIO (mastered) ---
-        snd = None
-        if aud_path:
-            try:
-                snd = pygame.mixer.Sound(aud_path)
-                audio_sys.play_sound(snd)  # honors SFX master volume
-            except Exception as e:
-                print(f"⚠️ Could not play audio '{aud_path}': {e}")
+        snd = _play_audio(aud_path)
 
         frame_gen = clip.iter_frames(fps=fps, dtype="uint8")
         gs._video = {
-            "backend":"moviepy","clip":clip,"fps":fps,"acc":0.0,
-            "frame_gen":frame_gen,"frame_surf":None,"done":False,
+            "backend":"moviepy","clip":clip,"fps":fps,"done":False,
             "snd": snd  # store Sound so we can .stop() on teardown
         }
+        _start_decoder(gs._video, frame_gen, vid_path)
         print(f"▶️ Intro ready (moviepy): {os.path.basename(vid_path)} ({'with audio' if snd else 'silent'}) @ {fps} fps")
         return
     except Exception as e:
@@ -63,19 +170,13 @@ def enter(gs, **_):
         fps = int(round(meta.get("fps", 24))) if meta.get("fps") else 24
 
         # --- AUDIO (mastered) ---
-        snd = None
-        if aud_path:
-            try:
-                snd = pygame.mixer.Sound(aud_path)
-                audio_sys.play_sound(snd)  # honors SFX master volume
-            except Exception as e:
-                print(f"⚠️ Could not play audio '{aud_path}': {e}")
+        snd = _play_audio(aud_path)
 
         gs._video = {
-            "backend":"imageio","reader":iter(reader),"fps":max(1,fps),
-            "acc":0.0,"frame_surf":None,"done":False,"_close":reader,
+            "backend":"imageio","fps":max(1,fps),"done":False,"_close":reader,
             "snd": snd
         }
+        _start_decoder(gs._video, iter(reader), vid_path)
         print(f"▶️ Intro ready (imageio): {os.path.basename(vid_path)} ({'with audio' if snd else 'silent'}) @ {fps} fps")
     except Exception as e:
         print(f"⚠️ Failed to init video fallback: {e}")
@@ -90,7 +191,11 @@ def _teardown(gs):
             try: v["snd"].stop()
             except Exception: pass
 
-        if v.get("backend") == "moviepy":
+        # decoder must be parked before its reader/clip is closed
+        if v.get("decoder"):
+            v["decoder"].stop()
+
+        if v.get("backend") in ("moviepy", "raw"):
             if v.get("clip"): v["clip"].close()
         elif v.get("backend") == "imageio":
             closer = v.get("_close")
@@ -115,36 +220,47 @@ def handle(events, gs, dt, **_):
             return S.MODE_GAME
     return None
 
+def _take_frame(v: dict):
+    """
+    Advance the playback clock to the newest decoded frame that is due.
+    Late frames are dropped (timestamp = index / fps) so a slow render
+    skips ahead instead of slowing the video down.
+    """
+    due = int(v["t"] * v["fps"])
+    q = v["decoder"].q
+    while True:
+        item = v["pending"]
+        if item is None:
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                return
+        v["pending"] = None
+        if item is _END:
+            v["done"] = True
+            return
+        idx, surf = item
+        if idx > due:
+            v["pending"] = item   # early: hold it for a later frame
+            return
+        v["frame_surf"] = surf
+
 def draw(screen, gs, dt, **_):
     screen.fill((0, 0, 0))
     v = getattr(gs, "_video", None)
     if not v or v.get("done"):
         _teardown(gs)
         return
-    step = 1.0 / max(1e-6, v["fps"])
-    v["acc"] += dt
-    while v["acc"] >= step and not v["done"]:
-        v["acc"] -= step
-        try:
-            if v.get("backend") == "moviepy":
-                frame = next(v["frame_gen"])
-            else:
-                frame = next(v["reader"])
-            import numpy as np
-            frame = np.swapaxes(frame, 0, 1)
-            v["frame_surf"] = pygame.surfarray.make_surface(frame)
-        except StopIteration:
+    v["t"] += dt
+    if v.get("backend") == "raw":
+        raw = v["clip"]
+        idx = int(v["t"] * raw.fps)
+        if idx >= raw.count:
             v["done"] = True
-            break
-        except Exception as e:
-            print(f"[video] frame error: {e}")
-            v["done"] = True
-            break
+        v["frame_surf"] = raw.frame(idx)
+    else:
+        _take_frame(v)
     if v.get("frame_surf"):
-        fw, fh = v["frame_surf"].get_width(), v["frame_surf"].get_height()
-        sw, sh = S.WIDTH, S.HEIGHT
-        scale = min(sw / fw, sh / fh)
-        tw, th = max(1, int(fw * scale)), max(1, int(fh * scale))
-        scaled = pygame.transform.smoothscale(v["frame_surf"], (tw, th))
-        rect = scaled.get_rect(center=(sw // 2, sh // 2))
-        screen.blit(scaled, rect)
+        surf = v["frame_surf"]
+        rect = surf.get_rect(center=(S.WIDTH // 2, S.HEIGHT // 2))
+        screen.blit(surf, rect)
@@ -7,11 +7,13 @@
 import os
 import re
 import zlib
+from collections import OrderedDict
 import pygame
 import settings as S
 
 from systems import audio as audio_sys
 from systems import save_system as saves
+from systems import asset_cache, asset_index, scale_cache, fonts, surface_pool
 from rolling.roller import Roller
 from combat.vessel_stats import generate_vessel_stats_from_asset
 from combat.stats import build_stats                         # ✅ rebuild without rerolling abilities
@@ -177,12 +179,12 @@ def _draw_xp_bar(surface: pygame.Surface, rect: pygame.Rect, stats: dict):
     inner = rect.inflate(-10, -10)
 
     # Text: "XP: cur / need"
-    font = pygame.font.SysFont("georgia", max(16, int(rect.h * 0.55)), bold=False)
+    font = fonts.get("georgia", max(16, int(rect.h * 0.55)), bold=False)
     label = font.render(f"XP: {cur} / {need}", True, text)
     surface.blit(label, label.get_rect(midleft=(inner.x + 6, inner.centery)))
 
     # Level tag (left of bar)
-    lvl_font = pygame.font.SysFont("georgia", max(12, int(rect.h * 0.46)), bold=True)
+    lvl_font = fonts.get("georgia", max(12, int(rect.h * 0.46)), bold=True)
     lvl_lbl  = lvl_font.render(f"Lv {level}", True, text)
 
     # Slim bar on the right
@@ -203,15 +205,11 @@ def _draw_xp_bar(surface: pygame.Surface, rect: pygame.Rect, stats: dict):
 
 
 # ---------- Image helpers ----------
-def _try_load(path: str | None):
-    if not path:
-        return None
-    if os.path.exists(path):
-        try:
-            return pygame.image.load(path).convert_alpha()
-        except Exception as e:
-            print(f"⚠️ load fail {path}: {e}")
-    return None
+_try_load = asset_cache.load_image
+
+def _asset(sub: str, fname: str) -> str | None:
+    """Indexed path of Assets/<sub>/<fname> (no filesystem probing)."""
+    return asset_index.find(fname, (os.path.join("Assets", sub),))
 
 def _get_popup_bg() -> pygame.Surface | None:
     """Legacy single background image, scaled & cached."""
@@ -251,7 +249,7 @@ def _fit_center(surf: pygame.Surface, rect: pygame.Rect) -> tuple[pygame.Surface
     iw, ih = surf.get_size()
     scale = min(rect.w / iw, rect.h / ih)
     nw, nh = max(1, int(iw * scale)), max(1, int(ih * scale))
-    scaled = pygame.transform.smoothscale(surf, (nw, nh))
+    scaled = scale_cache.scaled(surf, (nw, nh))
     dest = scaled.get_rect(center=rect.center)
     return scaled, dest
 
@@ -261,27 +259,23 @@ def _full_vessel_from_token_name(token_name: str | None) -> pygame.Surface | Non
     base = os.path.splitext(os.path.basename(token_name))[0]
     if base.startswith("StarterToken"):
         body = base.replace("StarterToken", "", 1)
-        return _try_load(os.path.join("Assets", "Starters", f"Starter{body}.png"))
+        return _try_load(_asset("Starters", f"Starter{body}.png"))
     if base.startswith("MToken"):
         body = base.replace("MToken", "", 1)
-        return _try_load(os.path.join("Assets", "VesselsMale", f"MVessel{body}.png"))
+        return _try_load(_asset("VesselsMale", f"MVessel{body}.png"))
     if base.startswith("FToken"):
         body = base.replace("FToken", "", 1)
-        return _try_load(os.path.join("Assets", "VesselsFemale", f"FVessel{body}.png"))
+        return _try_load(_asset("VesselsFemale", f"FVessel{body}.png"))
     if base.startswith("RToken"):
         body = base.replace("RToken", "", 1)
-        p1 = os.path.join("Assets", "RareVessels", f"RVessel{body}.png")
-        img = _try_load(p1)
+        img = _try_load(_asset("RareVessels", f"RVessel{body}.png"))
         if img:
             return img
         m = re.match(r"([A-Za-z]+)", body)
         if m:
-            return _try_load(os.path.join("Assets", "RareVessels", f"RVessel{m.group(1)}.png"))
-    for d in ("Starters", "VesselsMale", "VesselsFemale", "RareVessels"):
-        img = _try_load(os.path.join("Assets", d, f"{base}.png"))
-        if img:
-            return img
-    return None
+            return _try_load(_asset("RareVessels", f"RVessel{m.group(1)}.png"))
+    return _try_load(asset_index.find(f"{base}.png", tuple(os.path.join("Assets", d) for d in
+        ("Starters", "VesselsMale", "VesselsFemale", "RareVessels"))))
 
 # ---------- Public: modal control ----------
 def is_open() -> bool:
@@ -290,7 +284,9 @@ def is_open() -> bool:
 def open(gs, slot_index: int):
     """Open for a specific party slot (roll stats if missing / repair if stale)."""
     _ensure_stats_for_slot(gs, slot_index)
+    _sync_page_stamps(gs)
     _set_state(slot_index, "in")
+    _prefetch_pages(gs, slot_index)
     _play_book_sfx()
 
 def close():
@@ -368,6 +364,7 @@ def _repair_existing_stats_if_needed(gs, slot_index: int, token_name: str):
                 notes="Migrated to current AC/HP rules (ledger auto-repair)",
             ).to_dict()
             gs.party_vessel_stats[slot_index] = fixed
+            invalidate_pages(slot_index)
             try:
                 saves.save_game(gs)
             except Exception as e:
@@ -431,11 +428,111 @@ def _ensure_stats_for_slot(gs, slot_index: int):
         notes="Rolled on add to party",
     )
     gs.party_vessel_stats[slot_index] = stats
+    invalidate_pages(slot_index)
     try:
         saves.save_game(gs)
     except Exception as e:
         print(f"⚠️ Save after rolling stats failed (slot {slot_index}): {e}")
 
+# ---------- Composed page cache ----------
+# (slot, w, h) -> {"sig": tuple, "surf": Surface}. A page is art + text
+# rendered once onto a layer at the open book size (the fly-in scales
+# that layer); it is rebuilt when the slot's token or stats dict changes
+# or _page_version is bumped. Stats edited in place (XP, HP, level-ups)
+# are caught by _sync_page_stamps() when the ledger opens.
+_PAGE_CACHE_MAX = 18
+_page_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_page_version = 0
+_stats_stamps: dict = {}   # slot -> repr of the stats the cached page was drawn from
+
+def invalidate_pages(slot: int | None = None):
+    """Drop composed pages (one slot, or all)."""
+    global _page_version
+    if slot is None:
+        _page_cache.clear()
+        _stats_stamps.clear()
+        _page_version += 1
+        return
+    for key in [k for k in _page_cache if k[0] == slot]:
+        del _page_cache[key]
+    _stats_stamps.pop(slot, None)
+
+def _sync_page_stamps(gs):
+    """On open / slot change: drop pages whose stats changed since they were drawn."""
+    stats = getattr(gs, "party_vessel_stats", None) or []
+    for idx in range(max(1, _slot_count(gs))):
+        st = stats[idx] if idx < len(stats) else None
+        stamp = repr(st) if isinstance(st, dict) else None
+        if _stats_stamps.get(idx, ...) != stamp:
+            invalidate_pages(idx)
+        _stats_stamps[idx] = stamp
+
+def _page_signature(gs, slot: int) -> tuple:
+    names = getattr(gs, "party_slots_names", None) or []
+    token = names[slot] if 0 <= slot < len(names) else None
+    stats = getattr(gs, "party_vessel_stats", None) or []
+    st = stats[slot] if 0 <= slot < len(stats) else None
+    return (_page_version, token, id(st) if isinstance(st, dict) else None)
+
+def _composed_pages(gs, slot: int, size_wh: tuple[int, int]) -> pygame.Surface | None:
+    w, h = max(1, int(size_wh[0])), max(1, int(size_wh[1]))
+    key = (slot, w, h)
+    sig = _page_signature(gs, slot)
+    entry = _page_cache.get(key)
+    if entry is not None and entry["sig"] == sig:
+        _page_cache.move_to_end(key)
+        return entry["surf"]
+
+    layer = pygame.Surface((w, h), pygame.SRCALPHA)
+    try:
+        _render_pages(layer, gs, slot, (0, 0), (w, h))
+    except Exception as e:
+        print(f"⚠️ Ledger page render failed (slot {slot}): {e}")
+        return None
+    _page_cache[key] = {"sig": sig, "surf": layer}
+    _page_cache.move_to_end(key)
+    while len(_page_cache) > _PAGE_CACHE_MAX:
+        _page_cache.popitem(last=False)
+    return layer
+
+def _prefetch_pages(gs, slot: int):
+    """Compose `slot` and its neighbours at the open book size (only slots that already have stats)."""
+    book = _last_layout.get("book")
+    base_bg = _get_popup_bg()
+    size = base_bg.get_size() if base_bg is not None else (book.size if book else None)
+    if size is None:
+        return
+    n = max(1, _slot_count(gs))
+    stats = getattr(gs, "party_vessel_stats", None) or []
+    for idx in {slot % n, (slot - 1) % n, (slot + 1) % n}:
+        if idx < len(stats) and isinstance(stats[idx], dict):
+            _composed_pages(gs, idx, size)
+
+# ---------- Open-animation book ladder ----------
+# The fly-in scales the book from _SCALE_MIN to 1.0; instead of a
+# smoothscale every frame, pick the nearest of a few pre-scaled rungs.
+_LADDER_STEPS = 6
+_book_ladder: dict = {"src": None, "rungs": []}   # rungs: [(scale, Surface)]
+
+def _ensure_book_ladder(base_bg: pygame.Surface | None):
+    if base_bg is None or _book_ladder["src"] is base_bg:
+        return
+    bw, bh = base_bg.get_size()
+    rungs = []
+    for i in range(_LADDER_STEPS):
+        scale = _SCALE_MIN + (1.0 - _SCALE_MIN) * i / _LADDER_STEPS
+        size = (max(1, int(bw * scale)), max(1, int(bh * scale)))
+        rungs.append((scale, pygame.transform.smoothscale(base_bg, size)))
+    _book_ladder["src"] = base_bg
+    _book_ladder["rungs"] = rungs
+
+def _book_rung(base_bg: pygame.Surface, scale: float) -> pygame.Surface:
+    _ensure_book_ladder(base_bg)
+    rungs = _book_ladder["rungs"]
+    if not rungs:
+        return base_bg
+    return min(rungs, key=lambda r: abs(r[0] - scale))[1]
+
 # ---------- Slot navigation ----------
 def _slot_count(gs) -> int:
     names = getattr(gs, "party_slots_names", None)
@@ -456,6 +553,8 @@ def _change_slot(gs, delta: int):
     _state["t"] = 1.0
 
     _ensure_stats_for_slot(gs, new_idx)
+    _sync_page_stamps(gs)
+    _prefetch_pages(gs, new_idx)
     _play_book_sfx()
 
     # kick a page-turn animation (dir>0 = right/next, dir<0 = left/prev)
@@ -557,10 +656,7 @@ def draw(screen: pygame.Surface, gs):
         return
 
     # Dim overlay
-    overlay_alpha = int(_OVERLAY_MAX_A * prog)
-    overlay = pygame.Surface((S.WIDTH, S.HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, overlay_alpha))
-    screen.blit(overlay, (0, 0))
+    surface_pool.dim(screen, int(_OVERLAY_MAX_A * prog))
 
     # ---- Base+Anim Pages: always end on PartyLedger.png ----
     base_bg = _get_popup_bg()           # PartyLedger.png (scaled & cached)
@@ -598,8 +694,8 @@ def draw(screen: pygame.Surface, gs):
         sby = by_target + slide_y
         screen.blit(base_bg, (sbx, sby))
     else:
-        sbw, sbh = max(1, int(bw * scale)), max(1, int(bh * scale))
-        sb_base = pygame.transform.smoothscale(base_bg, (sbw, sbh))
+        sb_base = _book_rung(base_bg, scale)
+        sbw, sbh = sb_base.get_size()
         sbx = (S.WIDTH - sbw) // 2
         sby = (S.HEIGHT - sbh) // 2 + slide_y
         screen.blit(sb_base, (sbx, sby))
@@ -610,8 +706,8 @@ def draw(screen: pygame.Surface, gs):
     # If we have anim pages AND a page-turn is active, draw them as a 2-step wipe over the base
     if bg1 and bg2 and _page_anim is not None:
         # scale anim frames to the same size as base for perfect alignment
-        sbg1 = pygame.transform.smoothscale(bg1, (sbw, sbh)) if (bg1.get_width(), bg1.get_height()) != (sbw, sbh) else bg1
-        sbg2 = pygame.transform.smoothscale(bg2, (sbw, sbh)) if (bg2.get_width(), bg2.get_height()) != (sbw, sbh) else bg2
+        sbg1 = scale_cache.scaled(bg1, (sbw, sbh))
+        sbg2 = scale_cache.scaled(bg2, (sbw, sbh))
 
         now = pygame.time.get_ticks()
         dt = max(0, (now - _page_anim.get("last_ms", now)) / 1000.0)
@@ -668,11 +764,21 @@ def draw(screen: pygame.Surface, gs):
 
 # ---------- Content (art + text) ----------
 def draw_pages(screen: pygame.Surface, gs, origin_xy: tuple[int, int], size_wh: tuple[int, int]):
+    slot = _state.get("slot", 0) if _state else 0
+    base_bg = _get_popup_bg()
+    full_wh = base_bg.get_size() if base_bg is not None else size_wh
+    layer = _composed_pages(gs, slot, full_wh)
+    if layer is None:
+        return
+    if tuple(size_wh) != tuple(full_wh):
+        # fly-in rung: scale the open-size page rather than composing one per rung
+        layer = scale_cache.scaled(layer, size_wh)
+    screen.blit(layer, origin_xy)
+
+def _render_pages(screen: pygame.Surface, gs, slot: int, origin_xy: tuple[int, int], size_wh: tuple[int, int]):
     bx, by = origin_xy
     bw, bh = size_wh
 
-    slot = _state.get("slot", 0) if _state else 0
-
     token_name = ""
     if getattr(gs, "party_slots_names", None) and 0 <= slot < len(gs.party_slots_names):
         token_name = gs.party_slots_names[slot] or ""
@@ -705,7 +811,7 @@ def draw_pages(screen: pygame.Surface, gs, origin_xy: tuple[int, int], size_wh:
         scaled, _ = _fit_center(vessel, art_rect)
         shrink = 0.65
         nw, nh = int(scaled.get_width() * shrink), int(scaled.get_height() * shrink)
-        scaled = pygame.transform.smoothscale(scaled, (nw, nh))
+        scaled = scale_cache.scaled(scaled, (nw, nh))
         dest = scaled.get_rect(center=left_page.center)
         screen.blit(scaled, dest.topleft)
 
@@ -5,6 +5,7 @@ import pygame, os
 import settings as S
 from systems import ui
 from systems import audio as audio_sys
+from systems import scale_cache
 
 def enter(gs, screen=None, fonts=None, menu_bg=None, audio_bank=None, **_):
     # lazy cache of menu art
@@ -34,7 +35,7 @@ def draw(screen, gs, fonts=None, **kwargs):
     if bg:
         iw, ih = bg.get_width(), bg.get_height()
         scale = max(S.WIDTH / iw, S.HEIGHT / ih)
-        bg_scaled = pygame.transform.smoothscale(bg, (int(iw * scale), int(ih * scale)))
+        bg_scaled = scale_cache.scaled(bg, (int(iw * scale), int(ih * scale)))
         bx = (S.WIDTH - bg_scaled.get_width()) // 2
         by = (S.HEIGHT - bg_scaled.get_height()) // 2
         screen.blit(bg_scaled, (bx, by))
@@ -47,7 +48,7 @@ def draw(screen, gs, fonts=None, **kwargs):
         target_h = int(S.HEIGHT * 0.9)
         iw, ih = img.get_width(), img.get_height()
         scale = target_h / ih
-        scaled = pygame.transform.smoothscale(img, (int(iw * scale), int(ih * scale)))
+        scaled = scale_cache.scaled(img, (int(iw * scale), int(ih * scale)))
         rect = scaled.get_rect()
         rect.bottom = S.HEIGHT - 40
         rect.left = 60 if side == "left" else rect.left
@@ -62,7 +63,7 @@ def draw(screen, gs, fonts=None, **kwargs):
     if logo:
         lw, lh = logo.get_width(), logo.get_height()
         scale = min(S.WIDTH * 0.5 / lw, S.HEIGHT * 0.3 / lh)
-        logo_scaled = pygame.transform.smoothscale(logo, (int(lw * scale), int(lh * scale)))
+        logo_scaled = scale_cache.scaled(logo, (int(lw * scale), int(lh * scale)))
         logo_rect = logo_scaled.get_rect(center=(S.WIDTH // 2, S.HEIGHT // 2 - 220))
         screen.blit(logo_scaled, logo_rect)
     else:
@@ -111,6 +112,7 @@ def handle(events, gs, screen=None, fonts=None, audio_bank=None, **kwargs):
                 gs.player_name = ""
                 gs.distance_travelled = 0.0
                 gs.next_event_at = S.FIRST_EVENT_AT
+                gs.event_schedule = None
                 gs.rivals_on_map.clear()
                 gs.vessels_on_map.clear()
                 gs.in_encounter = False
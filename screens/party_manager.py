@@ -11,6 +11,7 @@ import os
 import re
 import pygame
 import settings as S
+from systems import fonts, surface_pool
 
 # Optional: tie into your audio system if present
 try:
@@ -234,11 +235,7 @@ def draw(screen: pygame.Surface, gs):
     _ITEM_INDEXES = []
 
     sw, sh = screen.get_size()
-    layer = pygame.Surface((sw, sh), pygame.SRCALPHA)
-
-    dim = pygame.Surface((sw, sh), pygame.SRCALPHA)
-    dim.fill((0, 0, 0, 140))
-    layer.blit(dim, (0, 0))
+    layer = surface_pool.scratch((sw, sh), tag="party_manager.layer", fill=(0, 0, 0, 140))  # pre-dimmed
 
     sr = _scroll_rect(sw, sh)
     _PANEL_RECT = sr
@@ -262,8 +259,8 @@ def draw(screen: pygame.Surface, gs):
     icon  = max(48, int(row_h * 0.90))
     x_shift = int(inner.w * 0.08)
 
-    name_f  = pygame.font.SysFont("georgia", max(18, int(sr.h * 0.035)), bold=True)
-    small_f = pygame.font.SysFont("georgia", max(14, int(sr.h * 0.028)))
+    name_f  = fonts.get("georgia", max(18, int(sr.h * 0.035)), bold=True)
+    small_f = fonts.get("georgia", max(14, int(sr.h * 0.028)))
     ink      = (48, 34, 22)
     hp_back  = (62, 28, 24)
     hp_fill  = (40, 160, 84)
@@ -299,7 +296,7 @@ def draw(screen: pygame.Surface, gs):
             clean = _pretty_name(fname) or "Vessel"
             lvl = int((stats[i] or {}).get("level", 1)) if isinstance(stats[i], dict) else 1
             label = f"{clean}   lvl {lvl}"
-            lab_s = name_f.render(label, True, ink)
+            lab_s = fonts.render(name_f, label, ink)
             text_x = icon_rect.right + int(sr.w * 0.02)
             name_y = r.y + int(row_h * 0.10)
             layer.blit(lab_s, (text_x, name_y))
@@ -315,7 +312,7 @@ def draw(screen: pygame.Surface, gs):
             if ratio > 0:
                 fill = bar_r.copy(); fill.w = int(bar_r.w * ratio)
                 pygame.draw.rect(layer, hp_fill, fill, border_radius=6)
-            hp_s = small_f.render(f"HP {hp}/{maxhp}", True, ink)
+            hp_s = fonts.render(small_f, f"HP {hp}/{maxhp}", ink)
             layer.blit(hp_s, (bar_r.right + 10, bar_r.y - 2))
 
             if r.collidepoint(mx, my):
@@ -18,6 +18,8 @@ WORLD_W, WORLD_H = 2400, 100000
 TILE = 64
 BG_COLOR   = (34, 40, 48)
 GRID_COLOR = (50, 58, 68)
+# Off-screen road/prop segment generation per frame (world/procgen.py)
+PROCGEN_BUDGET_MS = 2.0
 
 
 # ===================== Assets (folders) ======================
@@ -48,6 +50,13 @@ ENCOUNTER_WEIGHT_VESSEL   = 0.75  # 75% vessel, 25% summoner
 SPAWN_GAP_MIN             = 1500
 SPAWN_GAP_MAX             = 10000
 ENCOUNTER_SHOW_TIME       = 2.0
+# Event mix drawn by world/event_schedule.py (boss/shop stay 0 until they have overworld handlers)
+EVENT_KIND_WEIGHTS = {
+    "vessel": ENCOUNTER_WEIGHT_VESSEL,
+    "rival":  1.0 - ENCOUNTER_WEIGHT_VESSEL,
+    "boss":   0.0,
+    "shop":   0.0,
+}
 
 # Guaranteed vertical separation between any two spawns (regardless of type)
 # Tune this as you like; start around player sprite height * ~1.2
@@ -66,9 +75,43 @@ MUSIC_VOLUME = 0.6
 SFX_VOLUME   = 0.8
 
 
+# ===================== Caches ================================
+# Decoded image cache (systems/asset_cache.py); LRU evicts past this
+IMAGE_CACHE_BUDGET_MB = 256
+# SFX decode on first play (systems/audio.py); PRELOAD keys are decoded at startup
+SFX_CACHE_BUDGET_MB = 32
+SFX_PRELOAD         = ("click", "walking")
+# Memoised smoothscale variants (systems/scale_cache.py); scaled outputs only, not their sources
+SCALE_CACHE_BUDGET_MB = 64
+# Rendered text surfaces kept by systems/fonts.py (LRU, entries)
+TEXT_CACHE_ENTRIES = 512
+# PNG decode worker processes for the startup preload (systems/image_decode.py); 0 = min(4, CPUs)
+DECODE_WORKERS      = 0
+DECODE_PARALLEL_MIN = 8   # smaller batches decode in-process
+# Revealed overworld vessel sprites kept decoded (world/vessel_registry.py)
+VESSEL_SPRITE_CACHE = 16
+
+
+# ===================== Profiling =============================
+# Per-frame span timings (systems/frame_profiler.py); F3 toggles, F4 dumps CSV
+PROFILER_ENABLED = False
+PROFILER_RING    = 600   # frames kept for percentiles / CSV
+
+# ===================== Rendering =============================
+# Overworld repaints + presents only changed rects while the camera is still
+# (systems/dirty_rects.py); False = full redraw + flip every frame
+DIRTY_RECTS_ENABLED = True
+
 # ===================== Save Files ============================
 SAVE_DIR  = "Saves"
 SAVE_PATH = os.path.join(SAVE_DIR, "savegame.json")
+# Persisted Assets/ file listing (systems/asset_index.py), reused while dir mtimes match
+ASSET_INDEX_PATH = os.path.join(SAVE_DIR, "asset_index.json")
+# Pre-decoded overworld sprites (world/asset_pack.py); rebuilt when PNGs change
+ASSET_PACK_ENABLED = True
+ASSET_PACK_PATH    = os.path.join(SAVE_DIR, "asset_pack.bin")
+# Pre-transcoded intro clips at window resolution (systems/video_cache.py)
+INTRO_CACHE_DIR    = os.path.join(SAVE_DIR, "intro_cache")
 
 
 # ===================== Menu / Theme ==========================
@@ -76,6 +119,14 @@ MENU_BG_FILE  = "mainmenu.png"
 DND_FONT_FILE = "DH.otf"
 
 
+# ===================== Intro Video ===========================
+# Decoder thread queue depth (screens/intro_video.py): frames decoded,
+# converted and scaled ahead of playback
+INTRO_QUEUE_FRAMES = 8
+# Raw frame cache recorded on the first full playback (systems/video_cache.py)
+INTRO_CACHE_ENABLED = True
+
+
 # ===================== Modes ================================
 MODE_MENU = "MENU"
 MODE_GAME = "GAME"
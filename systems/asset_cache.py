@@ -0,0 +1,180 @@
+# ============================================================
+#  systems/asset_cache.py — shared decoded-image cache
+#  - One entry per resolved file path (+ alpha/opaque convert)
+#  - LRU bounded by a byte budget (IMAGE_CACHE_BUDGET_MB)
+#  - acquire()/release() pin entries so they are never evicted
+#  - Surfaces are SHARED: copy() before mutating one in place
+# ============================================================
+
+import os
+from collections import OrderedDict
+import pygame
+import settings as S
+from systems import asset_index
+
+# ---------- Config ----------
+_BUDGET_BYTES = int(getattr(S, "IMAGE_CACHE_BUDGET_MB", 256)) * 1024 * 1024
+
+# ---------- Internal state ----------
+# key -> {"surf": Surface, "bytes": int, "refs": int}
+_entries: "OrderedDict[tuple[str, bool], dict]" = OrderedDict()
+_bytes_used = 0
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "failures": 0}
+
+
+# ---------- Helpers ----------
+def _resolve(path: str) -> str:
+    """Collapse '..', relative vs absolute and case (on Windows) so one file = one key.
+    Pure string work: no stat() on the per-frame hit path."""
+    return os.path.normcase(os.path.abspath(path))
+
+def _surface_bytes(surf: pygame.Surface) -> int:
+    try:
+        return surf.get_pitch() * surf.get_height()
+    except Exception:
+        return surf.get_width() * surf.get_height() * 4
+
+def _evict_until_fits(keep_key=None):
+    """Drop least-recently-used unpinned entries until we are under budget."""
+    global _bytes_used
+    if _bytes_used <= _BUDGET_BYTES:
+        return
+    for key in list(_entries.keys()):
+        if _bytes_used <= _BUDGET_BYTES:
+            break
+        if key == keep_key:
+            continue
+        entry = _entries[key]
+        if entry["refs"] > 0:
+            continue
+        del _entries[key]
+        _bytes_used -= entry["bytes"]
+        _stats["evictions"] += 1
+
+def _decode(path: str, alpha: bool) -> pygame.Surface | None:
+    try:
+        img = pygame.image.load(path)
+        return img.convert_alpha() if alpha else img.convert()
+    except Exception as e:
+        _stats["failures"] += 1
+        print(f"⚠️ load fail {path}: {e}")
+        return None
+
+def _insert(key, surf: pygame.Surface) -> dict:
+    global _bytes_used
+    entry = {"surf": surf, "bytes": _surface_bytes(surf), "refs": 0}
+    _entries[key] = entry
+    _bytes_used += entry["bytes"]
+    _evict_until_fits(keep_key=key)
+    return entry
+
+def _lookup(path: str | None, alpha: bool):
+    """Return (key, entry) for path, decoding on a miss. entry is None on failure."""
+    global _bytes_used
+    if not path:
+        return None, None
+    key = (_resolve(path), bool(alpha))
+    entry = _entries.get(key)
+    if entry is not None:
+        _entries.move_to_end(key)
+        _stats["hits"] += 1
+        return key, entry
+
+    if not asset_index.exists(path):
+        return None, None
+    _stats["misses"] += 1
+    surf = _decode(path, alpha)
+    if surf is None:
+        return key, None
+    return key, _insert(key, surf)
+
+
+# ===================== Public API ===========================
+def load_image(path: str | None, alpha: bool = True) -> pygame.Surface | None:
+    """
+    Drop-in for the old `_try_load` helpers: returns the decoded Surface for
+    `path` (convert_alpha() by default, convert() with alpha=False), or None
+    if the file is missing or fails to decode. Repeat calls hit the cache.
+    """
+    _, entry = _lookup(path, alpha)
+    return entry["surf"] if entry else None
+
+def load_many(paths, alpha: bool = True) -> list:
+    """
+    Batch load_image(): cache misses are decoded together (on worker
+    processes inside image_decode.startup_pool()). Returns Surfaces/None
+    aligned with `paths`; a miss is returned straight from the decode, so
+    a tight budget evicting it again does not cost a second decode.
+    """
+    from systems import image_decode
+    paths = list(paths)
+    out = [None] * len(paths)
+    todo = {}   # key -> (path, [indices into out])
+    for i, p in enumerate(paths):
+        if not p:
+            continue
+        key = (_resolve(p), bool(alpha))
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+            out[i] = entry["surf"]
+        elif key in todo:
+            todo[key][1].append(i)
+        elif asset_index.exists(p):
+            todo[key] = (p, [i])
+    if todo:
+        _stats["misses"] += len(todo)
+        keys = list(todo)
+        for key, raw in zip(keys, image_decode.decode_raw([todo[k][0] for k in keys])):
+            surf = image_decode.to_surface(raw, alpha)
+            if surf is None:
+                _stats["failures"] += 1
+                continue
+            _insert(key, surf)
+            for i in todo[key][1]:
+                out[i] = surf
+    return out
+
+def acquire(path: str | None, alpha: bool = True) -> pygame.Surface | None:
+    """Like load_image(), but pins the entry until a matching release()."""
+    _, entry = _lookup(path, alpha)
+    if not entry:
+        return None
+    entry["refs"] += 1
+    return entry["surf"]
+
+def release(path: str | None, alpha: bool = True):
+    """Unpin an entry taken with acquire(). Unknown paths are ignored."""
+    if not path:
+        return
+    entry = _entries.get((_resolve(path), bool(alpha)))
+    if entry and entry["refs"] > 0:
+        entry["refs"] -= 1
+    _evict_until_fits()
+
+def set_budget_mb(mb: float):
+    """Change the byte budget at runtime (evicts immediately if shrinking)."""
+    global _BUDGET_BYTES
+    _BUDGET_BYTES = max(0, int(mb * 1024 * 1024))
+    _evict_until_fits()
+
+def clear():
+    """Forget every unpinned entry (e.g. after a display mode change)."""
+    global _bytes_used
+    for key in list(_entries.keys()):
+        entry = _entries[key]
+        if entry["refs"] > 0:
+            continue
+        del _entries[key]
+        _bytes_used -= entry["bytes"]
+
+def stats() -> dict:
+    """Counters for debugging / perf reports."""
+    return {
+        **_stats,
+        "entries": len(_entries),
+        "bytes": _bytes_used,
+        "budget_bytes": _BUDGET_BYTES,
+        "pinned": sum(1 for e in _entries.values() if e["refs"] > 0),
+    }
@@ -0,0 +1,161 @@
+# ============================================================
+#  systems/asset_index.py — one-time index of everything in Assets/
+#  - Walks ASSETS_ROOT once (or reuses the manifest on disk when
+#    no directory mtime changed) and answers lookups from dicts
+#  - Basenames are matched case-insensitively
+#  - Returned paths are absolute
+# ============================================================
+
+import os
+import json
+import settings as S
+
+ASSETS_ROOT   = getattr(S, "ASSETS_ROOT", "Assets")
+MANIFEST_PATH = getattr(S, "ASSET_INDEX_PATH", os.path.join("Saves", "asset_index.json"))
+_MANIFEST_VERSION = 1
+
+# ---------- Internal state ----------
+# lower basename      -> [(dir_key, abs_path), ...] in walk order
+_by_name: dict[str, list[tuple[str, str]]] = {}
+# dir_key/lower name  -> abs_path
+_by_path: dict[str, str] = {}
+_root_abs: str | None = None
+_built = False
+
+
+# ---------- Keys ----------
+def _dir_key(d: str) -> str:
+    """Normalised, lower-case, absolute directory key ('Assets/Starters' == 'assets\\starters')."""
+    return os.path.normcase(os.path.abspath(d)).lower()
+
+def _path_key(p: str) -> str:
+    return _dir_key(p)
+
+
+# ---------- Scan / manifest ----------
+def _scan(root: str) -> tuple[dict[str, int], list[str]]:
+    """Walk root once. Returns ({rel_dir: mtime_ns}, [rel_file, ...])."""
+    dirs: dict[str, int] = {}
+    files: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel_dir = os.path.relpath(dirpath, root)
+        try:
+            dirs[rel_dir] = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            continue
+        for fn in sorted(filenames):
+            files.append(os.path.normpath(os.path.join(rel_dir, fn)))
+    return dirs, files
+
+def _manifest_is_fresh(data: dict, root: str) -> bool:
+    if not isinstance(data, dict) or data.get("version") != _MANIFEST_VERSION:
+        return False
+    dirs = data.get("dirs")
+    if not isinstance(dirs, dict) or not isinstance(data.get("files"), list):
+        return False
+    for rel_dir, mtime in dirs.items():
+        try:
+            if os.stat(os.path.join(root, rel_dir)).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+def _read_manifest(root: str):
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return None
+    return data["files"] if _manifest_is_fresh(data, root) else None
+
+def _write_manifest(dirs: dict[str, int], files: list[str]):
+    try:
+        os.makedirs(os.path.dirname(MANIFEST_PATH) or ".", exist_ok=True)
+        with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+            json.dump({"version": _MANIFEST_VERSION, "dirs": dirs, "files": files}, f)
+    except Exception as e:
+        print(f"ℹ️ Asset index manifest not written: {e}")
+
+def _populate(root: str, files: list[str]):
+    global _root_abs
+    _by_name.clear()
+    _by_path.clear()
+    _root_abs = os.path.abspath(root)
+    for rel in files:
+        full = os.path.join(_root_abs, rel)
+        dk = _dir_key(os.path.dirname(full))
+        _by_name.setdefault(os.path.basename(rel).lower(), []).append((dk, full))
+        _by_path[_path_key(full)] = full
+
+
+# ===================== Public API ===========================
+def build(force: bool = False):
+    """
+    Build the index. Uses the persisted manifest if every directory mtime
+    still matches, otherwise rescans and rewrites it. Called lazily by the
+    lookup helpers; call it explicitly at startup to front-load the cost.
+    """
+    global _built
+    if _built and not force:
+        return
+    files = None if force else _read_manifest(ASSETS_ROOT)
+    if files is None:
+        dirs, files = _scan(ASSETS_ROOT)
+        _write_manifest(dirs, files)
+    _populate(ASSETS_ROOT, files)
+    _built = True
+
+def refresh():
+    """Force a rescan (e.g. after assets were added while running)."""
+    build(force=True)
+
+def find(name: str | None, dirs=None) -> str | None:
+    """
+    Absolute path of the file called `name` (case-insensitive basename).
+    With `dirs`, only files directly inside one of those directories match,
+    and earlier directories win.
+    """
+    if not name:
+        return None
+    build()
+    hits = _by_name.get(os.path.basename(name).lower())
+    if not hits:
+        return None
+    if dirs is None:
+        return hits[0][1]
+    for d in dirs:
+        dk = _dir_key(d)
+        for hit_dir, full in hits:
+            if hit_dir == dk:
+                return full
+    return None
+
+def lookup(path: str | None) -> str | None:
+    """Indexed absolute path for an explicit file path, or None if not in Assets/."""
+    if not path:
+        return None
+    build()
+    return _by_path.get(_path_key(path))
+
+def owns(path: str | None) -> bool:
+    """True if `path` lives under ASSETS_ROOT (so a lookup() miss means 'missing')."""
+    if not path:
+        return False
+    build()
+    p = _path_key(path)
+    root = _dir_key(_root_abs or ASSETS_ROOT)
+    return p == root or p.startswith(root + os.sep)
+
+def exists(path: str | None) -> bool:
+    """os.path.exists() replacement that answers Assets/ paths from the index."""
+    if not path:
+        return False
+    if owns(path):
+        return lookup(path) is not None
+    return os.path.exists(path)
+
+def count() -> int:
+    build()
+    return len(_by_path)
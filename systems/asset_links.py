@@ -2,6 +2,7 @@
 #  systems/asset_links.py
 # ============================================================
 import os
+from systems import asset_index
 
 # --- prefix maps ---
 PREFIX_TO_TOKEN  = (
@@ -46,11 +47,6 @@ def find_image(basename_or_path: str | None) -> str | None:
     """Return a full path if found anywhere in SEARCH_DIRS (or direct path)."""
     if not basename_or_path:
         return None
-    if os.path.exists(basename_or_path):
+    if os.path.dirname(basename_or_path) and asset_index.exists(basename_or_path):
         return basename_or_path
-    base = os.path.basename(basename_or_path)
-    for d in SEARCH_DIRS:
-        p = os.path.join(d, base)
-        if os.path.exists(p):
-            return p
-    return None
+    return asset_index.find(basename_or_path, SEARCH_DIRS)
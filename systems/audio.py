@@ -3,6 +3,8 @@
 # ============================================================
 
 import os, random, math, array, pygame
+from collections import OrderedDict
+from collections.abc import MutableMapping
 import settings as S
 
 DEFAULT_MUSIC_VOL = getattr(S, "MUSIC_VOLUME", 0.6)
@@ -18,9 +20,10 @@ def set_sfx_volume(v: float, bank: "AudioBank|None" = None):
     """Set global SFX master volume and apply to currently loaded sounds."""
     global _SFX_MASTER
     _SFX_MASTER = max(0.0, min(1.0, float(v)))
-    # Apply to loaded SFX in a bank (if provided)
+    # Apply to already-decoded SFX in a bank (if provided); lazy ones pick it up on decode
     if bank and getattr(bank, "sfx", None):
-        for s in bank.sfx.values():
+        sounds = bank.sfx.loaded() if isinstance(bank.sfx, LazySfx) else bank.sfx.values()
+        for s in sounds:
             try:
                 s.set_volume(_SFX_MASTER)
             except Exception:
@@ -39,10 +42,132 @@ _SFX_DIRS = [
     os.path.join("Assets", "Audio", "Effects"),
 ]
 
+_SFX_BUDGET_BYTES = int(getattr(S, "SFX_CACHE_BUDGET_MB", 32)) * 1024 * 1024
+
+class LazySfx(MutableMapping):
+    """
+    key -> pygame.Sound, decoded on first access.
+      • register(key, path) only records the file
+      • decoded PCM lives in an LRU capped at SFX_CACHE_BUDGET_MB
+      • preload(keys) decodes now and pins (never evicted)
+      • assigning a Sound directly (aliases, generated beeps) pins it too
+    A playing Sound stays alive on its channel even if evicted here.
+    """
+
+    def __init__(self, budget_bytes: int = _SFX_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._paths  = {}              # key -> file path
+        self._pinned = {}              # key -> Sound (preloaded / assigned)
+        self._lru    = OrderedDict()   # key -> (Sound, bytes)
+        self._bytes  = 0
+
+    # ----- registration -----
+    def register(self, key: str, path: str):
+        self._paths[key] = path
+
+    def alias(self, key: str, existing: str):
+        """Make `key` resolve to the same file as `existing` (no decode)."""
+        if existing in self._paths:
+            self._paths[key] = self._paths[existing]
+        elif existing in self._pinned:
+            self._pinned[key] = self._pinned[existing]
+
+    # ----- decoding / budget -----
+    @staticmethod
+    def _pcm_bytes(snd) -> int:
+        try:
+            freq, fmt, channels = pygame.mixer.get_init()
+            return int(snd.get_length() * freq) * channels * (abs(fmt) // 8)
+        except Exception:
+            return 0
+
+    def _decode(self, key: str):
+        path = self._paths.get(key)
+        if not path:
+            return None
+        snd = _load_sfx(path, DEFAULT_SFX_VOL)
+        if snd is None:
+            self._paths.pop(key, None)   # don't retry a broken file every play
+        return snd
+
+    def _evict(self):
+        while self._bytes > self.budget_bytes and len(self._lru) > 1:
+            _, (_, nbytes) = self._lru.popitem(last=False)
+            self._bytes -= nbytes
+
+    def preload(self, keys):
+        """Decode `keys` now and pin them (latency-critical sounds)."""
+        for key in keys:
+            if key in self._pinned:
+                continue
+            hit = self._lru.pop(key, None)
+            if hit:
+                self._bytes -= hit[1]
+                self._pinned[key] = hit[0]
+                continue
+            snd = self._decode(key)
+            if snd is not None:
+                self._pinned[key] = snd
+
+    def loaded(self):
+        """Sounds that are currently decoded (no decoding triggered)."""
+        return list(self._pinned.values()) + [s for s, _ in self._lru.values()]
+
+    def stats(self) -> dict:
+        return {"known": len(self), "pinned": len(self._pinned),
+                "decoded": len(self._lru), "bytes": self._bytes, "budget_bytes": self.budget_bytes}
+
+    # ----- mapping protocol -----
+    def __getitem__(self, key):
+        snd = self._pinned.get(key)
+        if snd is not None:
+            return snd
+        hit = self._lru.get(key)
+        if hit is not None:
+            self._lru.move_to_end(key)
+            return hit[0]
+        if key not in self._paths:
+            raise KeyError(key)
+        snd = self._decode(key)
+        if snd is None:
+            raise KeyError(key)
+        nbytes = self._pcm_bytes(snd)
+        self._lru[key] = (snd, nbytes)
+        self._bytes += nbytes
+        self._evict()
+        return snd
+
+    def __setitem__(self, key, snd):
+        self._pinned[key] = snd
+
+    def __delitem__(self, key):
+        found = False
+        for d in (self._paths, self._pinned):
+            if key in d:
+                del d[key]; found = True
+        hit = self._lru.pop(key, None)
+        if hit:
+            self._bytes -= hit[1]; found = True
+        if not found:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._pinned or key in self._paths
+
+    def __iter__(self):
+        return iter(dict.fromkeys([*self._paths, *self._pinned]))
+
+    def __len__(self):
+        return len(set(self._paths) | set(self._pinned))
+
 class AudioBank:
     def __init__(self):
-        self.music = {}  # key -> path
-        self.sfx   = {}  # key -> pygame.Sound
+        self.music = {}          # key -> path
+        self.sfx   = LazySfx()   # key -> pygame.Sound (decoded on first use)
+
+    def preload(self, keys):
+        """Decode + pin these SFX now so their first play has no hitch."""
+        self.sfx.preload([k.lower() for k in keys])
 
 # ---------- init ----------
 _PREINIT = dict(frequency=44100, size=-16, channels=2, buffer=512)
@@ -81,12 +206,12 @@ def _alias_click(bank: AudioBank):
     # strong names first
     for k in ("ui_click", "button_click", "uiclick", "btn_click"):
         if k in bank.sfx:
-            bank.sfx["click"] = bank.sfx[k]
+            bank.sfx.alias("click", k)
             return
     # fuzzy
     for k in list(bank.sfx.keys()):
         if "click" in k or "button" in k:
-            bank.sfx["click"] = bank.sfx[k]
+            bank.sfx.alias("click", k)
             return
 
 def _beep_fallback(volume=0.8, ms=80, freq=1000):
@@ -137,19 +262,18 @@ def load_all() -> AudioBank:
                 if not _is_audio_file(f): continue
                 bank.music[_norm_key(f)] = os.path.join(root, f)
 
-    # sfx
+    # sfx (paths only; decoded on first play)
     for root_dir in _SFX_DIRS:
         if not os.path.isdir(root_dir): continue
         for root, _, files in os.walk(root_dir):
             for f in files:
                 if not _is_audio_file(f): continue
-                full = os.path.join(root, f)
-                s = _load_sfx(full, DEFAULT_SFX_VOL)
-                if s: bank.sfx[_norm_key(f)] = s
+                bank.sfx.register(_norm_key(f), os.path.join(root, f))
 
     _alias_click(bank)
+    bank.preload(getattr(S, "SFX_PRELOAD", ("click",)))
 
-    print(f"🎶 Loaded {len(bank.music)} music tracks and {len(bank.sfx)} SFX.")
+    print(f"🎶 Loaded {len(bank.music)} music tracks and {len(bank.sfx)} SFX (lazy).")
     if "click" in bank.sfx:
         print("🔊 Click SFX available.")
     else:
@@ -0,0 +1,93 @@
+# ============================================================
+#  systems/dirty_rects.py — dirty-rectangle presenting for the
+#  overworld
+#  - begin(cam, force_full): a camera move (or anything passed as
+#    force_full: modals, fades, profiler overlay) means a full
+#    redraw + flip
+#  - track(key, rect, content): a drawable's screen rect this
+#    frame; if its rect or content changed, old + new are dirtied
+#  - touch(rect): dirty a region unconditionally
+#  - regions(): rects to repaint (clip each pass to one), or None
+#    for a full frame
+#  - present(): display.flip() or display.update(rects)
+#  - invalidate(): the screen was drawn by someone else (another
+#    mode); the next overworld frame is full
+# ============================================================
+
+import pygame
+import settings as S
+
+_MAX_PASSES = 4   # more dirty regions than this get merged into one
+
+
+class DirtyRenderer:
+    def __init__(self):
+        self.enabled = bool(getattr(S, "DIRTY_RECTS_ENABLED", True))
+        self._cam = None
+        self._full = True
+        self._forced = False         # this frame carries overlays we don't track
+        self._valid = False          # screen holds our last frame
+        self._tracked: dict = {}     # key -> (Rect, content) from the previous frame
+        self._seen: set = set()
+        self._dirty: list[pygame.Rect] = []
+        self.stats = {"full": 0, "partial": 0, "idle": 0}
+
+    def invalidate(self):
+        self._valid = False
+
+    def begin(self, cam, force_full: bool = False) -> bool:
+        """Start a frame; returns True if it must be drawn in full."""
+        cam_key = (int(cam.x), int(cam.y))
+        self._forced = bool(force_full)
+        self._full = (not self.enabled or force_full or not self._valid or cam_key != self._cam)
+        self._cam = cam_key
+        self._dirty = []
+        self._seen = set()
+        if self._full:
+            self._tracked.clear()
+        return self._full
+
+    def track(self, key, rect, content=None):
+        rect = pygame.Rect(rect)
+        self._seen.add(key)
+        prev = self._tracked.get(key)
+        self._tracked[key] = (rect, content)
+        if self._full:
+            return
+        if prev is None:
+            self._dirty.append(rect)
+        elif prev[0] != rect or prev[1] != content:
+            self._dirty.append(prev[0])
+            self._dirty.append(rect)
+
+    def touch(self, rect):
+        if not self._full:
+            self._dirty.append(pygame.Rect(rect))
+
+    def regions(self):
+        """None = full frame; otherwise the (possibly empty) list of rects to repaint."""
+        if self._full:
+            return None
+        # anything tracked last frame but gone now leaves a hole to repaint
+        for key in [k for k in self._tracked if k not in self._seen]:
+            self._dirty.append(self._tracked.pop(key)[0])
+        screen_rect = pygame.Rect(0, 0, S.WIDTH, S.HEIGHT)
+        rects = [r.clip(screen_rect) for r in self._dirty]
+        rects = [r for r in rects if r.w > 0 and r.h > 0]
+        if len(rects) > _MAX_PASSES:
+            rects = [rects[0].unionall(rects[1:])]
+        self._dirty = rects
+        return rects
+
+    def present(self):
+        """Flip a full frame, or push just the repainted rects."""
+        # a forced frame's overlays (modal, fade) must be painted over in full next time
+        self._valid = not self._forced
+        if self._full:
+            self.stats["full"] += 1
+            pygame.display.flip()
+        elif self._dirty:
+            self.stats["partial"] += 1
+            pygame.display.update(self._dirty)
+        else:
+            self.stats["idle"] += 1
@@ -0,0 +1,99 @@
+# ============================================================
+#  systems/fonts.py — shared Font registry + rendered-text cache
+#  - get(family, size, bold): one Font object per key, ever
+#    (family = system font name, a font file path, or None)
+#  - render(font, text, color, aa): LRU of text Surfaces
+#  - wrap(text, font, max_w): memoised word wrap
+#  - Rendered surfaces are SHARED: copy() before drawing into one
+# ============================================================
+
+import os
+from collections import OrderedDict
+import pygame
+import settings as S
+
+_TEXT_CACHE_MAX = max(16, int(getattr(S, "TEXT_CACHE_ENTRIES", 512)))
+_WRAP_CACHE_MAX = 256
+
+_fonts: dict[tuple, pygame.font.Font] = {}
+# (id(font), text, color, aa) -> (font, Surface); the font is held so its id can't be reused
+_text: "OrderedDict[tuple, tuple]" = OrderedDict()
+# (id(font), text, max_w) -> (font, tuple[str, ...])
+_wraps: "OrderedDict[tuple, tuple]" = OrderedDict()
+_stats = {"fonts": 0, "text_hits": 0, "text_misses": 0, "wrap_hits": 0, "wrap_misses": 0}
+
+
+# ---------- Construction ----------
+def _is_path(family: str | None) -> bool:
+    return bool(family) and (os.sep in family or "/" in family
+                             or family.lower().endswith((".ttf", ".otf", ".ttc")))
+
+def _make(family: str | None, size: int, bold: bool) -> pygame.font.Font:
+    if _is_path(family):
+        try:
+            f = pygame.font.Font(family, size)
+            f.set_bold(bold)
+            return f
+        except Exception as e:
+            print(f"⚠️ Font '{family}' failed to load ({e}); using default")
+            family = None
+    try:
+        return pygame.font.SysFont(family, size, bold=bold)
+    except Exception:
+        return pygame.font.Font(None, size)
+
+
+# ===================== Public API ===========================
+def get(family: str | None, size: int, bold: bool = False) -> pygame.font.Font:
+    """Cached Font for (family, size, bold). Never constructs twice."""
+    key = (family, max(1, int(size)), bool(bold))
+    f = _fonts.get(key)
+    if f is None:
+        f = _fonts[key] = _make(*key)
+        _stats["fonts"] += 1
+    return f
+
+def render(font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+    """Cached font.render(text, antialias, color)."""
+    key = (id(font), text, tuple(color), bool(antialias))
+    hit = _text.get(key)
+    if hit is not None and hit[0] is font:
+        _text.move_to_end(key)
+        _stats["text_hits"] += 1
+        return hit[1]
+    _stats["text_misses"] += 1
+    surf = font.render(text, antialias, color)
+    _text[key] = (font, surf)
+    _text.move_to_end(key)
+    while len(_text) > _TEXT_CACHE_MAX:
+        _text.popitem(last=False)
+    return surf
+
+def wrap(text: str, font: pygame.font.Font, max_w: int) -> list[str]:
+    """Greedy word wrap to max_w pixels (memoised per font/text/width)."""
+    key = (id(font), text, int(max_w))
+    hit = _wraps.get(key)
+    if hit is not None and hit[0] is font:
+        _wraps.move_to_end(key)
+        _stats["wrap_hits"] += 1
+        return list(hit[1])
+    _stats["wrap_misses"] += 1
+
+    lines, cur = [], ""
+    for w in text.split():
+        test = (cur + " " + w).strip()
+        if not cur or font.size(test)[0] <= max_w:
+            cur = test
+        else:
+            lines.append(cur)
+            cur = w
+    if cur:
+        lines.append(cur)
+
+    _wraps[key] = (font, tuple(lines))
+    while len(_wraps) > _WRAP_CACHE_MAX:
+        _wraps.popitem(last=False)
+    return lines
+
+def stats() -> dict:
+    return {**_stats, "text_entries": len(_text), "wrap_entries": len(_wraps)}
@@ -0,0 +1,196 @@
+# ============================================================
+#  systems/frame_profiler.py — per-frame subsystem timings
+#  - with span("name"): ... times one subsystem inside a frame
+#    (t = start() ... stop("name", t) for regions that aren't a block)
+#  - Fixed-size ring buffer per span (PROFILER_RING frames)
+#  - F3: toggle overlay (p50 / p95 / p99 per span, ms)
+#  - F4: dump the ring buffer to CSV under Saves/
+#  - Disabled: span() hands back one shared no-op context, so the
+#    cost is a function call per span
+# ============================================================
+
+import os
+import csv
+import time
+import math
+from array import array
+from contextlib import nullcontext
+import pygame
+import settings as S
+
+TOGGLE_KEY = pygame.K_F3
+DUMP_KEY   = pygame.K_F4
+
+_RING = max(16, int(getattr(S, "PROFILER_RING", 600)))
+_NULL = nullcontext()
+_perf = time.perf_counter
+
+enabled = bool(getattr(S, "PROFILER_ENABLED", False))
+
+_order: list[str] = []            # span names in first-seen order (CSV columns / overlay rows)
+_rings: dict[str, array] = {}     # name -> ms per frame (nan = not hit that frame)
+_frame_ms: dict[str, float] = {}  # accumulated ms for the frame in progress
+_head = 0                         # next ring slot
+_filled = 0                       # how many slots hold real frames
+_frame_t0 = None
+
+_overlay = {"font": None, "lines": [], "next_refresh": 0}
+
+
+class _Span:
+    __slots__ = ("name", "t0")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = _perf()
+        return self
+
+    def __exit__(self, *exc):
+        ms = (_perf() - self.t0) * 1000.0
+        _frame_ms[self.name] = _frame_ms.get(self.name, 0.0) + ms
+        return False
+
+_spans: dict[str, _Span] = {}
+
+
+# ---------- Ring helpers ----------
+def _ring_for(name: str) -> array:
+    ring = _rings.get(name)
+    if ring is None:
+        ring = array("d", [math.nan]) * _RING
+        _rings[name] = ring
+        _order.append(name)
+    return ring
+
+def _percentiles(values, ps=(50, 95, 99)):
+    vals = sorted(v for v in values if not math.isnan(v))
+    if not vals:
+        return [math.nan for _ in ps]
+    n = len(vals)
+    return [vals[min(n - 1, int(round(p / 100.0 * (n - 1))))] for p in ps]
+
+def _frames_in_order():
+    """Ring slot indices oldest -> newest."""
+    start = (_head - _filled) % _RING
+    return [(start + i) % _RING for i in range(_filled)]
+
+
+# ===================== Public API ===========================
+def span(name: str):
+    """Context manager timing one subsystem (shared no-op while disabled)."""
+    if not enabled:
+        return _NULL
+    sp = _spans.get(name)
+    if sp is None:
+        sp = _spans[name] = _Span(name)
+    return sp
+
+def start() -> float:
+    """Timestamp for stop(); 0.0 while disabled."""
+    return _perf() if enabled else 0.0
+
+def stop(name: str, t0: float):
+    """Add the time since start() to span `name` for this frame."""
+    if enabled and t0:
+        _frame_ms[name] = _frame_ms.get(name, 0.0) + (_perf() - t0) * 1000.0
+
+def begin_frame():
+    global _frame_t0
+    if enabled:
+        _frame_t0 = _perf()
+
+def end_frame():
+    """Push this frame's span totals (and the whole-frame time) into the rings."""
+    global _head, _filled, _frame_t0
+    if not enabled or _frame_t0 is None:
+        return
+    _frame_ms["frame.total"] = (_perf() - _frame_t0) * 1000.0
+    _frame_t0 = None
+    _ring_for("frame.total")
+    for name in _frame_ms:
+        _ring_for(name)
+    for name in _order:
+        _rings[name][_head] = _frame_ms.get(name, math.nan)
+    _frame_ms.clear()
+    _head = (_head + 1) % _RING
+    _filled = min(_RING, _filled + 1)
+
+def set_enabled(on: bool):
+    global enabled, _frame_t0
+    enabled = bool(on)
+    _frame_ms.clear()
+    _frame_t0 = None
+
+def reset():
+    global _head, _filled
+    _order.clear(); _rings.clear(); _frame_ms.clear()
+    _head = _filled = 0
+
+def summary() -> dict:
+    """{span: (p50, p95, p99)} in ms over the ring buffer."""
+    idx = _frames_in_order()
+    return {name: tuple(_percentiles(_rings[name][i] for i in idx)) for name in _order}
+
+def dump_csv(path: str | None = None) -> str | None:
+    """Write one row per buffered frame, one column per span. Returns the path."""
+    if not _filled:
+        print("ℹ️ Profiler: nothing recorded yet (F3 to enable)")
+        return None
+    if path is None:
+        path = os.path.join(getattr(S, "SAVE_DIR", "Saves"),
+                            time.strftime("frame_profile_%Y%m%d_%H%M%S.csv"))
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["frame"] + _order)
+            for n, i in enumerate(_frames_in_order()):
+                w.writerow([n] + ["" if math.isnan(_rings[s][i]) else f"{_rings[s][i]:.4f}" for s in _order])
+        print(f"📈 Profiler: {_filled} frames → {path}")
+        return path
+    except Exception as e:
+        print(f"⚠️ Profiler CSV dump failed: {e}")
+        return None
+
+def handle_event(e) -> bool:
+    """F3 toggles profiling + overlay, F4 dumps CSV. True if consumed."""
+    if e.type != pygame.KEYDOWN:
+        return False
+    if e.key == TOGGLE_KEY:
+        set_enabled(not enabled)
+        print(f"📈 Profiler {'on' if enabled else 'off'}")
+        return True
+    if e.key == DUMP_KEY:
+        dump_csv()
+        return True
+    return False
+
+def draw_overlay(screen: pygame.Surface):
+    """Percentile table in the top-left corner (text refreshed twice a second)."""
+    if not enabled:
+        return
+    now = pygame.time.get_ticks()
+    if now >= _overlay["next_refresh"]:
+        if _overlay["font"] is None:
+            _overlay["font"] = pygame.font.SysFont("consolas", 16)
+        font = _overlay["font"]
+        rows = [f"{'span':<22}{'p50':>7}{'p95':>7}{'p99':>7}  ({_filled} fr)"]
+        for name, (p50, p95, p99) in summary().items():
+            rows.append(f"{name:<22}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        _overlay["lines"] = [font.render(r, True, (230, 230, 230)) for r in rows]
+        _overlay["next_refresh"] = now + 500
+
+    lines = _overlay["lines"]
+    if not lines:
+        return
+    w = max(l.get_width() for l in lines) + 16
+    h = sum(l.get_height() for l in lines) + 12
+    panel = pygame.Surface((w, h), pygame.SRCALPHA)
+    panel.fill((0, 0, 0, 170))
+    screen.blit(panel, (8, 8))
+    y = 14
+    for l in lines:
+        screen.blit(l, (16, y))
+        y += l.get_height()
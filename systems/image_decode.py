@@ -0,0 +1,106 @@
+# ============================================================
+#  systems/image_decode.py — PNG decode/downscale on worker processes
+#  - Workers: pygame.image.load (+ optional scale) -> raw bytes
+#  - Main thread: frombuffer + convert_alpha() only
+#  - The pool only exists inside `with startup_pool():` (the
+#    startup preload); it uses spawn()ed workers, which share no
+#    SDL/mixer threads or state with the game and work on Windows,
+#    and is shut down when the block ends. Spawned workers import
+#    main.py, so nothing there may run outside its __main__ guard
+#  - Everything else (in-game battle frames, tiny batches) decodes
+#    in-process
+# ============================================================
+
+import os
+import multiprocessing as mp
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+import pygame
+import settings as S
+from systems import startup_trace
+
+_WORKERS   = int(getattr(S, "DECODE_WORKERS", 0)) or min(4, os.cpu_count() or 1)
+_MIN_BATCH = int(getattr(S, "DECODE_PARALLEL_MIN", 8))
+
+_pool: ProcessPoolExecutor | None = None
+_pool_broken = False
+
+
+# ---------- Worker side (must stay module-level / picklable) ----------
+def _decode_job(path: str, size, fmt: str):
+    """Runs in a worker: returns (w, h, bytes) or ("error", msg). No display needed."""
+    try:
+        surf = pygame.image.load(path)
+        if size and surf.get_size() != tuple(size):
+            surf = pygame.transform.scale(surf, size)
+        return surf.get_width(), surf.get_height(), pygame.image.tobytes(surf, fmt)
+    except Exception as e:
+        return ("error", str(e))
+
+
+# ---------- Pool ----------
+@contextmanager
+def startup_pool():
+    """Worker processes for the batches decoded inside this block; stopped on exit."""
+    global _pool, _pool_broken
+    if _pool is None and not _pool_broken and _WORKERS > 1:
+        try:
+            _pool = ProcessPoolExecutor(max_workers=_WORKERS, mp_context=mp.get_context("spawn"))
+        except Exception as e:
+            print(f"ℹ️ Decode pool unavailable, decoding in-process: {e}")
+            _pool_broken = True
+    try:
+        yield
+    finally:
+        shutdown()
+
+def shutdown():
+    """Stop the worker processes (safe to call more than once)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+# ===================== Public API ===========================
+def decode_raw(paths, size=None, fmt: str = "RGBA") -> list:
+    """
+    Decode (and optionally scale to `size`) every path. Returns a list
+    aligned with `paths` of (w, h, bytes) or None for failures.
+    """
+    global _pool_broken
+    paths = list(paths)
+    pool = _pool if len(paths) >= _MIN_BATCH else None
+    results = None
+    if pool is not None:
+        try:
+            chunk = max(1, len(paths) // (_WORKERS * 4))
+            results = list(pool.map(_decode_job, paths, [size] * len(paths),
+                                    [fmt] * len(paths), chunksize=chunk))
+            startup_trace.count("image", len(paths))   # decoded off-process
+        except Exception as e:
+            print(f"⚠️ Decode pool failed, decoding in-process: {e}")
+            shutdown()
+            _pool_broken = True
+    if results is None:
+        results = [_decode_job(p, size, fmt) for p in paths]
+
+    out = []
+    for p, r in zip(paths, results):
+        if isinstance(r, tuple) and r and r[0] == "error":
+            print(f"⚠️ load fail {p}: {r[1]}")
+            r = None
+        out.append(r)
+    return out
+
+def to_surface(raw, alpha: bool = True) -> pygame.Surface | None:
+    """Wrap a (w, h, RGBA bytes) result and convert it for fast blits."""
+    if raw is None:
+        return None
+    w, h, data = raw
+    surf = pygame.image.frombuffer(data, (w, h), "RGBA")
+    return surf.convert_alpha() if alpha else surf.convert()
+
+def load_many(paths, size=None, alpha: bool = True) -> list:
+    """decode_raw() + to_surface(): list of Surfaces (or None) aligned with paths."""
+    return [to_surface(r, alpha) for r in decode_raw(paths, size)]
@@ -7,6 +7,7 @@ import pygame
 import settings as S
 from screens import ledger
 from systems.asset_links import vessel_to_token, find_image
+from systems import asset_cache, asset_index
 
 # ---------- Layout ----------
 PADDING         = 16
@@ -32,6 +33,7 @@ _SLOT_GLOW_CACHE: dict[tuple[int, int, int, int], pygame.Surface] = {}  # (w,h,a
 
 # ---------- Click hitboxes ----------
 _slot_rects: list[pygame.Rect] = []    # populated per draw; 6 rects (2x3 grid)
+_hud_rect: pygame.Rect | None = None    # portrait + slot grid bounds from the last draw
 
 def _get_hover_glow_slot(size: tuple[int, int], alpha: int = 36, radius: int = 6) -> pygame.Surface:
     """
@@ -104,34 +106,29 @@ def _load_party_token_surface(name: str | None, size: tuple[int, int]) -> pygame
     if not name:
         return None
     token_basename = vessel_to_token(name)
-    path = find_image(token_basename)
-    if not path:
-        return None
-    try:
-        surf = pygame.image.load(path).convert_alpha()
-        return pygame.transform.smoothscale(surf, size)
-    except Exception:
+    surf = asset_cache.load_image(find_image(token_basename))
+    if surf is None:
         return None
+    return pygame.transform.smoothscale(surf, size)
 
 # ===================== Player Portrait Token =================
 def load_player_token(gender: str) -> pygame.Surface | None:
     base = os.path.join("Assets", "PlayableCharacters")
     fname = "MToken.png" if str(gender).lower().startswith("m") else "FToken.png"
     path = os.path.join(base, fname)
-    if not os.path.exists(path):
+    if not asset_index.exists(path):
         for alt in ("MToken.png", "FToken.png", "Token.png"):
             p2 = os.path.join(base, alt)
-            if os.path.exists(p2):
+            if asset_index.exists(p2):
                 path = p2
                 break
         else:
             return None
-    try:
-        surf = pygame.image.load(path).convert_alpha()
-        return pygame.transform.smoothscale(surf, PORTRAIT_SIZE)
-    except Exception as e:
-        print(f"⚠️ Failed to load player token '{path}': {e}")
+    surf = asset_cache.load_image(path)
+    if surf is None:
+        print(f"⚠️ Failed to load player token '{path}'")
         return None
+    return pygame.transform.smoothscale(surf, PORTRAIT_SIZE)
 
 # ===================== Name Fit Helper =======================
 def _render_name_fitted(text: str, max_w: int, max_size: int, min_size: int) -> pygame.Surface:
@@ -169,8 +166,25 @@ def handle_event(e, gs) -> bool:
     return False
 
 # ===================== HUD Drawing ===========================
+def hud_rect() -> pygame.Rect | None:
+    """Screen area the HUD painted last frame (dirty-rect redraws)."""
+    return _hud_rect
+
+def hud_signature(gs) -> tuple:
+    """Everything the HUD's pixels depend on; a change means it must be repainted."""
+    mouse = pygame.mouse.get_pos()
+    if _hud_rect is None or not _hud_rect.collidepoint(mouse):
+        mouse = None
+    return (
+        mouse,
+        tuple(getattr(gs, "party_slots_names", None) or ()),
+        tuple(id(t) for t in (getattr(gs, "party_slots", None) or ())),
+        id(getattr(gs, "player_token", None)),
+        getattr(gs, "player_name", ""),
+    )
+
 def draw_party_hud(screen: pygame.Surface, gs):
-    global _slot_rects
+    global _slot_rects, _hud_rect
 
     if not hasattr(gs, "party_slots") or gs.party_slots is None:
         gs.party_slots = [None] * SLOTS_COUNT
@@ -295,6 +309,8 @@ def draw_party_hud(screen: pygame.Surface, gs):
         else:
             pygame.draw.rect(screen, (80, 80, 80), r, width=1, border_radius=6)
 
+    _hud_rect = pygame.Rect(px, py, portrait_w, portrait_h).unionall(_slot_rects).inflate(4, 4)
+
     # Ledger modal overlay
     if ledger.is_open():
         ledger.draw(screen, gs)
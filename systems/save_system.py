@@ -12,6 +12,10 @@ import hashlib
 from pygame.math import Vector2
 import pygame
 import settings as S
+from systems import asset_cache, asset_index
+from world.spawn_index import SpawnIndex
+from world.spawn_records import Rival, VesselShadow
+from world.event_schedule import EventScheduler
 
 # ===================== Throttle / Dedup Guards ===============================
 
@@ -46,33 +50,26 @@ def ensure_save_dir():
 def has_save():
     return os.path.exists(S.SAVE_PATH)
 
+_TOKEN_DIRS = (
+    os.path.join("Assets", "Starters"),
+    os.path.join("Assets", "VesselsMale"),
+    os.path.join("Assets", "VesselsFemale"),
+    os.path.join("Assets", "RareVessels"),
+    os.path.join("Assets", "PlayableCharacters"),
+)
+
 def _resolve_token_path(filename: str | None) -> str | None:
     """Try to find a token image by filename across known asset dirs."""
     if not filename:
         return None
-    candidates_dirs = [
-        os.path.join("Assets", "Starters"),
-        os.path.join("Assets", "VesselsMale"),
-        os.path.join("Assets", "VesselsFemale"),
-        os.path.join("Assets", "RareVessels"),
-        os.path.join("Assets", "PlayableCharacters"),
-    ]
-    for d in candidates_dirs:
-        p = os.path.join(d, filename)
-        if os.path.exists(p):
-            return p
-    return None
+    return asset_index.find(filename, _TOKEN_DIRS)
 
 def _load_token_surface(filename: str | None):
     """Load a pygame.Surface for a token filename (if found)."""
     path = _resolve_token_path(filename)
     if not path:
         return None
-    try:
-        return pygame.image.load(path).convert_alpha()
-    except Exception as e:
-        print(f"⚠️ Failed to load token surface '{path}': {e}")
-        return None
+    return asset_cache.load_image(path)
 
 def _jsonify_stats_list(stats_list, length_fallback: int = 6):
     """
@@ -141,7 +138,10 @@ def save_game(gs, *, force: bool = False):
         "player_y": float(getattr(gs, "player_pos", Vector2(0, 0)).y),
         "distance_travelled": float(getattr(gs, "distance_travelled", 0.0)),
         "next_event_at": float(getattr(gs, "next_event_at", 200.0)),
+        "event_schedule": (gs.event_schedule.serialize()
+                           if getattr(gs, "event_schedule", None) is not None else None),
         "player_gender": getattr(gs, "player_gender", "male"),
+        "run_seed": int(getattr(gs, "run_seed", 0)),
 
         # party token filenames (NOT surfaces)
         "party_slots_names": names,
@@ -150,23 +150,8 @@ def save_game(gs, *, force: bool = False):
         "party_vessel_stats": stats_list,
 
         # spawns on map (no surfaces)
-        "rivals_on_map": [
-            {
-                "name":  r.get("name", ""),
-                "side":  r.get("side", "left"),
-                "x":     float(r["pos"].x),
-                "y":     float(r["pos"].y),
-            }
-            for r in getattr(gs, "rivals_on_map", [])
-        ],
-        "vessels_on_map": [
-            {
-                "side": v.get("side", "left"),
-                "x":    float(v["pos"].x),
-                "y":    float(v["pos"].y),
-            }
-            for v in getattr(gs, "vessels_on_map", [])
-        ],
+        "rivals_on_map":  [r.serialize() for r in getattr(gs, "rivals_on_map", [])],
+        "vessels_on_map": [v.serialize() for v in getattr(gs, "vessels_on_map", [])],
 
         # ✅ inventory
         "inventory": getattr(gs, "inventory", {}),
@@ -210,7 +195,10 @@ def load_game(gs, summoner_sprites: dict[str, object] | None = None):
         gs.player_pos.y       = float(data.get("player_y", gs.player_pos.y))
         gs.distance_travelled = float(data.get("distance_travelled", 0.0))
         gs.next_event_at      = float(data.get("next_event_at", 200.0))
+        gs.event_schedule     = EventScheduler.deserialize(data.get("event_schedule"))
         gs.player_gender      = data.get("player_gender", "male")
+        if isinstance(data.get("run_seed"), int):
+            gs.run_seed = data["run_seed"]   # same roadside props + ledger rolls as when saved
 
         # ✅ restore inventory
         inv = data.get("inventory", {})
@@ -240,48 +228,27 @@ def load_game(gs, summoner_sprites: dict[str, object] | None = None):
 
         # clear dynamic lists
         if not hasattr(gs, "rivals_on_map"):
-            gs.rivals_on_map = []
+            gs.rivals_on_map = SpawnIndex()
         else:
             gs.rivals_on_map.clear()
 
         if not hasattr(gs, "vessels_on_map"):
-            gs.vessels_on_map = []
+            gs.vessels_on_map = SpawnIndex()
         else:
             gs.vessels_on_map.clear()
 
         # rehydrate rivals (if we have sprite mapping)
-        rivals_json = data.get("rivals_on_map", [])
-        for r in rivals_json:
-            name = r.get("name", "")
-            side = r.get("side", "left")
-            x    = float(r.get("x", getattr(gs, "start_x", 0.0)))
-            y    = float(r.get("y", gs.player_pos.y))
-
-            sprite = None
-            if summoner_sprites:
-                sprite = summoner_sprites.get(name)
-
-            if sprite is None:
-                print(f"ℹ️ Skipping rival '{name}' (sprite not found).")
+        default_x, default_y = getattr(gs, "start_x", 0.0), gs.player_pos.y
+        for r in data.get("rivals_on_map", []):
+            rival = Rival.deserialize(r, summoner_sprites, default_x, default_y)
+            if rival is None:
+                print(f"ℹ️ Skipping rival '{r.get('name', '')}' (sprite not found).")
                 continue
-
-            gs.rivals_on_map.append({
-                "name": name,
-                "sprite": sprite,
-                "pos": Vector2(x, y),
-                "side": side,
-            })
+            gs.rivals_on_map.append(rival)
 
         # rehydrate vessel shadows
-        vessels_json = data.get("vessels_on_map", [])
-        for v in vessels_json:
-            side = v.get("side", "left")
-            x    = float(v.get("x", getattr(gs, "start_x", 0.0)))
-            y    = float(v.get("y", gs.player_pos.y))
-            gs.vessels_on_map.append({
-                "pos": Vector2(x, y),
-                "side": side,
-            })
+        for v in data.get("vessels_on_map", []):
+            gs.vessels_on_map.append(VesselShadow.deserialize(v, default_x, default_y))
 
         print(
             f"📂 Loaded save from {S.SAVE_PATH} (character={gs.player_gender}, "
@@ -0,0 +1,85 @@
+# ============================================================
+#  systems/scale_cache.py — memoised smoothscale/scale results
+#  - Key: (source Surface identity, target size, filter)
+#  - The entry holds the source too, so an id() can't be reused
+#    while its scaled variant is still cached
+#  - LRU bounded by SCALE_CACHE_BUDGET_MB, counting scaled outputs
+#    only: pinned sources are not charged (they are usually owned by
+#    asset_cache or a screen anyway), so an evicted entry is also
+#    what lets a discarded source be freed
+#  - Flushed automatically when S.WIDTH / S.HEIGHT change
+#  - Results are SHARED: copy() before drawing into one
+# ============================================================
+
+from collections import OrderedDict
+import pygame
+import settings as S
+
+_BUDGET_BYTES = int(getattr(S, "SCALE_CACHE_BUDGET_MB", 64)) * 1024 * 1024
+
+# (id(src), w, h, smooth) -> {"src": Surface, "surf": Surface, "bytes": int}
+_entries: "OrderedDict[tuple, dict]" = OrderedDict()
+_bytes_used = 0
+_screen_size = None
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "flushes": 0}
+
+
+# ---------- Helpers ----------
+def _check_screen_size():
+    global _screen_size
+    size = (S.WIDTH, S.HEIGHT)
+    if size != _screen_size:
+        if _screen_size is not None:
+            clear()
+            _stats["flushes"] += 1
+        _screen_size = size
+
+def _evict():
+    global _bytes_used
+    while _bytes_used > _BUDGET_BYTES and len(_entries) > 1:
+        _, entry = _entries.popitem(last=False)
+        _bytes_used -= entry["bytes"]
+        _stats["evictions"] += 1
+
+
+# ===================== Public API ===========================
+def scaled(src: pygame.Surface | None, size, smooth: bool = True) -> pygame.Surface | None:
+    """
+    Cached pygame.transform.smoothscale(src, size) (or .scale with
+    smooth=False). Returns src itself when the size already matches.
+    """
+    global _bytes_used
+    if src is None:
+        return None
+    w, h = max(1, int(size[0])), max(1, int(size[1]))
+    if src.get_size() == (w, h):
+        return src
+    _check_screen_size()
+
+    key = (id(src), w, h, bool(smooth))
+    entry = _entries.get(key)
+    if entry is not None and entry["src"] is src:
+        _entries.move_to_end(key)
+        _stats["hits"] += 1
+        return entry["surf"]
+
+    _stats["misses"] += 1
+    fn = pygame.transform.smoothscale if smooth else pygame.transform.scale
+    out = fn(src, (w, h))
+    entry = {"src": src, "surf": out, "bytes": out.get_pitch() * out.get_height()}
+    old = _entries.pop(key, None)
+    if old is not None:
+        _bytes_used -= old["bytes"]
+    _entries[key] = entry
+    _bytes_used += entry["bytes"]
+    _evict()
+    return out
+
+def clear():
+    """Drop every cached variant."""
+    global _bytes_used
+    _entries.clear()
+    _bytes_used = 0
+
+def stats() -> dict:
+    return {**_stats, "entries": len(_entries), "bytes": _bytes_used, "budget_bytes": _BUDGET_BYTES}
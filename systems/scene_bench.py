@@ -0,0 +1,330 @@
+# ============================================================
+#  systems/scene_bench.py — headless per-scene frame benchmark
+#
+#    python -m systems.scene_bench                  # every scene
+#    python -m systems.scene_bench ledger bag       # just these
+#    python -m systems.scene_bench --frames 600 --json out.json
+#
+#  - SDL dummy video/audio drivers (no window, no sound device)
+#  - Real enter()/handle()/draw() of each screen module
+#  - Fixed dt and a virtual pygame.time.get_ticks() so timers and
+#    animations advance the same way on every run
+#  - Scripted events per scene; held keys come from a scripted
+#    pygame.key.get_pressed()
+#  - Saves go to a temp dir, never to Saves/savegame.json
+# ============================================================
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import sys
+import json
+import random
+import tempfile
+import time
+import pygame
+from pygame.math import Vector2
+import settings as S
+
+DT       = 1.0 / 60.0
+WIDTH    = 1920
+HEIGHT   = 1080
+_clock   = {"ms": 0}
+_held    = set()      # keys reported as held by the scripted get_pressed()
+
+
+# ===================== Harness ==============================
+class _Keys:
+    """Stand-in for the ScancodeWrapper pygame.key.get_pressed() returns."""
+    def __getitem__(self, key):
+        return key in _held
+
+def _install_fakes():
+    pygame.time.get_ticks = lambda: _clock["ms"]
+    pygame.key.get_pressed = lambda: _Keys()
+
+def _key(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+def _click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+
+def _percentile(sorted_vals, p):
+    if not sorted_vals:
+        return 0.0
+    return sorted_vals[min(len(sorted_vals) - 1, int(round(p / 100.0 * (len(sorted_vals) - 1))))]
+
+def _run(name, frames, step, present=None):
+    """Call step(i) -> events-ignored frame body `frames` times; return stats dict."""
+    present = present or pygame.display.flip
+    times = []
+    t_all = time.perf_counter()
+    for i in range(frames):
+        t0 = time.perf_counter()
+        step(i)
+        present()
+        times.append((time.perf_counter() - t0) * 1000.0)
+        _clock["ms"] += int(DT * 1000)
+    total = time.perf_counter() - t_all
+    times.sort()
+    return {
+        "scene": name,
+        "frames": frames,
+        "fps": round(frames / total, 1) if total > 0 else 0.0,
+        "p50_ms": round(_percentile(times, 50), 3),
+        "p95_ms": round(_percentile(times, 95), 3),
+        "p99_ms": round(_percentile(times, 99), 3),
+        "max_ms": round(times[-1], 3) if times else 0.0,
+    }
+
+
+# ===================== Shared setup =========================
+def _setup():
+    """Display, audio bank, fonts, world assets and a GameState with a party."""
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    S.WIDTH, S.HEIGHT = WIDTH, HEIGHT
+
+    tmp = tempfile.mkdtemp(prefix="sl_bench_")
+    S.SAVE_DIR = tmp
+    S.SAVE_PATH = os.path.join(tmp, "savegame.json")
+
+    from systems import audio, theme, asset_index
+    from world import assets, world
+    from game_state import GameState
+    from combat.vessel_stats import generate_vessel_stats_from_asset
+    from bootstrap.default_inventory import add_default_inventory
+
+    audio.init_audio()
+    bank = audio.load_all()
+    S.AUDIO_BANK = bank
+    asset_index.build()
+    fonts = theme.load_fonts()
+    menu_bg = theme.load_menu_bg()
+    loaded = assets.load_everything()
+    variants = assets.load_player_variants()
+    world.load_road()
+
+    gs = GameState(
+        player_pos=Vector2(S.WORLD_W // 2, S.WORLD_H - 64),
+        player_speed=S.PLAYER_SPEED,
+        start_x=S.WORLD_W // 2,
+    )
+    idle = pygame.transform.smoothscale(variants["male"], S.PLAYER_SIZE)
+    gs.player_idle = gs.player_image = idle
+    gs.player_half = Vector2(idle.get_width() / 2, idle.get_height() / 2)
+    gs.player_pos.y = S.WORLD_H - gs.player_half.y - 10
+    gs.chosen_gender = gs.player_gender = "male"
+    gs.run_seed = 1234
+
+    party = ["FTokenBarbarian1.png", "MTokenRogue1.png", "FTokenCleric2.png"]
+    gs.party_slots_names = party + [None] * (6 - len(party))
+    gs.party_slots = list(gs.party_slots_names)
+    gs.party_vessel_stats = [generate_vessel_stats_from_asset(t, level=3) if t else None
+                             for t in gs.party_slots_names]
+    add_default_inventory(gs)
+
+    deps = dict(fonts=fonts, menu_bg=menu_bg, audio_bank=bank, player_variants=variants)
+    return screen, gs, deps, loaded
+
+
+# ===================== Scenes ===============================
+def scene_overworld(screen, gs, deps, loaded, frames):
+    from world import world, actors, procgen
+    from systems import party_ui
+
+    pg = procgen.ProcGen(rng_seed=42)
+    summoners = loaded["summoners"]
+    _held.add(pygame.K_w)
+    random.seed(7)
+
+    def step(i):
+        if i % 90 == 0:
+            actors.spawn_vessel_shadow_ahead(gs, gs.start_x)
+        if i % 150 == 75 and summoners:
+            actors.spawn_rival_ahead(gs, gs.start_x, summoners)
+        world.update_player(gs, DT, gs.player_half)
+        actors.update_rivals(gs, DT, gs.player_half)
+        actors.update_vessels(gs, DT, gs.player_half, loaded["vessels"], loaded["rare_vessels"])
+        gs.in_encounter = False           # keep walking through encounters
+        cam = world.get_camera_offset(gs.player_pos, S.WIDTH, S.HEIGHT, gs.player_half)
+        pg.update_needed(cam.y, S.HEIGHT)
+        pg.draw_world(screen, cam.x, cam.y, S.WIDTH, S.HEIGHT)
+        actors.draw_vessels(screen, cam, gs, loaded["mist_frames"][0] if loaded["mist_frames"] else None)
+        actors.draw_rivals(screen, cam, gs)
+        screen.blit(gs.player_image, (gs.player_pos.x - cam.x - gs.player_half.x,
+                                      gs.player_pos.y - cam.y - gs.player_half.y))
+        party_ui.draw_party_hud(screen, gs)
+
+    try:
+        return _run("overworld", frames, step)
+    finally:
+        _held.discard(pygame.K_w)
+
+def scene_overworld_idle(screen, gs, deps, loaded, frames):
+    """Player standing still: animated mist + HUD through the dirty-rect renderer."""
+    from world import world, actors, procgen
+    from systems import party_ui, dirty_rects
+
+    pg = procgen.ProcGen(rng_seed=42)
+    mist = loaded["mist_frames"] or [None]
+    dirty = dirty_rects.DirtyRenderer()
+    random.seed(7)
+    for _ in range(3):
+        actors.spawn_vessel_shadow_ahead(gs, gs.start_x)
+    for k, v in enumerate(gs.vessels_on_map):     # on screen, so the mist repaints count
+        v.y = gs.player_pos.y - 250 - 150 * k
+    gs.vessels_on_map.resort()
+    gs.player_image = gs.player_idle
+
+    def step(i):
+        mist_frame = mist[(i // 6) % len(mist)]
+        cam = world.get_camera_offset(gs.player_pos, S.WIDTH, S.HEIGHT, gs.player_half)
+        pg.update_needed(cam.y, S.HEIGHT)
+        full = dirty.begin(cam)
+        actors.track_dirty(dirty, cam, gs, mist_frame)
+        if party_ui.hud_rect() is not None:
+            dirty.track("hud", party_ui.hud_rect(), party_ui.hud_signature(gs))
+        for clip in ([None] if full else dirty.regions()):
+            screen.set_clip(clip)
+            pg.draw_world(screen, cam.x, cam.y, S.WIDTH, S.HEIGHT)
+            actors.draw_vessels(screen, cam, gs, mist_frame)
+            actors.draw_rivals(screen, cam, gs)
+            screen.blit(gs.player_image, (gs.player_pos.x - cam.x - gs.player_half.x,
+                                          gs.player_pos.y - cam.y - gs.player_half.y))
+            party_ui.draw_party_hud(screen, gs)
+        screen.set_clip(None)
+
+    try:
+        return _run("overworld_idle", frames, step, present=dirty.present)
+    finally:
+        gs.vessels_on_map.clear()
+
+def scene_wild_vessel(screen, gs, deps, loaded, frames):
+    from combat import wild_vessel
+    name, sprite = loaded["vessels"].choice(random.Random(3))
+    gs.encounter_name, gs.encounter_sprite = name, sprite
+    gs.in_encounter = True
+    wild_vessel.enter(gs, **deps)
+
+    def step(i):
+        wild_vessel.handle([], gs, **deps)
+        wild_vessel.draw(screen, gs, DT, **deps)
+
+    result = _run("wild_vessel", frames, step)
+    gs.in_encounter = False
+    gs._wild = None
+    return result
+
+def scene_summoner_battle(screen, gs, deps, loaded, frames):
+    """Intro slide-in + textbox, then dismiss it to play slide-out and the summon VFX."""
+    from combat import summoner_battle
+    name, sprite = loaded["summoners"][0]
+    gs.encounter_name, gs.encounter_sprite = name, sprite
+    gs.in_encounter = True
+    summoner_battle.enter(gs, **deps)
+    dismiss_at = frames // 3
+
+    def step(i):
+        events = [_key(pygame.K_RETURN)] if i == dismiss_at else []
+        summoner_battle.handle(events, gs)
+        summoner_battle.draw(screen, gs, DT, **deps)
+
+    result = _run("summoner_battle", frames, step)
+    gs.in_encounter = False
+    for attr in ("_summ_ui", "_pending_enemy_party"):
+        if hasattr(gs, attr):
+            delattr(gs, attr)
+    return result
+
+def scene_ledger(screen, gs, deps, loaded, frames):
+    """Open the book, then turn a page right/left every 30 frames."""
+    from screens import ledger
+    ledger.open(gs, 0)
+
+    def step(i):
+        screen.fill((20, 20, 20))
+        if i > 30 and i % 30 == 0:
+            ledger.handle_event(_key(pygame.K_RIGHT if (i // 30) % 2 else pygame.K_LEFT), gs)
+        ledger.draw(screen, gs)
+
+    try:
+        return _run("ledger", frames, step)
+    finally:
+        ledger.close()
+
+def scene_bag(screen, gs, deps, loaded, frames):
+    """Bag popup over the HUD, with mouse wheel scrolling."""
+    from combat.btn import bag_action
+    from systems import party_ui
+    bag_action.open_popup()
+
+    def step(i):
+        screen.fill((20, 20, 20))
+        if i % 20 == 0:
+            wheel = pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=(-1 if (i // 20) % 2 else 1),
+                                       flipped=False, precise_x=0.0, precise_y=0.0)
+            bag_action.handle_event(wheel, gs)
+        party_ui.draw_party_hud(screen, gs)
+        bag_action.draw_popup(screen, gs)
+
+    try:
+        return _run("bag", frames, step)
+    finally:
+        bag_action.close_popup()
+
+SCENES = {
+    "overworld":       scene_overworld,
+    "overworld_idle":  scene_overworld_idle,
+    "wild_vessel":     scene_wild_vessel,
+    "summoner_battle": scene_summoner_battle,
+    "ledger":          scene_ledger,
+    "bag":             scene_bag,
+}
+
+
+# ===================== Entry point ==========================
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    frames, json_path, names = 300, None, []
+    while argv:
+        a = argv.pop(0)
+        if a == "--frames":
+            frames = int(argv.pop(0))
+        elif a == "--json":
+            json_path = argv.pop(0)
+        elif a in SCENES:
+            names.append(a)
+        else:
+            print(f"⚠️ Unknown argument '{a}'. Scenes: {', '.join(SCENES)}")
+            return 2
+    names = names or list(SCENES)
+
+    _install_fakes()
+    screen, gs, deps, loaded = _setup()
+
+    results = []
+    for name in names:
+        try:
+            results.append(SCENES[name](screen, gs, deps, loaded, frames))
+        except Exception as e:
+            print(f"⚠️ Scene '{name}' failed: {e!r}")
+            results.append({"scene": name, "error": repr(e)})
+
+    print(f"\n{'scene':<18}{'fps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for r in results:
+        if "error" in r:
+            print(f"{r['scene']:<18}  FAILED  {r['error']}")
+        else:
+            print(f"{r['scene']:<18}{r['fps']:>9}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}{r['max_ms']:>9}")
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"frames": frames, "dt": DT, "size": [WIDTH, HEIGHT], "results": results}, f, indent=2)
+        print(f"📝 Results written to {json_path}")
+    return 0 if all("error" not in r for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
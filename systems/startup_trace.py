@@ -0,0 +1,137 @@
+# ============================================================
+#  systems/startup_trace.py — where does launch time go?
+#  - with phase("name"): records wall time + resident-memory delta
+#  - Counts image / sound decodes while tracing (pygame.image.load
+#    and pygame.mixer.Sound are wrapped between begin() and report())
+#  - report(): sorted table on stdout, or JSON to the file named by
+#    $SUMMONERS_STARTUP_JSON (e.g. for build-to-build comparisons)
+# ============================================================
+
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+import pygame
+
+ENV_JSON = "SUMMONERS_STARTUP_JSON"
+
+_phases: list[dict] = []
+_counts = {"image": 0, "sound": 0}
+_active: list[dict] = []          # stack of open phases (nesting allowed)
+_t_begin = None
+_orig = {}
+
+
+# ---------- Memory probe ----------
+def _rss_bytes() -> int:
+    """Current resident set size (0 if the platform gives us nothing)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except Exception:
+        return 0
+
+
+# ---------- Decode counters ----------
+def count(kind: str, n: int = 1):
+    """Record decodes done outside this process (e.g. worker pools)."""
+    if _t_begin is not None:
+        _counts[kind] = _counts.get(kind, 0) + n
+        for ph in _active:
+            ph["decodes"][kind] = ph["decodes"].get(kind, 0) + n
+
+def _install_hooks():
+    if _orig:
+        return
+    _orig["image.load"] = pygame.image.load
+    _orig["mixer.Sound"] = pygame.mixer.Sound
+
+    def _counting_load(*args, **kwargs):
+        count("image")
+        return _orig["image.load"](*args, **kwargs)
+
+    class _CountingSound(_orig["mixer.Sound"]):
+        def __init__(self, *args, **kwargs):
+            count("sound")
+            super().__init__(*args, **kwargs)
+
+    pygame.image.load = _counting_load
+    pygame.mixer.Sound = _CountingSound
+
+def _remove_hooks():
+    if not _orig:
+        return
+    pygame.image.load = _orig.pop("image.load")
+    pygame.mixer.Sound = _orig.pop("mixer.Sound")
+
+
+# ===================== Public API ===========================
+def begin():
+    """Start a trace (call once, as early as possible)."""
+    global _t_begin
+    _phases.clear()
+    _counts.update(image=0, sound=0)
+    _t_begin = time.perf_counter()
+    _install_hooks()
+
+@contextmanager
+def phase(name: str):
+    """Time one startup step. No-op bookkeeping if begin() wasn't called."""
+    if _t_begin is None:
+        yield
+        return
+    ph = {"name": name, "decodes": {}, "depth": len(_active)}
+    _active.append(ph)
+    rss0, t0 = _rss_bytes(), time.perf_counter()
+    try:
+        yield
+    finally:
+        ph["ms"] = (time.perf_counter() - t0) * 1000.0
+        ph["rss_delta"] = _rss_bytes() - rss0
+        _active.pop()
+        _phases.append(ph)
+
+def report() -> dict:
+    """Stop tracing, print (or dump) the report and return it as a dict."""
+    global _t_begin
+    if _t_begin is None:
+        return {}
+    total_ms = (time.perf_counter() - _t_begin) * 1000.0
+    _remove_hooks()
+    _t_begin = None
+
+    data = {
+        "total_ms": round(total_ms, 2),
+        "rss_bytes": _rss_bytes(),
+        "decodes": dict(_counts),
+        "phases": [
+            {"name": p["name"], "ms": round(p["ms"], 2), "rss_delta": p["rss_delta"],
+             "decodes": p["decodes"], "depth": p["depth"]}
+            for p in sorted(_phases, key=lambda p: p["ms"], reverse=True)
+        ],
+    }
+
+    out_path = os.environ.get(ENV_JSON)
+    if out_path:
+        try:
+            with open(out_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            print(f"⏱️ Startup trace written to {out_path}")
+        except Exception as e:
+            print(f"⚠️ Startup trace write failed: {e}")
+        return data
+
+    print(f"⏱️ Startup: {total_ms:.0f} ms total, "
+          f"{_counts['image']} image / {_counts['sound']} sound decodes")
+    for p in data["phases"]:
+        dec = ", ".join(f"{k}={v}" for k, v in p["decodes"].items() if v) or "-"
+        print(f"   {'  ' * p['depth']}{p['name']:<28} {p['ms']:8.1f} ms  "
+              f"{p['rss_delta'] / (1024 * 1024):+7.1f} MB  decodes: {dec}")
+    return data
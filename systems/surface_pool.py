@@ -0,0 +1,78 @@
+# ============================================================
+#  systems/surface_pool.py — reusable scratch surfaces + dims
+#  - scratch(size, tag=...): one buffer per (size, flags, tag),
+#    cleared and handed back every frame instead of reallocated.
+#    Distinct tags = distinct buffers within the same frame
+#  - dim(target, alpha, color, rect): blits a pooled OPAQUE fill
+#    with set_alpha(), no per-pixel alpha surface per frame
+#    (per-pixel-alpha targets get a pooled RGBA fill instead)
+#  - Buffers are SHARED: don't keep a scratch surface past the
+#    frame that asked for it
+# ============================================================
+
+from collections import OrderedDict
+import pygame
+
+_MAX_ENTRIES = 24
+
+# (w, h, flags, tag) -> Surface   /   ("dim", w, h, color) -> Surface
+_pool: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+
+
+# ---------- Helpers ----------
+def _get(key, make):
+    surf = _pool.get(key)
+    if surf is not None:
+        _pool.move_to_end(key)
+        _stats["hits"] += 1
+        return surf
+    _stats["misses"] += 1
+    surf = _pool[key] = make()
+    while len(_pool) > _MAX_ENTRIES:
+        _pool.popitem(last=False)
+    return surf
+
+def _opaque(size, color) -> pygame.Surface:
+    surf = pygame.Surface(size)
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    surf.fill(color)
+    return surf
+
+
+# ===================== Public API ===========================
+def scratch(size, flags: int = pygame.SRCALPHA, tag: str = "", fill=(0, 0, 0, 0)) -> pygame.Surface:
+    """Pooled surface of `size`, cleared to `fill` (clip and surface alpha reset)."""
+    w, h = max(1, int(size[0])), max(1, int(size[1]))
+    surf = _get((w, h, flags, tag), lambda: pygame.Surface((w, h), flags))
+    surf.set_clip(None)
+    surf.set_alpha(255 if flags & pygame.SRCALPHA else None)  # None would disable blending
+    surf.fill(fill)
+    return surf
+
+def dim(target: pygame.Surface, alpha: int, color=(0, 0, 0), rect=None):
+    """Blend `color` at `alpha` over `target` (whole surface or `rect`)."""
+    alpha = int(alpha)
+    if alpha <= 0:
+        return
+    r = pygame.Rect(rect) if rect is not None else target.get_rect()
+    if r.w <= 0 or r.h <= 0:
+        return
+    color = tuple(color[:3])
+    if alpha >= 255:
+        target.fill(color, r)
+        return
+    if target.get_flags() & pygame.SRCALPHA:
+        # surface alpha would make the target opaque; blend a pooled per-pixel fill
+        surf = scratch(r.size, tag="dim", fill=(*color, alpha))
+    else:
+        surf = _get(("dim", r.w, r.h, color), lambda: _opaque(r.size, color))
+        surf.set_alpha(alpha)
+    target.blit(surf, r.topleft)
+
+def clear():
+    _pool.clear()
+
+def stats() -> dict:
+    return {**_stats, "entries": len(_pool)}
@@ -0,0 +1,216 @@
+# ============================================================
+#  systems/video_cache.py — pre-transcoded raw video frames
+#  - The first live playback of a clip records every (already
+#    scaled) frame to INTRO_CACHE_DIR/<clip>.raw via Recorder
+#  - Later runs open_clip() that file: mmapped, random access by
+#    frame index, no moviepy/imageio needed
+#  - Frames are stored in the playback Surface's own pixel layout
+#    with rows packed (no pitch padding), so showing one is a
+#    row copy into a single persistent Surface
+#  - Stale files (source size/mtime, window size, pixel format)
+#    are ignored and re-recorded on the next live playback
+#  - python -m systems.video_cache: record/reopen self-check
+# ============================================================
+
+import os
+import mmap
+import struct
+import numpy as np
+import pygame
+import settings as S
+
+_MAGIC   = b"SLVR"
+_VERSION = 2
+# magic, version, window w/h, frame w/h, packed row bytes, bitsize, fps, frame count,
+# source size, source mtime_ns, r/g/b masks
+_HEADER  = struct.Struct("<4sIIIIIIIfIqqIII")
+_DEPTH   = 24
+
+
+# ---------- Helpers ----------
+def cache_path(src_path: str) -> str:
+    name = os.path.splitext(os.path.basename(src_path))[0] + ".raw"
+    return os.path.join(getattr(S, "INTRO_CACHE_DIR", os.path.join("Saves", "intro_cache")), name)
+
+def _src_sig(src_path: str) -> tuple[int, int]:
+    st = os.stat(src_path)
+    return st.st_size, st.st_mtime_ns
+
+def _frame_surface(size) -> pygame.Surface:
+    return pygame.Surface(size, 0, _DEPTH)
+
+def _row_bytes(surf: pygame.Surface) -> int:
+    return surf.get_width() * surf.get_bytesize()
+
+def _pixel_rows(surf: pygame.Surface) -> np.ndarray:
+    """(h, w * bytesize) view of the pixels, skipping the row padding 24-bit
+    surfaces get when w * 3 isn't a multiple of 4 (get_view("0") refuses those)."""
+    buf = np.frombuffer(surf.get_buffer(), np.uint8)
+    return buf.reshape(surf.get_height(), surf.get_pitch())[:, :_row_bytes(surf)]
+
+
+# ===================== Playback =============================
+class RawClip:
+    """mmapped frame file; frame(i) copies frame i into one persistent Surface."""
+
+    def __init__(self, path: str, f, mm: mmap.mmap, hdr: tuple):
+        (_, _, _, _, w, h, row, bits, fps, count, _, _, rm, gm, bm) = hdr
+        self.path = path
+        self.fps = float(fps)
+        self.count = int(count)
+        self.surface = pygame.Surface((w, h), 0, bits, (rm, gm, bm, 0))
+        self._f, self._mm = f, mm
+        self._frames = np.frombuffer(mm, np.uint8, count=count * row * h,
+                                     offset=_HEADER.size).reshape(count, h, row)
+        self._shown = -1
+
+    @property
+    def duration(self) -> float:
+        return self.count / max(1e-6, self.fps)
+
+    def frame(self, idx: int) -> pygame.Surface:
+        idx = max(0, min(self.count - 1, int(idx)))
+        if idx != self._shown:
+            rows = _pixel_rows(self.surface)
+            np.copyto(rows, self._frames[idx])
+            del rows  # unlocks the Surface for blitting
+            self._shown = idx
+        return self.surface
+
+    def close(self):
+        self._frames = None
+        try:
+            self._mm.close()
+        except Exception:
+            pass
+        try:
+            self._f.close()
+        except Exception:
+            pass
+
+def open_clip(src_path: str, window_size) -> RawClip | None:
+    """Cached frames for `src_path` at `window_size`, or None if missing/stale."""
+    path = cache_path(src_path)
+    if not os.path.exists(path):
+        return None
+    f = mm = None
+    try:
+        size, mtime = _src_sig(src_path)
+        f = open(path, "rb")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        hdr = _HEADER.unpack_from(mm, 0)
+        (magic, ver, win_w, win_h, w, h, row, bits, _, count,
+         src_size, src_mtime, rm, gm, bm) = hdr
+        probe = _frame_surface((max(1, w), max(1, h)))
+        ok = (magic == _MAGIC and ver == _VERSION and count > 0
+              and (win_w, win_h) == tuple(window_size)
+              and (src_size, src_mtime) == (size, mtime)
+              and (bits, row) == (probe.get_bitsize(), _row_bytes(probe))
+              and (rm, gm, bm) == probe.get_masks()[:3]
+              and len(mm) >= _HEADER.size + count * row * h)
+        if not ok:
+            mm.close(); f.close()
+            return None
+        return RawClip(path, f, mm, hdr)
+    except Exception as e:
+        print(f"⚠️ Intro cache unreadable ({path}): {e}")
+        for handle in (mm, f):
+            try:
+                if handle is not None: handle.close()
+            except Exception:
+                pass
+        return None
+
+
+# ===================== Recording ============================
+class Recorder:
+    """Appends converted frames to a temp file; finish() publishes it."""
+
+    def __init__(self, src_path: str, window_size, fps: float):
+        self.src_path = src_path
+        self.window_size = tuple(window_size)
+        self.fps = float(fps)
+        self.path = cache_path(src_path)
+        self._tmp = self.path + ".tmp"
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._f = open(self._tmp, "wb")
+        self._f.write(b"\0" * _HEADER.size)
+        self._surf = None
+        self.count = 0
+
+    def write(self, frame: pygame.Surface):
+        if self._surf is None:
+            self._surf = _frame_surface(frame.get_size())
+        elif frame.get_size() != self._surf.get_size():
+            raise ValueError("frame size changed mid-clip")
+        self._surf.blit(frame, (0, 0))
+        rows = _pixel_rows(self._surf)
+        self._f.write(rows.tobytes())
+        del rows
+        self.count += 1
+
+    def finish(self) -> str | None:
+        try:
+            if self._surf is None or not self.count:
+                self.abort()
+                return None
+            w, h = self._surf.get_size()
+            size, mtime = _src_sig(self.src_path)
+            rm, gm, bm = self._surf.get_masks()[:3]
+            self._f.seek(0)
+            self._f.write(_HEADER.pack(_MAGIC, _VERSION, *self.window_size, w, h,
+                                       _row_bytes(self._surf), self._surf.get_bitsize(),
+                                       self.fps, self.count, size, mtime, rm, gm, bm))
+            self._f.close()
+            os.replace(self._tmp, self.path)
+            print(f"📦 Intro cached: {self.count} frames → {self.path}")
+            return self.path
+        except Exception as e:
+            print(f"⚠️ Intro cache write failed: {e}")
+            self.abort()
+            return None
+
+    def abort(self):
+        try:
+            self._f.close()
+        except Exception:
+            pass
+        try:
+            os.remove(self._tmp)
+        except Exception:
+            pass
+
+
+# ===================== Self-check ===========================
+#    python -m systems.video_cache
+#  Records + reopens clips at widths whose 24-bit rows are padded
+#  (1366, odd 1365) and an unpadded one, and compares the pixels.
+def _self_check() -> bool:
+    import tempfile
+    ok = True
+    src = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
+    src.write(b"not really a video"); src.close()
+    S.INTRO_CACHE_DIR = tempfile.mkdtemp(prefix="sl_vcache_")
+    for size in ((1366, 768), (1365, 767), (1920, 1080)):
+        frames = []
+        for i in range(3):
+            f = pygame.Surface(size)
+            f.fill((40 * i, 90, 200 - 30 * i))
+            pygame.draw.line(f, (255, 255, 255), (0, i), (size[0] - 1, size[1] - 1 - i))
+            frames.append(f)
+        rec = Recorder(src.name, size, 30.0)
+        for f in frames:
+            rec.write(f)
+        clip = open_clip(src.name, size) if rec.finish() else None
+        same = clip is not None and clip.count == len(frames) and all(
+            pygame.image.tobytes(clip.frame(i), "RGB") == pygame.image.tobytes(f, "RGB")
+            for i, f in enumerate(frames))
+        if clip is not None:
+            clip.close()
+        print(f"{'✅' if same else '⚠️'} {size[0]}x{size[1]}: record + reopen {'ok' if same else 'FAILED'}")
+        ok = ok and same
+    os.remove(src.name)
+    return ok
+
+if __name__ == "__main__":
+    raise SystemExit(0 if _self_check() else 1)
@@ -10,23 +10,24 @@ import settings as S
 # ✅ Stats/rolling for encounters (new path)
 from combat.vessel_stats import generate_vessel_stats_from_asset
 from rolling.roller import Roller
+from world.spawn_records import Rival, VesselShadow
 
 
-# Lists live on the GameState object:
-# gs.rivals_on_map:  list of dict {name, sprite, pos(Vector2), side}
-# gs.vessels_on_map: list of dict {pos(Vector2), side}
+# Lists live on the GameState object, both y-sorted SpawnIndex lists:
+# gs.rivals_on_map:  Rival records (name, sprite, x, y, side)
+# gs.vessels_on_map: VesselShadow records (x, y, side)
 
 
 # ===================== Shared spawn helpers ==================
 def _y_too_close(y: float, gs, min_sep: float) -> bool:
     """Return True if y is within min_sep of any existing spawn (vessels or rivals)."""
-    for r in gs.rivals_on_map:
-        if abs(y - r["pos"].y) < min_sep:
-            return True
-    for v in gs.vessels_on_map:
-        if abs(y - v["pos"].y) < min_sep:
-            return True
-    return False
+    return gs.rivals_on_map.any_within(y, min_sep) or gs.vessels_on_map.any_within(y, min_sep)
+
+def _touching_player(spawns, gs, player_half: Vector2) -> range:
+    """Indices of spawns whose y overlaps the player's (same test the encounter checks use)."""
+    reach = S.PLAYER_SIZE[1] // 2 + S.FRONT_TOLERANCE
+    return spawns.span(gs.player_pos.y - player_half.y - reach,
+                       gs.player_pos.y + player_half.y + reach)
 
 
 def _pick_spawn_y(gs, base_y: float, min_sep: float, max_attempts: int = 8):
@@ -65,12 +66,7 @@ def spawn_rival_ahead(gs, start_x, summoners):
         # If no clean slot found, skip spawn to avoid visual overlap
         return
 
-    gs.rivals_on_map.append({
-        "name": name,
-        "sprite": sprite,
-        "pos": Vector2(x, y),
-        "side": side,
-    })
+    gs.rivals_on_map.append(Rival(name, sprite, x, y, side))
 
 
 def update_rivals(gs, dt, player_half: Vector2):
@@ -85,11 +81,12 @@ def update_rivals(gs, dt, player_half: Vector2):
     player_top    = gs.player_pos.y - player_half.y
     player_bottom = gs.player_pos.y + player_half.y
 
-    for i, r in enumerate(gs.rivals_on_map):
-        same_lane = abs(r["pos"].x - gs.player_pos.x) <= x_threshold
+    for i in _touching_player(gs.rivals_on_map, gs, player_half):
+        r = gs.rivals_on_map[i]
+        same_lane = abs(r.x - gs.player_pos.x) <= x_threshold
 
-        rival_top    = r["pos"].y - SIZE_H // 2
-        rival_bottom = r["pos"].y + SIZE_H // 2
+        rival_top    = r.y - SIZE_H // 2
+        rival_bottom = r.y + SIZE_H // 2
 
         in_front = player_top <= (rival_bottom + S.FRONT_TOLERANCE)
         overlapping_vertically = player_bottom >= (rival_top - S.FRONT_TOLERANCE)
@@ -97,8 +94,8 @@ def update_rivals(gs, dt, player_half: Vector2):
         if same_lane and in_front and overlapping_vertically:
             gs.in_encounter     = True
             gs.encounter_timer  = S.ENCOUNTER_SHOW_TIME
-            gs.encounter_name   = r["name"]
-            gs.encounter_sprite = r["sprite"]
+            gs.encounter_name   = r.name
+            gs.encounter_sprite = r.sprite
             gs.encounter_stats  = None  # rivals can have stats later if you want
             triggered_index     = i
             break
@@ -106,20 +103,35 @@ def update_rivals(gs, dt, player_half: Vector2):
     if triggered_index is not None:
         gs.rivals_on_map.pop(triggered_index)
 
-    # Cull far below player
-    cutoff = gs.player_pos.y + S.HEIGHT * 1.5
-    gs.rivals_on_map[:] = [r for r in gs.rivals_on_map if r["pos"].y < cutoff]
+    # Cull far below player (the sorted tail)
+    gs.rivals_on_map.trim_below(gs.player_pos.y + S.HEIGHT * 1.5)
 
 
 def draw_rivals(screen, cam, gs):
+    """All on-screen rivals in one blits() call."""
     SIZE_W, SIZE_H = S.PLAYER_SIZE
+    ox, oy = cam.x + SIZE_W // 2, cam.y + SIZE_H // 2
+    y_min, y_max = cam.y - SIZE_H, cam.y + screen.get_height() + SIZE_H
+    rivals = gs.rivals_on_map
+    batch = [(r.sprite, (int(r.x - ox), int(r.y - oy)))
+             for r in (rivals[i] for i in rivals.span(y_min, y_max))]
+    if batch:
+        screen.blits(batch, doreturn=False)
+
+
+def track_dirty(dirty, cam, gs, vessel_mist):
+    """Feed rival + vessel screen rects to a dirty_rects.DirtyRenderer (same math as the draws)."""
+    SIZE_W, SIZE_H = S.PLAYER_SIZE
+    mist_size = vessel_mist.get_size() if vessel_mist else (SIZE_W, SIZE_H)
+    for v in gs.vessels_on_map:
+        dirty.track(("vessel", id(v)),
+                    ((int(v.x - cam.x - SIZE_W // 2), int(v.y - cam.y - SIZE_H // 2)), mist_size),
+                    id(vessel_mist))
     for r in gs.rivals_on_map:
-        pos = r["pos"]
-        screen.blit(
-            r["sprite"],
-            (pos.x - cam.x - SIZE_W // 2,
-             pos.y - cam.y - SIZE_H // 2)
-        )
+        dirty.track(("rival", id(r)),
+                    r.sprite.get_rect(topleft=(int(r.x - cam.x - SIZE_W // 2),
+                                               int(r.y - cam.y - SIZE_H // 2))),
+                    id(r.sprite))
 
 
 # ===================== Vessels (mist shadows) =================
@@ -137,11 +149,14 @@ def spawn_vessel_shadow_ahead(gs, start_x):
     if y is None:
         return
 
-    gs.vessels_on_map.append({"pos": Vector2(x, y), "side": side})
+    gs.vessels_on_map.append(VesselShadow(x, y, side))
 
 
 def update_vessels(gs, dt, player_half: Vector2, vessels, rare_vessels):
-    """Reveal an actual vessel sprite when overlapping a mist shadow and ROLL ITS STATS."""
+    """
+    Reveal an actual vessel sprite when overlapping a mist shadow and ROLL ITS STATS.
+    vessels / rare_vessels are VesselRegistry objects (world/vessel_registry.py).
+    """
     if gs.in_encounter:
         return
 
@@ -152,21 +167,22 @@ def update_vessels(gs, dt, player_half: Vector2, vessels, rare_vessels):
     player_top    = gs.player_pos.y - player_half.y
     player_bottom = gs.player_pos.y + player_half.y
 
-    for i, v in enumerate(gs.vessels_on_map):
-        same_lane = abs(v["pos"].x - gs.player_pos.x) <= x_threshold
+    for i in _touching_player(gs.vessels_on_map, gs, player_half):
+        v = gs.vessels_on_map[i]
+        same_lane = abs(v.x - gs.player_pos.x) <= x_threshold
 
-        mist_top    = v["pos"].y - SIZE_H // 2
-        mist_bottom = v["pos"].y + SIZE_H // 2
+        mist_top    = v.y - SIZE_H // 2
+        mist_bottom = v.y + SIZE_H // 2
 
         in_front = player_top <= (mist_bottom + S.FRONT_TOLERANCE)
         overlapping_vertically = player_bottom >= (mist_top - S.FRONT_TOLERANCE)
 
         if same_lane and in_front and overlapping_vertically:
-            # Choose which vessel art/name appears
+            # Choose which vessel art/name appears (only the pick gets decoded)
             if rare_vessels and random.random() <= 0.005:
-                asset_name, sprite = random.choice(rare_vessels)
+                asset_name, sprite = rare_vessels.choice()
             elif vessels:
-                asset_name, sprite = random.choice(vessels)
+                asset_name, sprite = vessels.choice()
             else:
                 asset_name, sprite = "Unknown Vessel", None
 
@@ -204,32 +220,35 @@ def update_vessels(gs, dt, player_half: Vector2, vessels, rare_vessels):
     if triggered_index is not None:
         gs.vessels_on_map.pop(triggered_index)
 
-    # Cull far below player
-    cutoff = gs.player_pos.y + S.HEIGHT * 1.5
-    gs.vessels_on_map[:] = [v for v in gs.vessels_on_map if v["pos"].y < cutoff]
+    # Cull far below player (the sorted tail)
+    gs.vessels_on_map.trim_below(gs.player_pos.y + S.HEIGHT * 1.5)
+
+
+_placeholder = None   # (size, Surface) stand-in when there is no mist animation
 
+def _mist_placeholder(size) -> pygame.Surface:
+    global _placeholder
+    if _placeholder is None or _placeholder[0] != size:
+        temp = pygame.Surface(size, pygame.SRCALPHA)
+        temp.fill((30, 30, 30, 220))
+        pygame.draw.circle(temp, (0, 0, 0, 255), (size[0] // 2, size[1] // 2), size[0] // 2)
+        _placeholder = (size, temp)
+    return _placeholder[1]
 
 def draw_vessels(screen, cam, gs, vessel_mist, debug=False):
+    """All on-screen mist shadows in one blits() call."""
     SIZE_W, SIZE_H = S.PLAYER_SIZE
-    for v in gs.vessels_on_map:
-        pos = v["pos"]
-        screen_x = int(pos.x - cam.x - SIZE_W // 2)
-        screen_y = int(pos.y - cam.y - SIZE_H // 2)
-
-        if debug:
+    sprite = vessel_mist or _mist_placeholder((SIZE_W, SIZE_H))
+    y_min, y_max = cam.y - SIZE_H, cam.y + screen.get_height() + SIZE_H
+    vessels = gs.vessels_on_map
+    dests = [(int(v.x - cam.x - SIZE_W // 2), int(v.y - cam.y - SIZE_H // 2))
+             for v in (vessels[i] for i in vessels.span(y_min, y_max))]
+
+    if debug:
+        for screen_x, screen_y in dests:
             rect = pygame.Rect(screen_x, screen_y, SIZE_W, SIZE_H)
             pygame.draw.rect(screen, (255, 0, 255), rect, 2)
             pygame.draw.circle(screen, (255, 255, 0), rect.center, 3)
 
-        if vessel_mist:
-            screen.blit(vessel_mist, (screen_x, screen_y))
-        else:
-            # Fallback visible placeholder
-            temp = pygame.Surface((SIZE_W, SIZE_H), pygame.SRCALPHA)
-            temp.fill((30, 30, 30, 220))
-            pygame.draw.circle(
-                temp, (0, 0, 0, 255),
-                (SIZE_W // 2, SIZE_H // 2),
-                SIZE_W // 2
-            )
-            screen.blit(temp, (screen_x, screen_y))
+    if dests:
+        screen.blits([(sprite, d) for d in dests], doreturn=False)
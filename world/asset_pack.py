@@ -0,0 +1,243 @@
+# ============================================================
+#  world/asset_pack.py — pre-decoded, pre-scaled sprite pack
+#  - build(): decode + scale every overworld sprite once and write
+#    raw pixels into ONE file behind a JSON offset table
+#  - load(): mmap the file and wrap each record with
+#    pygame.image.frombuffer (no decode, no scale, no copy)
+#  - Rebuilds itself when a source PNG is newer than the pack,
+#    a source was added/removed, or PLAYER_SIZE changed
+#
+#  Benchmark:  python -m world.asset_pack --bench
+# ============================================================
+
+import os
+import sys
+import glob
+import json
+import mmap
+import struct
+import time
+import pygame
+import settings as S
+from systems import image_decode
+
+PACK_PATH = getattr(S, "ASSET_PACK_PATH", os.path.join("Saves", "asset_pack.bin"))
+
+_MAGIC   = b"SLPK"
+_VERSION = 1
+_HEAD    = struct.Struct("<4sII")   # magic, version, header_json_len
+_ALIGN   = 16
+# Byte order that matches convert_alpha() surfaces (ARGB8888 masks), so
+# frombuffer() surfaces blit as fast as freshly converted ones.
+_PIXEL_FORMAT = "BGRA" if sys.byteorder == "little" else "ARGB"
+
+# Keep every live mapping referenced: frombuffer surfaces point into it.
+_mappings: list[mmap.mmap] = []
+# (group, name) -> (memoryview slice, (w, h), format) of the last loaded pack,
+# for groups that load() left un-materialised (see surface()).
+_records: dict[tuple[str, str], tuple] = {}
+
+
+# ===================== What goes in the pack ================
+def _sorted_mist(paths):
+    return sorted(paths, key=lambda p: p.lower())
+
+def pack_groups():
+    """
+    [(group, [source paths])] in the exact order load_everything() returns
+    them. Mirrors the globbing in world/assets.py.
+    """
+    def _glob(folders, pattern):
+        out = []
+        for folder in folders:
+            out.extend(glob.glob(os.path.join(folder, pattern)))
+        return out
+
+    mist = _sorted_mist(glob.glob(os.path.join(S.ASSETS_MAP_DIR, "Mist*.png")))
+    if not mist:
+        fallback = os.path.join(S.ASSETS_MAP_DIR, "mist.png")
+        mist = [fallback] if os.path.exists(fallback) else []
+
+    return [
+        ("summoners",    _glob([S.ASSETS_SUMMONERS_MALE_DIR, S.ASSETS_SUMMONERS_FEMALE_DIR], "*Summoner*.png")),
+        ("vessels",      _glob([S.ASSETS_VESSELS_MALE_DIR, S.ASSETS_VESSELS_FEMALE_DIR], "*Vessel*.png")),
+        ("rare_vessels", _glob([S.ASSETS_VESSELS_RARE_DIR], "RVessel*.png")),
+        ("mist_frames",  mist),
+    ]
+
+
+# ===================== Build ================================
+def _mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+def build(path: str = PACK_PATH, size=None) -> bool:
+    """Decode + scale every source and write the pack. Returns True on success."""
+    size = tuple(size or S.PLAYER_SIZE)
+    records, blobs, offset = [], [], 0
+    sources = {}
+    for group, paths in pack_groups():
+        for src, baked in zip(paths, image_decode.decode_raw(paths, size=size, fmt=_PIXEL_FORMAT)):
+            if baked is None:
+                print(f"⚠️ Pack: failed to bake {src}")
+                continue
+            w, h, raw = baked
+            pad = (-offset) % _ALIGN
+            if pad:
+                blobs.append(b"\0" * pad)
+                offset += pad
+            records.append({
+                "group": group,
+                "name": os.path.splitext(os.path.basename(src))[0],
+                "w": w, "h": h,
+                "offset": offset, "length": len(raw),
+            })
+            blobs.append(raw)
+            offset += len(raw)
+            sources[os.path.normpath(src)] = _mtime_ns(src)
+
+    header = json.dumps({
+        "format": _PIXEL_FORMAT,
+        "size": list(size),
+        "sources": sources,
+        "records": records,
+    }).encode("utf-8")
+    # Pixel data starts on an aligned boundary after the header.
+    head_len = _HEAD.size + len(header)
+    data_start = head_len + ((-head_len) % _ALIGN)
+
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(_HEAD.pack(_MAGIC, _VERSION, len(header)))
+            f.write(header)
+            f.write(b"\0" * (data_start - head_len))
+            for b in blobs:
+                f.write(b)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"⚠️ Pack: write failed {path}: {e}")
+        return False
+    print(f"📦 Asset pack built: {len(records)} sprites, {offset / (1024 * 1024):.1f} MB → {path}")
+    return True
+
+
+# ===================== Load =================================
+def _read_header(mm: mmap.mmap):
+    magic, version, hlen = _HEAD.unpack_from(mm, 0)
+    if magic != _MAGIC or version != _VERSION:
+        return None, 0
+    header = json.loads(bytes(mm[_HEAD.size:_HEAD.size + hlen]).decode("utf-8"))
+    head_len = _HEAD.size + hlen
+    return header, head_len + ((-head_len) % _ALIGN)
+
+def _is_stale(header: dict, pack_mtime: int, size) -> bool:
+    if tuple(header.get("size", ())) != tuple(size) or header.get("format") != _PIXEL_FORMAT:
+        return True
+    wanted = {os.path.normpath(p) for _, paths in pack_groups() for p in paths}
+    baked = header.get("sources", {})
+    if wanted != set(baked):
+        return True
+    return any(_mtime_ns(p) > pack_mtime for p in baked)
+
+def load(path: str = PACK_PATH, size=None, rebuild: bool = True, groups=None):
+    """
+    Return {"summoners": [(name, surf)], "vessels": [...], "rare_vessels": [...],
+    "mist_frames": [surf, ...]} backed by the mmapped pack, rebuilding it
+    first if it is missing or stale. Returns None if the pack is unusable
+    (callers fall back to decoding PNGs).
+
+    With `groups`, only those groups get Surfaces up front; the others stay
+    as offsets and are wrapped on demand by surface(group, name).
+    """
+    size = tuple(size or S.PLAYER_SIZE)
+    for attempt in (0, 1):
+        mm = None
+        try:
+            with open(path, "rb") as f:
+                pack_mtime = os.fstat(f.fileno()).st_mtime_ns
+                # ACCESS_COPY: private mapping, so a caller drawing into one of
+                # these surfaces never writes back into the pack file.
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            header, data_start = _read_header(mm)
+            if header is not None and not _is_stale(header, pack_mtime, size):
+                out = {"summoners": [], "vessels": [], "rare_vessels": [], "mist_frames": []}
+                view = memoryview(mm)
+                _records.clear()
+                for r in header["records"]:
+                    start = data_start + r["offset"]
+                    rec = (view[start:start + r["length"]], (r["w"], r["h"]), header["format"])
+                    _records[(r["group"], r["name"])] = rec
+                    if groups is not None and r["group"] not in groups:
+                        continue
+                    surf = pygame.image.frombuffer(*rec)
+                    if r["group"] == "mist_frames":
+                        out["mist_frames"].append(surf)
+                    else:
+                        out.setdefault(r["group"], []).append((r["name"], surf))
+                _mappings.append(mm)
+                return out
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Pack: unreadable {path}: {e}")
+        if mm is not None:
+            try:
+                mm.close()
+            except BufferError:
+                pass
+        if attempt or not rebuild:
+            return None
+        print("📦 Asset pack missing or stale — rebuilding")
+        if not build(path, size):
+            return None
+    return None
+
+
+def surface(group: str, name: str) -> pygame.Surface | None:
+    """Wrap one record of the loaded pack (pages fault in on first blit)."""
+    rec = _records.get((group, name))
+    return pygame.image.frombuffer(*rec) if rec else None
+
+
+# ===================== Benchmark ============================
+def _bench(rounds: int = 3):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    from world import assets
+
+    def _png():
+        for _, paths in pack_groups():
+            for p in paths:
+                assets.load_image(p, size=S.PLAYER_SIZE)
+
+    def _pack():
+        if load(rebuild=False) is None:
+            raise RuntimeError("pack missing")
+        _mappings.pop()   # freed once the surfaces above are collected
+
+    build()
+    results = {}
+    for label, fn in (("png", _png), ("pack", _pack)):
+        times = []
+        for _ in range(rounds):
+            t0 = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t0)
+        results[label] = min(times)
+        print(f"{label:>5}: best {min(times) * 1000:8.1f} ms   (of {rounds})")
+    if results["pack"] > 0:
+        print(f"speedup: {results['png'] / results['pack']:.1f}x")
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        _bench()
+    else:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        build()
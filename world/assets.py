@@ -6,6 +6,8 @@ import os
 import glob
 import pygame
 import settings as S
+from systems import image_decode
+from world.vessel_registry import VesselRegistry
 
 
 # ===================== Image Helpers ========================
@@ -23,14 +25,17 @@ def load_all_sprites(folders, pattern="*.png", size=None):
     returns: list of (name, surface)
     If size is None, images load at native size.
     """
-    results = []
+    paths = []
     for folder in folders:
-        for path in glob.glob(os.path.join(folder, pattern)):
-            name = os.path.splitext(os.path.basename(path))[0]
-            try:
-                results.append((name, load_image(path, size)))
-            except Exception as e:
-                print(f"⚠️ Failed to load sprite {path}: {e}")
+        paths.extend(glob.glob(os.path.join(folder, pattern)))
+
+    # Decode + scale on worker processes; only convert_alpha() runs here
+    results = []
+    for path, surf in zip(paths, image_decode.load_many(paths, size=size)):
+        if surf is None:
+            print(f"⚠️ Failed to load sprite {path}")
+            continue
+        results.append((os.path.splitext(os.path.basename(path))[0], surf))
     return results
 
 
@@ -46,6 +51,27 @@ def load_everything():
     else:
         print(f"⚠️ Missing default player: {default_player_path}")
 
+    # Vessels are only NAMES here; sprites decode when one is revealed
+    vessels = VesselRegistry(
+        "vessels", [S.ASSETS_VESSELS_MALE_DIR, S.ASSETS_VESSELS_FEMALE_DIR], "*Vessel*.png"
+    )
+    rare_vessels = VesselRegistry("rare_vessels", [S.ASSETS_VESSELS_RARE_DIR], "RVessel*.png")
+
+    # Fast path: pre-scaled sprites straight out of the mmapped pack
+    if getattr(S, "ASSET_PACK_ENABLED", True):
+        from world import asset_pack
+        packed = asset_pack.load(groups=("summoners", "mist_frames"))
+        if packed is not None:
+            print(f"🧪 Loaded from pack: {len(packed['summoners'])} summoners, {len(vessels)} vessels, "
+                  f"{len(rare_vessels)} rare (lazy), {len(packed['mist_frames'])} mist frames")
+            return {
+                "player": player,
+                "summoners": packed["summoners"],
+                "vessels": vessels,
+                "rare_vessels": rare_vessels,
+                "mist_frames": packed["mist_frames"],
+            }
+
     # Summoners (male + female) — scale to gameplay size
     summoners = load_all_sprites(
         [S.ASSETS_SUMMONERS_MALE_DIR, S.ASSETS_SUMMONERS_FEMALE_DIR],
@@ -53,20 +79,6 @@ def load_everything():
         size=S.PLAYER_SIZE
     )
 
-    # Common vessels (male + female)
-    vessels = load_all_sprites(
-        [S.ASSETS_VESSELS_MALE_DIR, S.ASSETS_VESSELS_FEMALE_DIR],
-        pattern="*Vessel*.png",
-        size=S.PLAYER_SIZE
-    )
-
-    # Rare vessels
-    rare_vessels = load_all_sprites(
-        [S.ASSETS_VESSELS_RARE_DIR],
-        pattern="RVessel*.png",
-        size=S.PLAYER_SIZE
-    )
-
     # Mist ANIMATION frames (Assets/Map/Mist1..9.png, or any Mist*.png)
     mist_frames = []
     try:
@@ -91,7 +103,7 @@ def load_everything():
             except Exception as e:
                 print(f"⚠️ Failed to load fallback mist {mist_path}: {e}")
 
-    print(f"🧪 Loaded: {len(summoners)} summoners, {len(vessels)} vessels, {len(rare_vessels)} rare, {len(mist_frames)} mist frames")
+    print(f"🧪 Loaded: {len(summoners)} summoners, {len(vessels)} vessels, {len(rare_vessels)} rare (lazy), {len(mist_frames)} mist frames")
     return {
         "player": player,
         "summoners": summoners,
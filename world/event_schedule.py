@@ -0,0 +1,112 @@
+# ============================================================
+#  world/event_schedule.py — distance-keyed overworld event queue
+#  - Min-heap of (distance, seq, kind) for upcoming events
+#  - Filled a block of BLOCK_EVENTS at a time; block b is drawn from
+#    random.Random(hash((seed, b))), so a run's schedule is fixed by
+#    gs.run_seed
+#  - due(distance) pops everything reached; peek(n) looks ahead
+#    without consuming (pre-spawn / pre-load hooks)
+#  - serialize() is a small JSON dict; deserialize() resumes it
+# ============================================================
+
+import heapq
+import random
+import settings as S
+
+KINDS = ("vessel", "rival", "boss", "shop")   # serialised by index; append only
+
+BLOCK_EVENTS = 16   # events generated per refill
+LOOKAHEAD    = 4    # refill when fewer than this many are pending
+_FORMAT      = 1
+
+
+def _weights() -> list[float]:
+    """Per-KINDS weights; boss/shop default to 0 until something handles them."""
+    vessel = float(getattr(S, "ENCOUNTER_WEIGHT_VESSEL", 0.75))
+    table = {"vessel": vessel, "rival": 1.0 - vessel, "boss": 0.0, "shop": 0.0}
+    table.update(getattr(S, "EVENT_KIND_WEIGHTS", None) or {})
+    return [max(0.0, float(table.get(k, 0.0))) for k in KINDS]
+
+
+class EventScheduler:
+    def __init__(self, seed: int, start_at: float | None = None):
+        self.seed = seed
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = 0
+        self._block = 0
+        self._horizon = float(S.FIRST_EVENT_AT if start_at is None else start_at)
+        self._refill()
+
+    # ---------- Generation ----------
+    def _generate_block(self):
+        rng = random.Random(hash((self.seed, self._block)))
+        weights = _weights()
+        if not any(weights):
+            weights = [1.0] + [0.0] * (len(KINDS) - 1)
+        at = self._horizon
+        for _ in range(BLOCK_EVENTS):
+            self.push(at, rng.choices(KINDS, weights)[0])
+            at += rng.randint(S.EVENT_MIN, S.EVENT_MAX)
+        self._horizon = at
+        self._block += 1
+
+    def _refill(self):
+        while len(self._heap) < LOOKAHEAD:
+            self._generate_block()
+
+    # ===================== Public API =======================
+    def push(self, at: float, kind: str):
+        """Schedule an extra event (scripted, or re-queued) at distance `at`."""
+        heapq.heappush(self._heap, (float(at), self._seq, kind))
+        self._seq += 1
+
+    def due(self, distance: float) -> list[str]:
+        """Pop every event at or before `distance`, in order."""
+        out = []
+        while self._heap and self._heap[0][0] <= distance:
+            out.append(heapq.heappop(self._heap)[2])
+        if out:
+            self._refill()
+        return out
+
+    def peek(self, n: int = LOOKAHEAD) -> list[tuple[float, str]]:
+        """The next n (distance, kind) pairs without consuming them."""
+        while len(self._heap) < n:
+            self._generate_block()
+        return [(at, kind) for at, _, kind in heapq.nsmallest(n, self._heap)]
+
+    @property
+    def next_at(self) -> float:
+        return self._heap[0][0]
+
+    def __len__(self):
+        return len(self._heap)
+
+    # ---------- Save / load ----------
+    def serialize(self) -> dict:
+        events = sorted(self._heap)
+        return {
+            "v": _FORMAT,
+            "seed": self.seed,
+            "block": self._block,
+            "horizon": self._horizon,
+            "events": [[round(at, 2), KINDS.index(kind)] for at, _, kind in events if kind in KINDS],
+        }
+
+    @classmethod
+    def deserialize(cls, data: dict) -> "EventScheduler | None":
+        """Resume a saved schedule; None if the data is missing or from another format."""
+        if not isinstance(data, dict) or data.get("v") != _FORMAT:
+            return None
+        try:
+            sched = cls.__new__(cls)
+            sched.seed = int(data["seed"])
+            sched._heap, sched._seq = [], 0
+            sched._block = int(data["block"])
+            sched._horizon = float(data["horizon"])
+            for at, k in data.get("events", []):
+                sched.push(at, KINDS[int(k)])
+            sched._refill()
+            return sched
+        except (KeyError, ValueError, TypeError, IndexError):
+            return None
@@ -1,8 +1,14 @@
 # procgen.py — simple vertical procgen for side props (trees/rocks/grass)
-import os, random, pygame
+# Each segment is derived from hash((seed, idx)) alone, so a culled segment
+# regenerates identically; off-screen segments are generated a few per frame
+# within PROCGEN_BUDGET_MS. Props are stored struct-of-arrays, y-sorted per
+# segment, and drawn with one Surface.blits() call.
+import os, random, time, pygame
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from pygame.math import Vector2
 import settings as S
+from world import world
 
 # ---- Config ----
 SEG_H = 512
@@ -10,6 +16,8 @@ AHEAD_SEGMENTS = 6
 BEHIND_SEGMENTS = 3
 LEFT_MARGIN = 40
 RIGHT_MARGIN = 40
+SPARE_LAYERS = 4   # released segment layers kept for reuse instead of reallocating
+GEN_BUDGET_MS = float(getattr(S, "PROCGEN_BUDGET_MS", 2.0))  # off-screen generation per frame
 
 # Road geometry (use settings if present)
 ROAD_W = getattr(S, "ROAD_W", 1200)
@@ -29,6 +37,10 @@ FALLBACK_COLORS = {
     "rock":  (110, 110, 110),
     "grass": (46, 122, 60),
 }
+FALLBACK_CANVAS = (24, 36)   # vector fallbacks are pre-drawn centred at FALLBACK_ANCHOR
+FALLBACK_ANCHOR = (12, 20)
+
+KINDS = ("tree", "rock", "grass")   # kind id = index
 
 SPAWN_COUNTS = {
     "tree":  (1, 3),
@@ -41,26 +53,61 @@ SCALE_RANGES = {
     "rock":  (0.7, 1.1),
     "grass": (0.6, 1.25),
 }
-
-@dataclass
-class Prop:
-    kind: str
-    pos: Vector2
-    sprite: pygame.Surface | None = None
-    fallback_size: tuple[int, int] = (28, 28)
+SCALE_BUCKETS = 5   # evenly spaced scales per kind, pre-scaled once and shared by every prop
 
 @dataclass
 class Segment:
+    """Props as parallel arrays sorted by y; sprite = index into ProcGen.sprites."""
     idx: int
     y0: int
     y1: int
-    props: list[Prop] = field(default_factory=list)
+    kind: array = field(default_factory=lambda: array("B"))
+    x: array = field(default_factory=lambda: array("i"))
+    y: array = field(default_factory=lambda: array("i"))
+    sprite: array = field(default_factory=lambda: array("H"))
+    hw: array = field(default_factory=lambda: array("H"))   # sprite anchor (half-extents)
+    hh: array = field(default_factory=lambda: array("H"))
+    top: int = 0       # world y range the props paint over
+    bottom: int = 0
+    reach: int = 0     # max distance from a prop's y to its painted edge (cull margin)
+    # Opaque WORLD_W x SEG_H bake of the road slice + every prop touching it
+    layer: pygame.Surface | None = field(default=None, repr=False)
+
+    def __len__(self):
+        return len(self.y)
+
+
+def _fallback_sprite(kind: str) -> pygame.Surface:
+    """The vector stand-in for a missing prop image, drawn once."""
+    surf = pygame.Surface(FALLBACK_CANVAS, pygame.SRCALPHA)
+    sx, sy = FALLBACK_ANCHOR
+    col = FALLBACK_COLORS.get(kind, (200, 200, 200))
+    if kind == "tree":
+        pygame.draw.polygon(surf, col, [(sx, sy-18), (sx-10, sy+14), (sx+10, sy+14)])
+    elif kind == "rock":
+        pygame.draw.circle(surf, col, (sx, sy), 10)
+    else:
+        pygame.draw.line(surf, col, (sx, sy), (sx, sy-10), 2)
+    return surf
 
 class ProcGen:
     def __init__(self, rng_seed: int = 1337):
-        self.rng = random.Random(rng_seed)
+        self.seed = rng_seed
         self.segments: dict[int, Segment] = {}
         self.prop_images = self._load_prop_images()
+        self.prop_variants = self._build_variants()
+        # flat sprite table the segments index into: (surface, half_w, half_h)
+        self.sprites: list[tuple[pygame.Surface, int, int]] = []
+        self.variant_ids: dict[str, list[int]] = {}
+        for kind in KINDS:
+            ids = self.variant_ids[kind] = []
+            for surf in self.prop_variants.get(kind) or ():
+                ids.append(len(self.sprites))
+                self.sprites.append((surf, surf.get_width() // 2, surf.get_height() // 2))
+            if not ids:
+                ids.append(len(self.sprites))
+                self.sprites.append((_fallback_sprite(kind), *FALLBACK_ANCHOR))
+        self._spare_layers: list[pygame.Surface] = []
 
     def _load_prop_images(self):
         images = {}
@@ -77,17 +124,41 @@ class ProcGen:
             print("ℹ️ procgen: no prop images found (using vector fallbacks).")
         return images
 
-    def _random_scaled(self, kind: str):
-        base = self.prop_images.get(kind)
+    def _build_variants(self) -> dict[str, list[pygame.Surface]]:
+        """kind -> SCALE_BUCKETS smoothscaled copies of its image, smallest first."""
+        variants = {}
+        for kind, base in self.prop_images.items():
+            lo, hi = SCALE_RANGES[kind]
+            sizes = []
+            for i in range(SCALE_BUCKETS):
+                scale = lo + (hi - lo) * i / max(1, SCALE_BUCKETS - 1)
+                sizes.append((max(1, int(base.get_width() * scale)),
+                              max(1, int(base.get_height() * scale))))
+            variants[kind] = [pygame.transform.smoothscale(base, size) for size in sizes]
+        return variants
+
+    def reseed(self, seed: int):
+        """Switch to another run's world; drops every generated segment."""
+        if seed == self.seed:
+            return
+        self.seed = seed
+        for seg in self.segments.values():
+            self._release(seg)
+        self.segments.clear()
+
+    def _segment_rng(self, idx: int) -> random.Random:
+        return random.Random(hash((self.seed, idx)))
+
+    def _random_scaled(self, rng: random.Random, kind: str) -> int:
+        """Sprite id of the shared variant nearest to a random scale in the kind's range."""
         lo, hi = SCALE_RANGES[kind]
-        scale = self.rng.uniform(lo, hi)
-        if base is not None:
-            w = max(1, int(base.get_width() * scale))
-            h = max(1, int(base.get_height() * scale))
-            return pygame.transform.smoothscale(base, (w, h))
-        return None
-
-    def _spawn_props_for_side(self, y0: int, side: str):
+        scale = rng.uniform(lo, hi)
+        ids = self.variant_ids[kind]
+        i = round((scale - lo) / (hi - lo) * (len(ids) - 1)) if hi > lo else 0
+        return ids[max(0, min(len(ids) - 1, i))]
+
+    def _spawn_props_for_side(self, rng: random.Random, y0: int, side: str):
+        """[(y, x, kind_id, sprite_id), ...] in rng order."""
         props = []
         if side == "left":
             x_min = LEFT_MARGIN
@@ -99,14 +170,13 @@ class ProcGen:
         if x_max <= x_min:
             return props
 
-        for kind in ("tree", "rock", "grass"):
+        for kind_id, kind in enumerate(KINDS):
             cmin, cmax = SPAWN_COUNTS[kind]
-            count = self.rng.randint(cmin, cmax)
+            count = rng.randint(cmin, cmax)
             for _ in range(count):
-                x = self.rng.randint(x_min, x_max)
-                y = self.rng.randint(y0 + 10, y0 + SEG_H - 10)
-                sprite = self._random_scaled(kind)
-                props.append(Prop(kind=kind, pos=Vector2(x, y), sprite=sprite))
+                x = rng.randint(x_min, x_max)
+                y = rng.randint(y0 + 10, y0 + SEG_H - 10)
+                props.append((y, x, kind_id, self._random_scaled(rng, kind)))
         return props
 
     def _generate_segment(self, idx: int):
@@ -114,39 +184,100 @@ class ProcGen:
             return
         y0 = idx * SEG_H
         seg = Segment(idx=idx, y0=y0, y1=y0 + SEG_H)
-        seg.props.extend(self._spawn_props_for_side(y0, "left"))
-        seg.props.extend(self._spawn_props_for_side(y0, "right"))
+        rng = self._segment_rng(idx)
+        props = self._spawn_props_for_side(rng, y0, "left") + self._spawn_props_for_side(rng, y0, "right")
+        props.sort(key=lambda p: p[0])   # stable: equal y keeps rng order
+        seg.top, seg.bottom = seg.y0, seg.y1
+        for y, x, kind_id, sid in props:
+            surf, hw, hh = self.sprites[sid]
+            seg.kind.append(kind_id); seg.x.append(x); seg.y.append(y)
+            seg.sprite.append(sid); seg.hw.append(hw); seg.hh.append(hh)
+            seg.top = min(seg.top, y - hh)
+            seg.bottom = max(seg.bottom, y - hh + surf.get_height())
+            seg.reach = max(seg.reach, hh, surf.get_height() - hh)
         self.segments[idx] = seg
+        self._bake(seg)
+
+        # props hanging over a seam also belong in the neighbour's (already baked) layer;
+        # re-bake just the overhang band so z-order stays the same as a fresh bake
+        above, below = self.segments.get(idx - 1), self.segments.get(idx + 1)
+        if above is not None and above.layer is not None and seg.top < seg.y0:
+            self._bake(above, pygame.Rect(0, seg.top - above.y0, S.WORLD_W, seg.y0 - seg.top))
+        if below is not None and below.layer is not None and seg.bottom > seg.y1:
+            self._bake(below, pygame.Rect(0, 0, S.WORLD_W, seg.bottom - seg.y1))
+
+    # ---------- Batched prop drawing ----------
+    def _blit_props(self, surface: pygame.Surface, segs, off_x: int, off_y: int, y_min: int, y_max: int):
+        """Props of `segs` (in order) painting into world rows [y_min, y_max), in one blits() call."""
+        sprites = self.sprites
+        batch = []
+        for seg in segs:
+            if seg is None or not len(seg):
+                continue
+            lo = bisect_left(seg.y, y_min - seg.reach)
+            hi = bisect_right(seg.y, y_max + seg.reach)
+            batch += [(sprites[sid][0], (x - hw - off_x, y - hh - off_y))
+                      for sid, x, y, hw, hh in zip(seg.sprite[lo:hi], seg.x[lo:hi], seg.y[lo:hi],
+                                                   seg.hw[lo:hi], seg.hh[lo:hi])]
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+    # ---------- Baked segment layers ----------
+    def _bake(self, seg: Segment, band: pygame.Rect | None = None):
+        """Road slice + props of this and both neighbouring segments (in index order), clipped to seg
+        (or to `band`, in layer coords)."""
+        layer = seg.layer
+        if layer is None:
+            layer = self._spare_layers.pop() if self._spare_layers else None
+            if layer is None or layer.get_size() != (S.WORLD_W, SEG_H):
+                display = pygame.display.get_surface()
+                layer = (pygame.Surface((S.WORLD_W, SEG_H), 0, display) if display is not None
+                         else pygame.Surface((S.WORLD_W, SEG_H)))
+            seg.layer = layer
+            band = None
+        y0, y1 = (seg.y0, seg.y1) if band is None else (seg.y0 + band.top, seg.y0 + band.bottom)
+        layer.set_clip(band)
+        world.draw_road_strip(layer, seg.y0)
+        self._blit_props(layer, [self.segments.get(i) for i in (seg.idx - 1, seg.idx, seg.idx + 1)],
+                         0, seg.y0, y0, y1)
+        layer.set_clip(None)
+
+    def _release(self, seg: Segment):
+        if seg.layer is not None:
+            if len(self._spare_layers) < SPARE_LAYERS:
+                self._spare_layers.append(seg.layer)
+            seg.layer = None
 
     def update_needed(self, cam_y: float, screen_h: int):
+        t0 = time.perf_counter()
         top_idx = int(cam_y // SEG_H)
+        bottom_idx = int((cam_y + screen_h - 1) // SEG_H)
         needed = range(top_idx - BEHIND_SEGMENTS, top_idx + AHEAD_SEGMENTS + 1)
-        for idx in needed:
+
+        # deterministic, so anything outside the window is simply dropped (its layer is reused)
+        for idx in [i for i in self.segments if i not in needed]:
+            self._release(self.segments.pop(idx))
+
+        # on screen: must exist this frame
+        for idx in range(top_idx, bottom_idx + 1):
+            self._generate_segment(idx)
+
+        # the rest of the window: nearest first (walking direction on ties), within budget
+        pending = sorted((i for i in needed if i not in self.segments),
+                         key=lambda i: (min(abs(i - top_idx), abs(i - bottom_idx)), i))
+        for idx in pending:
+            if (time.perf_counter() - t0) * 1000.0 >= GEN_BUDGET_MS:
+                break
             self._generate_segment(idx)
-        for idx in list(self.segments.keys()):
-            if idx < top_idx - BEHIND_SEGMENTS - 4 or idx > top_idx + AHEAD_SEGMENTS + 8:
-                del self.segments[idx]
-
-    def draw_props(self, screen: pygame.Surface, cam_x: float, cam_y: float, screen_w: int, screen_h: int):
-        y_min = cam_y - 64
-        y_max = cam_y + screen_h + 64
-        i0 = int(y_min // SEG_H) - 1
-        i1 = int(y_max // SEG_H) + 1
-        for idx in range(i0, i1 + 1):
+
+    def draw_world(self, screen: pygame.Surface, cam_x: float, cam_y: float, screen_w: int, screen_h: int):
+        """Road + props: one blit per visible baked segment."""
+        cx, cy = int(cam_x), int(cam_y)
+        for idx in range(cy // SEG_H, (cy + screen_h - 1) // SEG_H + 1):
             seg = self.segments.get(idx)
-            if not seg: 
-                continue
-            for p in seg.props:
-                sx = int(p.pos.x - cam_x)
-                sy = int(p.pos.y - cam_y)
-                if 0 - 64 <= sx <= screen_w + 64 and 0 - 64 <= sy <= screen_h + 64:
-                    if p.sprite is not None:
-                        screen.blit(p.sprite, (sx - p.sprite.get_width()//2, sy - p.sprite.get_height()//2))
-                    else:
-                        col = FALLBACK_COLORS.get(p.kind, (200, 200, 200))
-                        if p.kind == "tree":
-                            pygame.draw.polygon(screen, col, [(sx, sy-18), (sx-10, sy+14), (sx+10, sy+14)])
-                        elif p.kind == "rock":
-                            pygame.draw.circle(screen, col, (sx, sy), 10)
-                        else:
-                            pygame.draw.line(screen, col, (sx, sy), (sx, sy-10), 2)
+            if seg is None:
+                self._generate_segment(idx)
+                seg = self.segments[idx]
+            elif seg.layer is None:
+                self._bake(seg)
+            screen.blit(seg.layer, (-cx, seg.y0 - cy))
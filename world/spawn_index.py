@@ -0,0 +1,113 @@
+# ============================================================
+#  world/spawn_index.py — y-sorted list for overworld spawns
+#  - SpawnIndex is a plain list of spawn records (Rival /
+#    VesselShadow, world/spawn_records.py) kept sorted by .y, with
+#    a parallel key list for bisect
+#  - Used for both gs.rivals_on_map and gs.vessels_on_map, so
+#    iteration / len / clear / append elsewhere keep working
+#  - Every list mutator keeps the order (sort() re-sorts by y,
+#    reverse() / custom sort keys raise TypeError)
+#  - Spawns don't move once placed; if you do move one, call
+#    resort()
+# ============================================================
+
+from bisect import bisect_left, bisect_right
+
+
+class SpawnIndex(list):
+    """Spawn records ordered by y (top of the world first)."""
+
+    def __init__(self, items=()):
+        super().__init__()
+        self._ys: list[float] = []
+        self.extend(items)
+
+    # ---------- Mutation (keeps both lists in step) ----------
+    def append(self, entry):
+        y = entry.y
+        i = bisect_right(self._ys, y)
+        self._ys.insert(i, y)
+        super().insert(i, entry)
+
+    def insert(self, _index, entry):
+        self.append(entry)   # position is decided by y
+
+    def extend(self, items):
+        for entry in items:
+            self.append(entry)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __add__(self, items):
+        return SpawnIndex([*self, *items])
+
+    def __radd__(self, items):
+        return SpawnIndex([*items, *self])
+
+    def __mul__(self, n: int):
+        return SpawnIndex(list(self) * n)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, n: int):
+        items = list(self)
+        self.clear()
+        self.extend(items * n)
+        return self
+
+    def pop(self, index: int = -1):
+        self._ys.pop(index)
+        return super().pop(index)
+
+    def remove(self, entry):
+        for i in self.span(entry.y, entry.y):
+            if self[i] is entry:
+                self.pop(i)
+                return
+        raise ValueError("entry not in SpawnIndex")
+
+    def clear(self):
+        self._ys.clear()
+        super().clear()
+
+    def __delitem__(self, key):
+        del self._ys[key]
+        super().__delitem__(key)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.resort()
+
+    def sort(self, *, key=None, reverse=False):
+        """Order is always by y; any other key / reverse would break span()."""
+        if key is not None or reverse:
+            raise TypeError("SpawnIndex is always sorted by y; use resort()")
+        self.resort()
+
+    def reverse(self):
+        raise TypeError("SpawnIndex is always sorted by y")
+
+    def resort(self):
+        """Re-sort after positions were changed in place."""
+        super().sort(key=lambda e: e.y)
+        self._ys[:] = [e.y for e in self]
+
+    # ---------- Queries ----------
+    def span(self, y_lo: float, y_hi: float) -> range:
+        """Indices of entries with y_lo <= y <= y_hi."""
+        return range(bisect_left(self._ys, y_lo), bisect_right(self._ys, y_hi))
+
+    def any_within(self, y: float, dist: float) -> bool:
+        """True if some entry has |entry y - y| < dist."""
+        i = bisect_right(self._ys, y - dist)
+        return i < len(self._ys) and self._ys[i] < y + dist
+
+    def trim_below(self, cutoff: float) -> int:
+        """Drop every entry with y >= cutoff (the tail); returns how many went."""
+        i = bisect_left(self._ys, cutoff)
+        n = len(self._ys) - i
+        if n:
+            del self[i:]
+        return n
@@ -0,0 +1,57 @@
+# ============================================================
+#  world/spawn_records.py — slotted records for overworld spawns
+#  - Rival: a visible summoner standing in a lane
+#  - VesselShadow: a mist shadow hiding a not-yet-rolled vessel
+#  - serialize() -> JSON-safe dict (never surfaces);
+#    deserialize(data, ...) -> record, or None if it can't be
+#    rebuilt (e.g. a rival whose sprite is gone)
+#  - Save format is unchanged: {"name", "side", "x", "y"}
+# ============================================================
+
+
+class Rival:
+    __slots__ = ("name", "sprite", "x", "y", "side")
+
+    def __init__(self, name: str, sprite, x: float, y: float, side: str = "left"):
+        self.name = name
+        self.sprite = sprite      # pygame.Surface
+        self.x = float(x)
+        self.y = float(y)
+        self.side = side
+
+    def __repr__(self):
+        return f"Rival({self.name!r}, x={self.x:.0f}, y={self.y:.0f}, side={self.side!r})"
+
+    def serialize(self) -> dict:
+        return {"name": self.name, "side": self.side, "x": self.x, "y": self.y}
+
+    @classmethod
+    def deserialize(cls, data: dict, sprites: dict | None, default_x: float, default_y: float):
+        """Rebuild from save data; sprites maps name -> Surface. None if the sprite is missing."""
+        name = data.get("name", "")
+        sprite = sprites.get(name) if sprites else None
+        if sprite is None:
+            return None
+        return cls(name, sprite,
+                   float(data.get("x", default_x)), float(data.get("y", default_y)),
+                   data.get("side", "left"))
+
+
+class VesselShadow:
+    __slots__ = ("x", "y", "side")
+
+    def __init__(self, x: float, y: float, side: str = "left"):
+        self.x = float(x)
+        self.y = float(y)
+        self.side = side
+
+    def __repr__(self):
+        return f"VesselShadow(x={self.x:.0f}, y={self.y:.0f}, side={self.side!r})"
+
+    def serialize(self) -> dict:
+        return {"side": self.side, "x": self.x, "y": self.y}
+
+    @classmethod
+    def deserialize(cls, data: dict, default_x: float, default_y: float):
+        return cls(float(data.get("x", default_x)), float(data.get("y", default_y)),
+                   data.get("side", "left"))
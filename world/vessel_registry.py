@@ -0,0 +1,73 @@
+# ============================================================
+#  world/vessel_registry.py — lazy vessel sprite lookup
+#  - Startup only globs NAMES (no decode)
+#  - sprite(name) decodes on first reveal, scaled to PLAYER_SIZE
+#  - Small LRU of revealed sprites (VESSEL_SPRITE_CACHE)
+#  - Prefers the mmapped asset pack; falls back to the PNG
+# ============================================================
+
+import os
+import glob
+import random
+from collections import OrderedDict
+import pygame
+import settings as S
+
+
+class VesselRegistry:
+    """Names + source paths for one vessel group; sprites are decoded on demand."""
+
+    def __init__(self, group: str, folders, pattern: str, size=None, capacity: int | None = None):
+        self.group = group
+        self.size = tuple(size or S.PLAYER_SIZE)
+        self.capacity = max(1, int(capacity or getattr(S, "VESSEL_SPRITE_CACHE", 16)))
+        self._paths: dict[str, str] = {}
+        for folder in folders:
+            for path in glob.glob(os.path.join(folder, pattern)):
+                self._paths.setdefault(os.path.splitext(os.path.basename(path))[0], path)
+        self.names: list[str] = list(self._paths)
+        self._sprites: "OrderedDict[str, pygame.Surface]" = OrderedDict()
+
+    def __len__(self):
+        return len(self.names)
+
+    def __bool__(self):
+        return bool(self.names)
+
+    def path(self, name: str) -> str | None:
+        return self._paths.get(name)
+
+    def _decode(self, name: str) -> pygame.Surface | None:
+        if getattr(S, "ASSET_PACK_ENABLED", True):
+            from world import asset_pack
+            surf = asset_pack.surface(self.group, name)
+            if surf is not None and surf.get_size() == self.size:
+                return surf
+        path = self._paths.get(name)
+        if not path:
+            return None
+        try:
+            surf = pygame.image.load(path).convert_alpha()
+            return pygame.transform.scale(surf, self.size)
+        except Exception as e:
+            print(f"⚠️ Failed to load vessel sprite {path}: {e}")
+            return None
+
+    def sprite(self, name: str) -> pygame.Surface | None:
+        """Scaled sprite for `name`, decoding it on first use."""
+        surf = self._sprites.get(name)
+        if surf is not None:
+            self._sprites.move_to_end(name)
+            return surf
+        surf = self._decode(name)
+        if surf is None:
+            return None
+        self._sprites[name] = surf
+        while len(self._sprites) > self.capacity:
+            self._sprites.popitem(last=False)
+        return surf
+
+    def choice(self, rng=random) -> tuple[str, pygame.Surface | None]:
+        """Random (name, sprite); only the picked vessel is decoded."""
+        name = rng.choice(self.names)
+        return name, self.sprite(name)
@@ -5,6 +5,7 @@ import os
 import pygame
 from pygame.math import Vector2
 import settings as S
+from systems import fonts
 from screens import party_manager
 
 # ====================================================
@@ -72,6 +73,7 @@ ROAD_IMG        = None
 ROAD_W_NATIVE   = 0
 ROAD_H_NATIVE   = 0
 ROAD_ANCHOR_X   = 0  # x position in world where we draw the road (centered by default)
+_ROAD_FLAT      = None  # (ROAD_IMG, opaque copy pre-blended over BG_COLOR) for strip baking
 
 
 def load_road():
@@ -171,6 +173,37 @@ def draw_repeating_road(surface: pygame.Surface, cam_x_or_y: float, maybe_cam_y:
         y_off = 0
 
 
+def draw_road_strip(surface: pygame.Surface, world_y: int):
+    """
+    Paint world rows [world_y, world_y + surface height) of the road into `surface`,
+    in world x (surface x 0 = world x 0). Used to bake procgen segment layers.
+    """
+    if ROAD_IMG is None:
+        draw_grid_background(surface, 0, world_y)
+        return
+
+    global _ROAD_FLAT
+    if _ROAD_FLAT is None or _ROAD_FLAT[0] is not ROAD_IMG:
+        flat = pygame.Surface(ROAD_IMG.get_size())
+        if pygame.display.get_surface() is not None:
+            flat = flat.convert()
+        flat.fill(S.BG_COLOR)
+        flat.blit(ROAD_IMG, (0, 0))
+        _ROAD_FLAT = (ROAD_IMG, flat)
+    flat = _ROAD_FLAT[1]
+
+    w, h = surface.get_size()
+    if ROAD_ANCHOR_X > 0 or ROAD_ANCHOR_X + ROAD_W_NATIVE < w:
+        surface.fill(S.BG_COLOR)
+    y_off = int(world_y) % ROAD_H_NATIVE
+    y = 0
+    while y < h:
+        part = min(ROAD_H_NATIVE - y_off, h - y)
+        surface.blit(flat, (ROAD_ANCHOR_X, y), pygame.Rect(0, y_off, ROAD_W_NATIVE, part))
+        y += part
+        y_off = 0
+
+
 # ====================================================
 # ================= WORLD LIFECYCLE ==================
 # ====================================================
@@ -240,7 +273,7 @@ def draw(screen: pygame.Surface, gs, dt, **_):
     pygame.draw.rect(screen, (40, 30, 18), (px - pw//2, py - ph//2, pw, ph), 2, border_radius=6)
 
     # HUD (optional simple debug)
-    dbg = pygame.font.SysFont("consolas", 16).render(f"Pos {int(gs.player_pos.x)},{int(gs.player_pos.y)}", True, (240, 230, 210))
+    dbg = fonts.get("consolas", 16).render(f"Pos {int(gs.player_pos.x)},{int(gs.player_pos.y)}", True, (240, 230, 210))
     screen.blit(dbg, (8, 8))
 
     # --- overlay: Party Manager (drawn last; modal) ---